@@ -10,13 +10,20 @@ if hasattr(sys.stderr, "reconfigure"):
     sys.stderr.reconfigure(encoding="utf-8")
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from datetime import timedelta
+
 from prayer_schedule_V10_DESKTOP_FIXED import (
-    ELDERS, ELDER_FAMILIES, get_master_pools, assign_families_for_week_v10
+    ELDERS, ELDER_FAMILIES, REFERENCE_MONDAY
 )
+from prayer_schedule.algorithm import get_pool_index, iter_schedule
 from prayer_schedule.config import POOL_COUNT, ROTATION_WEEKS
+from prayer_schedule.coverage import CoverageMatrix
+from prayer_schedule.log import configure_logging
+
+configure_logging()
 
-# Get master pools
-pools = get_master_pools()
+# Index the master pools (family -> pool) for O(1) lookups
+pool_index = get_pool_index()
 
 print("ELDER FAMILY DISTRIBUTION ACROSS POOLS")
 print("="*80)
@@ -26,11 +33,7 @@ for elder in ELDERS:
     elder_family = ELDER_FAMILIES[elder]
 
     # Find which pool contains this family
-    found_in_pool = None
-    for pool_idx, pool in enumerate(pools):
-        if elder_family in pool:
-            found_in_pool = pool_idx
-            break
+    found_in_pool = pool_index.pool_for(elder_family)
 
     print(f"\n{elder}:")
     print(f"  Family: {elder_family}")
@@ -60,11 +63,7 @@ for elder_idx, elder in enumerate(ELDERS):
     elder_family = ELDER_FAMILIES[elder]
 
     # Find which pool contains this family
-    family_pool = None
-    for pool_idx, pool in enumerate(pools):
-        if elder_family in pool:
-            family_pool = pool_idx
-            break
+    family_pool = pool_index.pool_for(elder_family)
 
     # Find which week this elder gets that pool
     problem_weeks = []
@@ -86,8 +85,8 @@ for elder_idx, elder in enumerate(ELDERS):
 print("\n\nWEEKLY COVERAGE GAPS:")
 print("="*80)
 
-for week in range(46, 54):  # One complete cycle
-    assignments = assign_families_for_week_v10(week)
+# Continuous weeks 46..53 (one complete cycle plus the wrap-around week).
+for _monday, week, assignments in iter_schedule(REFERENCE_MONDAY + timedelta(weeks=45), 8):
 
     # Collect all assigned families
     all_assigned = set()
@@ -105,3 +104,17 @@ for week in range(46, 54):  # One complete cycle
         print(f"Week {week}: MISSING {len(missing)}: {', '.join(missing)}")
     else:
         print(f"Week {week}: ✅ All families covered")
+
+print("\n\nTEN-YEAR COVERAGE (520 weeks from week 1):")
+print("="*80)
+
+matrix = CoverageMatrix.build(520)
+uncovered = matrix.uncovered_weeks()
+if uncovered:
+    print(f"❌ {len(uncovered)} week(s) leave a family uncovered, first: {uncovered[:5]}")
+else:
+    print(f"✅ All {len(matrix.families)} families covered in every one of {matrix.weeks} weeks")
+for elder in ELDERS:
+    load = matrix.elder_load(elder, 1, 52)
+    own = matrix.times_prayed(ELDER_FAMILIES[elder], elder)
+    print(f"  {elder:<20} year-1 load {sum(load):>5} ({min(load)}-{max(load)}/week), own family {own}x")
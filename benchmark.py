@@ -0,0 +1,279 @@
+"""
+Timing benchmarks for the prayer schedule package.
+
+Uses synthetic directories and rosters so the numbers describe how each
+component scales, not just the live 161-family / 7-elder configuration.
+
+Usage:
+    python benchmark.py                 # run every benchmark
+    python benchmark.py reassignment    # run only the named benchmark(s)
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from prayer_schedule.algorithm import RotationTable
+from prayer_schedule.bitsets import BitsetTable, check_invariants
+from prayer_schedule.coverage import CoverageMatrix
+from prayer_schedule.email_service import _build_combined_email_html
+from prayer_schedule.file_io import _atomic_write
+from prayer_schedule.incremental import ChangeDelta, reverify, verify_full
+from prayer_schedule.log import configure_logging
+from prayer_schedule.output import (
+    DAYS,
+    generate_html_schedule,
+    generate_text_schedule,
+    iter_html_schedule,
+)
+from prayer_schedule.pools import build_pools, rebalance_pools
+from prayer_schedule.reassignment import solve_reassignment_map
+
+
+def synthetic_directory(family_count):
+    """Return ``family_count`` sorted, unique ``"Last, First"`` strings."""
+    return [f"Family{i:06d}, Member" for i in range(family_count)]
+
+
+def synthetic_roster(elder_count, family_count, seed=0):
+    """Return ``(pools, elders, elder_families)`` for a synthetic congregation."""
+    rng = random.Random(seed)
+    families = synthetic_directory(family_count)
+    pools = build_pools(families, elder_count)
+    elders = [f"Elder {i:02d}" for i in range(elder_count)]
+    elder_families = dict(zip(elders, rng.sample(families, elder_count)))
+    return pools, elders, elder_families
+
+
+def best_of(func, repeat=3):
+    """Return the fastest wall-clock time of ``repeat`` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_reassignment():
+    print("REASSIGNMENT SOLVER: solve time vs roster size")
+    print(f"{'elders':>8} {'families':>10} {'conflicts':>10} {'solve ms':>10}")
+    print("-" * 42)
+    for elder_count in (7, 14, 28, 56, 112):
+        for family_count in (161, 5_000, 50_000):
+            if family_count < elder_count * 3:
+                continue
+            pools, elders, elder_families = synthetic_roster(elder_count, family_count)
+            lo = family_count // elder_count - 1
+            hi = -(-family_count // elder_count) + 1
+            elapsed = best_of(
+                lambda: solve_reassignment_map(pools, elders, elder_families, lo, hi)
+            )
+            conflicts = sum(
+                len(m) for m in solve_reassignment_map(pools, elders, elder_families, lo, hi).values()
+            )
+            print(f"{elder_count:>8} {family_count:>10} {conflicts:>10} {elapsed * 1000:>10.2f}")
+
+
+def bench_pools():
+    print("POOL BUILDER: build time vs directory size")
+    print(f"{'families':>10} {'pools':>6} {'build ms':>10}")
+    print("-" * 28)
+    for family_count in (161, 10_000, 100_000, 500_000):
+        families = synthetic_directory(family_count)
+        for pool_count in (7, 50):
+            elapsed = best_of(lambda: build_pools(families, pool_count))
+            print(f"{family_count:>10} {pool_count:>6} {elapsed * 1000:>10.2f}")
+
+
+def bench_coverage():
+    print("COVERAGE MATRIX: build and query time vs horizon and roster size")
+    print(f"{'elders':>8} {'families':>10} {'weeks':>6} {'build ms':>10} {'queries ms':>11}")
+    print("-" * 49)
+    for elder_count, family_count in ((7, 161), (20, 5_000), (50, 20_000)):
+        pools, elders, elder_families = synthetic_roster(elder_count, family_count)
+        lo = family_count // elder_count - 1
+        hi = -(-family_count // elder_count) + 1
+        solved = solve_reassignment_map(pools, elders, elder_families, lo, hi)
+        table = RotationTable.build(pools, elders, elder_families, solved)
+        for weeks in (52, 520):
+            build = best_of(lambda: CoverageMatrix.build(weeks, table=table))
+            matrix = CoverageMatrix.build(weeks, table=table)
+
+            def queries():
+                for family in matrix.families[:100]:
+                    matrix.times_prayed(family, elders[0])
+                    matrix.gaps(family, elders[0])
+                for elder in elders:
+                    sum(matrix.elder_load(elder))
+
+            elapsed = best_of(queries)
+            print(
+                f"{elder_count:>8} {family_count:>10} {weeks:>6} "
+                f"{build * 1000:>10.2f} {elapsed * 1000:>11.2f}"
+            )
+
+
+def bench_bitsets():
+    print("INVARIANT CHECKS: per-week family-ID sets vs bitsets over 1,000 weeks")
+    print(f"{'elders':>8} {'families':>10} {'sets ms':>10} {'masks ms':>10} {'encode ms':>10} {'check ms':>10}")
+    print("-" * 63)
+    weeks = 1_000
+    for elder_count, family_count in ((7, 161), (20, 10_000), (20, 100_000)):
+        pools, elders, elder_families = synthetic_roster(elder_count, family_count)
+        lo = family_count // elder_count - 1
+        hi = -(-family_count // elder_count) + 1
+        solved = solve_reassignment_map(pools, elders, elder_families, lo, hi)
+        table = RotationTable.build(pools, elders, elder_families, solved)
+
+        def with_sets():
+            previous = None
+            for week in range(1, weeks + 1):
+                current = [set(ids) for ids in table.encoded_for_week(week)]
+                seen = set()
+                for ids in current:
+                    seen |= ids
+                if previous is not None:
+                    for before, after in zip(previous, current):
+                        before & after
+                previous = current
+
+        sets = best_of(with_sets, repeat=1)
+        encode = best_of(lambda: BitsetTable.from_table(table))
+        bitsets = BitsetTable.from_table(table)
+
+        def with_masks():
+            # The same week-by-week walk as with_sets, on precomputed masks.
+            previous = None
+            for week in range(1, weeks + 1):
+                current = bitsets.masks_for_week(week)
+                seen = 0
+                for mask in current:
+                    seen |= mask
+                if previous is not None:
+                    for before, after in zip(previous, current):
+                        (before & after).bit_count()
+                previous = current
+
+        masks = best_of(with_masks)
+        checks = best_of(
+            lambda: check_invariants(
+                table, elder_families, None, lo, hi, weeks=weeks, bitsets=bitsets
+            )
+        )
+        print(
+            f"{elder_count:>8} {family_count:>10} {sets * 1000:>10.2f} {masks * 1000:>10.2f} "
+            f"{encode * 1000:>10.2f} {checks * 1000:>10.2f}"
+        )
+
+
+def bench_reverify():
+    print("RE-VERIFICATION: full check vs delta-scoped check after adding one family")
+    print(f"{'elders':>8} {'families':>10} {'full ms':>10} {'delta ms':>10} {'checks':>14}")
+    print("-" * 56)
+    for elder_count, family_count in ((7, 161), (20, 5_000), (50, 20_000), (100, 50_000)):
+        pools, elders, elder_families = synthetic_roster(elder_count, family_count)
+        lo = family_count // elder_count - 1
+        hi = -(-family_count // elder_count) + 2
+        solved = solve_reassignment_map(pools, elders, elder_families, lo, hi)
+        table = RotationTable.build(pools, elders, elder_families, solved)
+        directory = [family for pool in pools for family in pool]
+        previous = verify_full(table, elder_families, solved, directory, lo, hi)
+
+        edited = directory + ["Zz New, Member"]
+        new_pools, pool_delta = rebalance_pools(pools, edited)
+        new_table = RotationTable.build(new_pools, elders, elder_families, solved)
+        full = best_of(
+            lambda: verify_full(new_table, elder_families, solved, edited, lo, hi)
+        )
+        delta = best_of(
+            lambda: reverify(
+                previous, new_table, ChangeDelta(pools=pool_delta),
+                elder_families, solved, edited,
+            )
+        )
+        checked = reverify(
+            previous, new_table, ChangeDelta(pools=pool_delta), elder_families, solved, edited
+        ).checked
+        print(
+            f"{elder_count:>8} {family_count:>10} {full * 1000:>10.2f} "
+            f"{delta * 1000:>10.2f} {checked:>6}/{previous.checked:<7}"
+        )
+
+
+def bench_render():
+    print("RENDERING: weekly HTML, text and Monday email for one elder per day")
+    print(f"{'families':>10} {'html ms':>10} {'text ms':>10} {'email ms':>10} {'us/family':>10}")
+    print("-" * 54)
+    monday = datetime(2026, 1, 5)
+    for family_count in (161, 50_000):
+        families = synthetic_directory(family_count)
+        schedule = {day: [f"Elder {i}"] for i, day in enumerate(DAYS)}
+        assignments = {
+            f"Elder {i}": families[i::len(DAYS)] for i in range(len(DAYS))
+        }
+        html = best_of(lambda: generate_html_schedule(2, monday, assignments, schedule))
+        text = best_of(lambda: generate_text_schedule(2, monday, assignments, schedule))
+        email = best_of(
+            lambda: _build_combined_email_html(
+                monday, "Monday", 2, monday, schedule, assignments
+            )
+        )
+        per_family = (html + text + email) / family_count * 1e6
+        print(
+            f"{family_count:>10} {html * 1000:>10.2f} {text * 1000:>10.2f} "
+            f"{email * 1000:>10.2f} {per_family:>10.2f}"
+        )
+
+
+def bench_stream():
+    print("STREAMING: peak memory writing one weekly HTML page to disk")
+    print(f"{'families':>10} {'joined MB':>10} {'streamed MB':>12} {'joined ms':>10} {'streamed ms':>12}")
+    print("-" * 58)
+    monday = datetime(2026, 1, 5)
+    schedule = {day: ["Elder 0"] for day in DAYS}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "page.html")
+        for family_count in (50_000, 200_000):
+            assignments = {"Elder 0": synthetic_directory(family_count)}
+            row = [family_count]
+            renders = (
+                lambda: _atomic_write(path, generate_html_schedule(2, monday, assignments, schedule)),
+                lambda: _atomic_write(path, iter_html_schedule(2, monday, assignments, schedule)),
+            )
+            for write in renders:
+                tracemalloc.start()
+                write()
+                row.append(tracemalloc.get_traced_memory()[1] / 2**20)
+                tracemalloc.stop()
+            row += [best_of(write) * 1000 for write in renders]
+            print(f"{row[0]:>10} {row[1]:>10.1f} {row[2]:>12.1f} {row[3]:>10.1f} {row[4]:>12.1f}")
+
+
+BENCHMARKS = {
+    "bitsets": bench_bitsets,
+    "coverage": bench_coverage,
+    "pools": bench_pools,
+    "reassignment": bench_reassignment,
+    "render": bench_render,
+    "reverify": bench_reverify,
+    "stream": bench_stream,
+}
+
+
+if __name__ == "__main__":
+    configure_logging()
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmark(s): {unknown}. Choose from {sorted(BENCHMARKS)}.")
+        sys.exit(2)
+    for index, name in enumerate(selected):
+        if index:
+            print()
+        BENCHMARKS[name]()
@@ -10,6 +10,10 @@ Reads:
 
 Writes:
   - `index.html` (overwrites the existing redirect stub)
+  - `<file>.gz` beside every published page, text file and asset when
+    `PRAYER_SCHEDULE_GZIP_LEVEL` is non-zero (the default in CI); only
+    files changed since `precompress_manifest.json` was written are
+    recompressed
 """
 from __future__ import annotations
 
@@ -18,6 +22,10 @@ import re
 from datetime import datetime, timezone
 from html import escape
 
+from prayer_schedule.config import GZIP_LEVEL
+from prayer_schedule.file_io import precompress, published_files
+from prayer_schedule.log import configure_logging
+
 
 ARCHIVE_RE = re.compile(
     r"^Prayer_Schedule_(?P<date>\d{4}-\d{2}-\d{2})_Week(?P<week>\d+)\.txt$"
@@ -183,6 +191,7 @@ def render(entries: list[dict], current_exists: bool) -> str:
 
 
 def main() -> int:
+    configure_logging()
     base = os.path.dirname(os.path.abspath(__file__))
     archive_dir = os.path.join(base, "archive")
     current = os.path.join(base, "Prayer_Schedule_Current_Week.html")
@@ -196,6 +205,9 @@ def main() -> int:
         f.write(html)
     os.replace(tmp, out_path)
     print(f"[OK] Wrote {out_path} with {len(entries)} archive entries.")
+    if GZIP_LEVEL:
+        compressed = precompress(base, published_files(base), GZIP_LEVEL)
+        print(f"[OK] Precompressed {len(compressed)} changed file(s) at gzip level {GZIP_LEVEL}.")
     return 0
 
 
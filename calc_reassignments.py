@@ -5,19 +5,25 @@ elders. Run this whenever the roster or directory changes to regenerate
 
 Also self-checks: the script exits non-zero if the conflict set computed from
 the live directory + roster names elders that the current
-``FIXED_REASSIGNMENT_MAP`` does not have entries for (drift detection). It
-does NOT auto-suggest reassignment targets — those have to balance counts
-across the week, which is a human judgement.
+``FIXED_REASSIGNMENT_MAP`` does not have entries for (drift detection). On
+drift it prints a replacement map computed by
+``prayer_schedule.reassignment.solve_reassignment_map`` (adjacency-safe,
+count-balanced), ready to paste into ``algorithm.py``.
 """
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from prayer_schedule_V10_DESKTOP_FIXED import ELDERS, ELDER_FAMILIES, get_master_pools
-from prayer_schedule.algorithm import FIXED_REASSIGNMENT_MAP
+from prayer_schedule.algorithm import FIXED_REASSIGNMENT_MAP, get_pool_index
 from prayer_schedule.config import POOL_COUNT, ROTATION_WEEKS
+from prayer_schedule.log import configure_logging
+from prayer_schedule.reassignment import solve_reassignment_map
+
+configure_logging()
 
 pools = get_master_pools()
+pool_index = get_pool_index()
 
 print("POOL SIZES:")
 for i, pool in enumerate(pools):
@@ -38,7 +44,7 @@ for cycle_week in range(ROTATION_WEEKS):
         pool_size = len(pools[pool_idx])
         elder_family = ELDER_FAMILIES[elder]
 
-        in_pool = elder_family in pools[pool_idx]
+        in_pool = pool_index.contains(pool_idx, elder_family)
         final_count = pool_size - 1 if in_pool else pool_size
 
         status = "*" if in_pool else " "
@@ -71,7 +77,19 @@ if spurious:
     for cycle_week, elder in spurious:
         print(f"  cycle_position={cycle_week}: {elder!r}")
 
-print("\nMAP NEEDS UPDATE: review the analysis above and pick targets that")
-print("keep every elder's weekly family count within FAMILIES_PER_ELDER_MIN..MAX,")
-print("then update FIXED_REASSIGNMENT_MAP in prayer_schedule/algorithm.py.")
+print("\nMAP NEEDS UPDATE. Suggested FIXED_REASSIGNMENT_MAP (adjacency-safe, keeps")
+print("every elder's weekly family count within FAMILIES_PER_ELDER_MIN..MAX):")
+try:
+    solved = solve_reassignment_map()
+except ValueError as exc:
+    print(f"  No solution: {exc}")
+    print("  Adjust the directory/roster or widen FAMILIES_PER_ELDER_MIN..MAX.")
+else:
+    print("FIXED_REASSIGNMENT_MAP: dict[int, dict[str, str]] = {")
+    for cycle_week, mapping in solved.items():
+        entries = ", ".join(f"{owner!r}: {target!r}" for owner, target in mapping.items())
+        print(f"    {cycle_week}: {{{entries}}},")
+    print("}")
+print("\nReview the suggestion, then update FIXED_REASSIGNMENT_MAP in")
+print("prayer_schedule/algorithm.py.")
 sys.exit(1)
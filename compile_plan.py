@@ -0,0 +1,24 @@
+"""
+Compile and verify the schedule plan used by the daily run.
+
+Validates the elder roster and reassignment map, verifies two full rotation
+cycles, and writes ``prayer_schedule_plan.json`` next to the schedule files.
+The daily run reuses the plan until the directory, roster or map changes;
+run this after editing any of them to pay the verification cost up front.
+
+Usage:
+    python compile_plan.py
+"""
+import os
+import sys
+
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(encoding="utf-8")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from prayer_schedule.log import configure_logging
+from prayer_schedule.plan import compile_plan
+
+if __name__ == "__main__":
+    configure_logging()
+    sys.exit(0 if compile_plan() is not None else 1)
@@ -23,9 +23,12 @@ if hasattr(sys.stderr, "reconfigure"):
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from prayer_schedule_V10_DESKTOP_FIXED import (
     ELDERS, ELDER_FAMILIES, parse_directory,
-    assign_families_for_week_v10, get_master_pools,
+    get_master_pools, get_rotation_table,
     calculate_continuous_week, REFERENCE_MONDAY
 )
+from prayer_schedule.algorithm import iter_schedule
+from prayer_schedule.log import configure_logging
+from prayer_schedule.sweep import SWEEP_END_YEAR, sweep_calendar
 from prayer_schedule.config import (
     FAMILIES_PER_ELDER_MAX, FAMILIES_PER_ELDER_MIN,
     POOL_COUNT, ROTATION_WEEKS,
@@ -67,12 +70,13 @@ def verify_complete_coverage():
     print("-"*80)
 
     all_tests_passed = True
+    table = get_rotation_table()
 
-    for week_num in range(46, 56):  # Test 10 consecutive weeks
+    # Continuous weeks 46..55 (10 consecutive weeks).
+    first_monday = REFERENCE_MONDAY + timedelta(weeks=45)
+    for _monday, week_num, assignments in iter_schedule(first_monday, 10, table):
         print(f"\n📅 WEEK {week_num}:")
 
-        assignments = assign_families_for_week_v10(week_num)
-
         # Collect all families assigned this week
         families_assigned_this_week = set()
         families_per_elder = {}
@@ -180,8 +184,8 @@ def verify_complete_coverage():
 
     for elder in ELDERS:
         # Get assignments for week N and week N+ROTATION_WEEKS
-        week1_families = set(assign_families_for_week_v10(week_start)[elder])
-        weekN_families = set(assign_families_for_week_v10(week_start + ROTATION_WEEKS)[elder])
+        week1_families = set(table.for_week(week_start)[elder])
+        weekN_families = set(table.for_week(week_start + ROTATION_WEEKS)[elder])
 
         if week1_families == weekN_families:
             print(f"   ✅ {elder}: Week {week_start} = Week {week_start+ROTATION_WEEKS} (cycle repeats)")
@@ -201,11 +205,13 @@ def verify_complete_coverage():
     print("-"*80)
 
     rotation_perfect = True
+    # Weeks 46..53 give 7 week transitions.
+    weeks = list(iter_schedule(first_monday, 8, table))
     for elder in ELDERS:
         elder_perfect = True
-        for week in range(46, 53):  # Check 7 week transitions
-            week1_families = set(assign_families_for_week_v10(week)[elder])
-            week2_families = set(assign_families_for_week_v10(week + 1)[elder])
+        for (_, week, prev), (_, _, curr) in zip(weeks, weeks[1:]):
+            week1_families = set(prev[elder])
+            week2_families = set(curr[elder])
 
             overlap = week1_families & week2_families
 
@@ -275,9 +281,7 @@ def verify_year_boundary():
         prev_assignments = None
 
         boundary_ok = True
-        for week_offset in range(12):
-            monday = start_monday + timedelta(weeks=week_offset)
-            continuous_week = calculate_continuous_week(monday)
+        for monday, continuous_week, assignments in iter_schedule(start_monday, 12):
             iso_year, iso_week, _ = monday.isocalendar()
             cycle_pos = (continuous_week - 1) % POOL_COUNT
 
@@ -291,7 +295,6 @@ def verify_year_boundary():
                     all_passed = False
 
             # Check no family overlap between consecutive weeks
-            assignments = assign_families_for_week_v10(continuous_week)
             if prev_assignments is not None:
                 for elder in ELDERS:
                     prev_fams = set(prev_assignments[elder])
@@ -334,10 +337,31 @@ def verify_year_boundary():
     return all_passed
 
 
+def verify_calendar_sweep(end_year=SWEEP_END_YEAR):
+    """
+    Verify EVERY Monday from REFERENCE_MONDAY through ``end_year``: cycle
+    continuity, no week-to-week repeats, and DST-safe Monday detection in
+    Central Time. See prayer_schedule.sweep for the individual checks.
+    """
+    print(f"\n\n{'='*80}")
+    print(f"CALENDAR SWEEP THROUGH {end_year}")
+    print('='*80)
+
+    report = sweep_calendar(end_year)
+    for issue in report.issues[:20]:
+        print(f"   FAIL: {issue}")
+    if len(report.issues) > 20:
+        print(f"   ... and {len(report.issues) - 20} more")
+    print(f"\n{report.summary()}")
+    return report.ok
+
+
 if __name__ == "__main__":
     import os
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    configure_logging()
 
     success1 = verify_complete_coverage()
     success2 = verify_year_boundary()
-    sys.exit(0 if (success1 and success2) else 1)
+    success3 = verify_calendar_sweep()
+    sys.exit(0 if (success1 and success2 and success3) else 1)
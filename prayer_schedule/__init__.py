@@ -8,6 +8,7 @@ Public API (re-exported for helper scripts such as
     - :func:`parse_directory`
     - :func:`assign_families_for_week_v10`
     - :func:`get_master_pools`
+    - :func:`get_rotation_table`
     - :func:`calculate_continuous_week`
     - :data:`REFERENCE_MONDAY`
 """
@@ -18,6 +19,7 @@ from .algorithm import (
     assign_families_for_week_v10,
     calculate_continuous_week,
     get_master_pools,
+    get_rotation_table,
 )
 from .config import REFERENCE_MONDAY
 from .directory import parse_directory
@@ -29,6 +31,7 @@ __all__ = [
     "parse_directory",
     "assign_families_for_week_v10",
     "get_master_pools",
+    "get_rotation_table",
     "calculate_continuous_week",
     "REFERENCE_MONDAY",
 ]
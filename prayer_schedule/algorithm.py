@@ -1,29 +1,43 @@
 """Pool distribution, week-number arithmetic, and weekly family assignment.
 
 This is the heart of the V10 rotation algorithm. ``create_v10_master_pools``
-distributes the 161 families round-robin into 7 pools.
+distributes the 161 families round-robin into 7 pools (the general
+balancing lives in :mod:`prayer_schedule.pools`).
 ``assign_families_for_week_v10`` selects the weekly pool per elder, filters
 out each elder's own family, and redistributes filtered families according
 to :data:`FIXED_REASSIGNMENT_MAP` to guarantee 22-24 families per elder and
-no week-to-week repeats.
+no week-to-week repeats. :class:`RotationTable` precomputes all
+``POOL_COUNT`` cycle positions so bulk callers can look weeks up in O(1);
+:func:`calculate_week_arrays` does the date-to-week arithmetic for many
+dates at once.
 """
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional
+import logging
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Optional, Sequence, Union
 
 from .config import POOL_COUNT, REFERENCE_MONDAY
-from .directory import parse_directory
+from .directory import FamilyRegistry, get_family_registry, parse_directory
 from .elders import ELDER_FAMILIES, ELDERS
+from .pools import PoolIndex, build_pools
+
+logger = logging.getLogger(__name__)
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
 
 def calculate_week_number(date: datetime) -> int:
-    """Return the ISO week number for ``date`` (printed for debug visibility)."""
+    """Return the ISO week number for ``date`` (logged at DEBUG level)."""
     iso_year, iso_week, iso_day = date.isocalendar()
 
-    # Log the ISO week for debugging (preserves behaviour of the original script).
-    print(f"  Date {date.strftime('%Y-%m-%d')} = ISO Week {iso_week} of {iso_year}")
+    # Check the level first so bulk callers pay no formatting cost.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"  Date {date.strftime('%Y-%m-%d')} = ISO Week {iso_week} of {iso_year}")
 
     return iso_week
 
@@ -56,28 +70,104 @@ def calculate_continuous_week(monday_date: datetime) -> int:
     return (days_diff // 7) + 1  # 1-based to match ISO week convention
 
 
-def create_v10_master_pools() -> list[list[str]]:
-    """Distribute all families round-robin into ``POOL_COUNT`` sorted pools.
+class WeekArrays(NamedTuple):
+    """Parallel per-date results of :func:`calculate_week_arrays`.
 
-    Returns a list of ``POOL_COUNT`` lists. With 161 families and 7 pools,
-    each pool ends up with exactly 23 families (161 = 7 * 23).
+    Each field has one entry per input date, in input order: ``array('q')``
+    for a sequence of dates, or an int64 NumPy array for ``datetime64`` input.
     """
-    families = parse_directory()
-
-    # Create the pools.
-    pools: list[list[str]] = [[] for _ in range(POOL_COUNT)]
-
-    # Distribute all families round-robin style.  With 161 families and 7
-    # pools this naturally achieves 23 families in every pool.
-    for i, family in enumerate(families):
-        pool_idx = i % POOL_COUNT
-        pools[pool_idx].append(family)
-
-    # Sort each pool for consistency.
-    for pool in pools:
-        pool.sort()
 
-    return pools
+    continuous_week: Any
+    cycle_position: Any
+    iso_year: Any
+    iso_week: Any
+
+
+def _iso_weeks(ordinals: Sequence[int]) -> tuple[array, array]:
+    # ISO week of an ordinal: find that week's Thursday, whose calendar year
+    # is the ISO year; the week is its day-of-year // 7 + 1.
+    jan1: dict[int, int] = {}
+    years = array("q")
+    weeks = array("q")
+    for ordinal in ordinals:
+        thursday = ordinal - (ordinal + 6) % 7 + 3
+        year = date.fromordinal(thursday).year
+        start = jan1.get(year)
+        if start is None:
+            start = jan1[year] = date(year, 1, 1).toordinal()
+        years.append(year)
+        weeks.append((thursday - start) // 7 + 1)
+    return years, weeks
+
+
+def _datetime64_week_arrays(dates: Any, pool_count: int) -> WeekArrays:
+    # Vectorized over a NumPy datetime64 array without importing NumPy here:
+    # every step is an ndarray method or operator. Day 0 (1970-01-01) was a
+    # Thursday, so (days + 3) % 7 is the Monday-based weekday.
+    days = dates.astype("datetime64[D]").astype("int64")
+    reference = REFERENCE_MONDAY.toordinal() - _EPOCH_ORDINAL
+    continuous = (days - reference) // 7 + 1
+    if continuous.size and continuous.min() < 1:
+        first = dates[(continuous < 1).argmax()]
+        raise ValueError(f"date {first} predates REFERENCE_MONDAY {REFERENCE_MONDAY}")
+    thursday = days - (days + 3) % 7 + 3
+    thursday_dates = thursday.astype("datetime64[D]")
+    jan1 = thursday_dates.astype("datetime64[Y]").astype("datetime64[D]").astype("int64")
+    iso_year = thursday_dates.astype("datetime64[Y]").astype("int64") + 1970
+    return WeekArrays(
+        continuous_week=continuous,
+        cycle_position=(continuous - 1) % pool_count,
+        iso_year=iso_year,
+        iso_week=(thursday - jan1) // 7 + 1,
+    )
+
+
+def calculate_week_arrays(
+    dates: Union[Iterable[date], Any],
+    pool_count: int = POOL_COUNT,
+) -> WeekArrays:
+    """Map many dates to continuous weeks, cycle positions and ISO weeks at once.
+
+    ``dates`` is either a NumPy ``datetime64`` array (handled with array
+    operations, no per-date Python work) or any iterable of ``date`` /
+    ``datetime`` objects. Datetimes are taken at their wall-clock date, as in
+    :func:`calculate_continuous_week`, and the same rule applies: any date
+    before :data:`REFERENCE_MONDAY` raises :class:`ValueError`.
+    """
+    dtype = getattr(dates, "dtype", None)
+    if dtype is not None and getattr(dtype, "kind", None) == "M":
+        return _datetime64_week_arrays(dates, pool_count)
+
+    dates = list(dates)
+    reference = REFERENCE_MONDAY.toordinal()
+    ordinals = array("q", [d.toordinal() for d in dates])
+    continuous = array("q", [(ordinal - reference) // 7 + 1 for ordinal in ordinals])
+    if continuous and min(continuous) < 1:
+        first = next(d for d, week in zip(dates, continuous) if week < 1)
+        raise ValueError(f"date {first} predates REFERENCE_MONDAY {REFERENCE_MONDAY}")
+    iso_year, iso_week = _iso_weeks(ordinals)
+    return WeekArrays(
+        continuous_week=continuous,
+        cycle_position=array("q", [(week - 1) % pool_count for week in continuous]),
+        iso_year=iso_year,
+        iso_week=iso_week,
+    )
+
+
+def create_v10_master_pools(
+    families: Optional[Sequence[str]] = None,
+    pool_count: int = POOL_COUNT,
+) -> list[list[str]]:
+    """Distribute all families round-robin into ``pool_count`` sorted pools.
+
+    ``families`` defaults to :func:`parse_directory`. Returns a list of
+    ``pool_count`` lists whose sizes differ by at most one (see
+    :func:`~prayer_schedule.pools.build_pools`). With 161 families and 7
+    pools, each pool ends up with exactly 23 families (161 = 7 * 23).
+    """
+    if families is None:
+        families = parse_directory()
+    return build_pools(families, pool_count)
 
 
 # Module-level cache so ``get_master_pools()`` is idempotent per process.
@@ -92,6 +182,18 @@ def get_master_pools() -> list[list[str]]:
     return _MASTER_POOLS
 
 
+# Built alongside the master pools; answers family -> pool lookups in O(1).
+_POOL_INDEX: Optional[PoolIndex] = None
+
+
+def get_pool_index() -> PoolIndex:
+    """Return the cached :class:`~prayer_schedule.pools.PoolIndex` of the master pools."""
+    global _POOL_INDEX
+    if _POOL_INDEX is None:
+        _POOL_INDEX = PoolIndex.from_pools(get_master_pools())
+    return _POOL_INDEX
+
+
 # Fixed reassignment mapping based on conflict analysis (161 families, 7 pools
 # of 23 families each). For each cycle position 0..6, any elder whose own
 # family lands in their assigned pool has it filtered out; this map names the
@@ -115,54 +217,45 @@ FIXED_REASSIGNMENT_MAP: dict[int, dict[str, str]] = {
 }
 
 
-def assign_families_for_week_v10(week_number: int) -> dict[str, list[str]]:
-    """Compute the per-elder family assignments for ``week_number``.
-
-    Behaviour (preserves the V10 contract used by the helper scripts):
-
-    1. Each elder ``i`` is assigned pool ``(i + cycle_position) % POOL_COUNT``
-       where ``cycle_position = (week_number - 1) % POOL_COUNT``.
-    2. If an elder's own family is in their assigned pool, it is filtered
-       out and re-targeted to another elder via :data:`FIXED_REASSIGNMENT_MAP`.
-    3. The reassignment targets are pre-verified to be adjacency-safe (no
-       week-to-week repeats for any elder).
-
-    Returns a dict mapping elder name -> list of family strings for the week.
+def _assign_for_cycle_position(
+    cycle_position: int,
+    master_pools: Sequence[Sequence[str]],
+    elders: Sequence[str],
+    elder_families: Mapping[str, str],
+    reassignment_map: Mapping[int, Mapping[str, str]],
+    pool_index: PoolIndex,
+) -> dict[str, list[str]]:
+    """Compute the per-elder family lists for one ``cycle_position``.
+
+    Shared by :func:`assign_families_for_week_v10` and
+    :meth:`RotationTable.build` so both paths apply exactly the same rules.
+    The rotation length is ``len(master_pools)`` (one pool per elder), and
+    ``pool_index`` must index ``master_pools``.
     """
-    master_pools = get_master_pools()
-
-    # Calculate position in the rotation cycle.
-    cycle_position = (week_number - 1) % POOL_COUNT
-
+    pool_count = len(master_pools)
     # First, collect filtered (elder-own) families and who owns them.
     filtered_families_data: list[tuple[str, str, int]] = []
-    for elder_idx, elder in enumerate(ELDERS):
-        pool_idx = (elder_idx + cycle_position) % POOL_COUNT
-        elder_own_family = ELDER_FAMILIES.get(elder)
-
-        if elder_own_family in master_pools[pool_idx]:
-            # This elder's family is in their pool and needs reassignment.
-            filtered_families_data.append((elder_own_family, elder, elder_idx))
-
     # First pass: assign pools and filter out own families.
     assignments: dict[str, list[str]] = {}
-    for elder_idx, elder in enumerate(ELDERS):
-        pool_idx = (elder_idx + cycle_position) % POOL_COUNT
-
-        pool_families = master_pools[pool_idx].copy()
-        elder_own_family = ELDER_FAMILIES.get(elder)
+    for elder_idx, elder in enumerate(elders):
+        pool_idx = (elder_idx + cycle_position) % pool_count
+        elder_own_family = elder_families.get(elder)
 
-        if elder_own_family in pool_families:
-            pool_families.remove(elder_own_family)
+        if pool_index.contains(pool_idx, elder_own_family):
+            # This elder's family is in their pool and needs reassignment.
+            filtered_families_data.append((elder_own_family, elder, elder_idx))
+            pool_families = [f for f in master_pools[pool_idx] if f != elder_own_family]
+        else:
+            pool_families = list(master_pools[pool_idx])
 
         assignments[elder] = pool_families
 
     # Second pass: redistribute filtered families using the fixed reassignment
     # table to guarantee consistency and no week-to-week repeats.
-    reassignment_map = FIXED_REASSIGNMENT_MAP.get(cycle_position, {})
+    position_map = reassignment_map.get(cycle_position, {})
 
     for elder_family, owner_elder, owner_idx in filtered_families_data:
-        best_elder = reassignment_map.get(owner_elder)
+        best_elder = position_map.get(owner_elder)
 
         if not best_elder:
             # validate_reassignment_map() is meant to catch this at startup;
@@ -176,3 +269,178 @@ def assign_families_for_week_v10(week_number: int) -> dict[str, list[str]]:
         assignments[best_elder].append(elder_family)
 
     return assignments
+
+
+def assign_families_for_week_v10(week_number: int) -> dict[str, list[str]]:
+    """Compute the per-elder family assignments for ``week_number``.
+
+    Behaviour (preserves the V10 contract used by the helper scripts):
+
+    1. Each elder ``i`` is assigned pool ``(i + cycle_position) % POOL_COUNT``
+       where ``cycle_position = (week_number - 1) % POOL_COUNT``.
+    2. If an elder's own family is in their assigned pool, it is filtered
+       out and re-targeted to another elder via :data:`FIXED_REASSIGNMENT_MAP`.
+    3. The reassignment targets are pre-verified to be adjacency-safe (no
+       week-to-week repeats for any elder).
+
+    Returns a dict mapping elder name -> list of family strings for the week.
+    Callers that look up many weeks should use :func:`get_rotation_table`
+    instead, which answers from precomputed tuples without recomputing.
+    """
+    cycle_position = (week_number - 1) % POOL_COUNT
+    return _assign_for_cycle_position(
+        cycle_position,
+        get_master_pools(),
+        ELDERS,
+        ELDER_FAMILIES,
+        FIXED_REASSIGNMENT_MAP,
+        get_pool_index(),
+    )
+
+
+@dataclass(frozen=True)
+class RotationTable:
+    """Every cycle position's assignments, materialized once.
+
+    Only ``POOL_COUNT`` (one per pool) distinct weekly outcomes exist, so
+    the table holds one read-only ``elder -> tuple of families`` mapping per
+    cycle position and answers any week by index. Build it with
+    :meth:`build` (or use the cached :func:`get_rotation_table` for the live
+    roster and directory).
+
+    ``encoded`` mirrors ``positions`` with family IDs from ``registry``: one
+    ``array('I')`` per elder (in ``elders`` order) per cycle position, for
+    checks that only need to hash and compare integers.
+    """
+
+    elders: tuple[str, ...]
+    positions: tuple[Mapping[str, tuple[str, ...]], ...]
+    registry: FamilyRegistry
+    encoded: tuple[tuple[array, ...], ...]
+
+    @classmethod
+    def build(
+        cls,
+        master_pools: Optional[Sequence[Sequence[str]]] = None,
+        elders: Optional[Sequence[str]] = None,
+        elder_families: Optional[Mapping[str, str]] = None,
+        reassignment_map: Optional[Mapping[int, Mapping[str, str]]] = None,
+    ) -> "RotationTable":
+        """Compute every cycle position (one per pool) up front.
+
+        Every argument defaults to the live module-level value, read at call
+        time, so a table built after a monkeypatch reflects the patch.
+        Raises :class:`RuntimeError` under the same conditions as
+        :func:`assign_families_for_week_v10`.
+        """
+        if master_pools is None:
+            master_pools = get_master_pools()
+            pool_index = get_pool_index()
+            registry = get_family_registry()
+        else:
+            pool_index = PoolIndex.from_pools(master_pools)
+            registry = FamilyRegistry.from_families(pool_index.pool_of)
+        if elders is None:
+            elders = ELDERS
+        if elder_families is None:
+            elder_families = ELDER_FAMILIES
+        if reassignment_map is None:
+            reassignment_map = FIXED_REASSIGNMENT_MAP
+
+        positions = [
+            _assign_for_cycle_position(
+                cycle_position,
+                master_pools,
+                elders,
+                elder_families,
+                reassignment_map,
+                pool_index,
+            )
+            for cycle_position in range(len(master_pools))
+        ]
+        return cls.from_positions(elders, positions, registry)
+
+    @classmethod
+    def from_positions(
+        cls,
+        elders: Sequence[str],
+        positions: Sequence[Mapping[str, Sequence[str]]],
+        registry: FamilyRegistry,
+    ) -> "RotationTable":
+        """Wrap already-computed per-position assignments (e.g. from a saved plan).
+
+        ``registry`` must contain every family in ``positions``; no rotation
+        rules are re-applied or checked here.
+        """
+        frozen = []
+        encoded = []
+        for assignments in positions:
+            frozen.append(MappingProxyType(
+                {elder: tuple(families) for elder, families in assignments.items()}
+            ))
+            encoded.append(tuple(registry.encode(assignments[elder]) for elder in elders))
+        return cls(
+            elders=tuple(elders),
+            positions=tuple(frozen),
+            registry=registry,
+            encoded=tuple(encoded),
+        )
+
+    def cycle_position(self, week_number: int) -> int:
+        """Return the rotation index ``0..len(positions)-1`` for ``week_number``."""
+        return (week_number - 1) % len(self.positions)
+
+    def for_cycle_position(self, cycle_position: int) -> Mapping[str, tuple[str, ...]]:
+        """Return the read-only assignments for ``cycle_position``."""
+        return self.positions[cycle_position]
+
+    def for_week(self, week_number: int) -> Mapping[str, tuple[str, ...]]:
+        """Return the read-only assignments for ``week_number`` in O(1)."""
+        return self.positions[(week_number - 1) % len(self.positions)]
+
+    def encoded_for_week(self, week_number: int) -> tuple[array, ...]:
+        """Return per-elder family-ID arrays (``elders`` order) for ``week_number``."""
+        return self.encoded[(week_number - 1) % len(self.encoded)]
+
+
+# Module-level cache so ``get_rotation_table()`` is built once per process.
+_ROTATION_TABLE: Optional[RotationTable] = None
+
+
+def get_rotation_table() -> RotationTable:
+    """Return the cached :class:`RotationTable` for the live roster and directory."""
+    global _ROTATION_TABLE
+    if _ROTATION_TABLE is None:
+        _ROTATION_TABLE = RotationTable.build()
+    return _ROTATION_TABLE
+
+
+def iter_schedule(
+    start_monday: datetime,
+    weeks: int,
+    table: Optional[RotationTable] = None,
+) -> Iterator[tuple[datetime, int, Mapping[str, tuple[str, ...]]]]:
+    """Lazily yield ``(monday, continuous_week, assignments)`` for ``weeks`` weeks.
+
+    Week numbers come from :func:`calculate_continuous_week`, so the same
+    pre-reference validation applies. Assignments are looked up in ``table``
+    (default: :func:`get_rotation_table`), so weeks sharing a cycle position
+    share one read-only mapping and nothing is held beyond the current week.
+
+    Raises :class:`ValueError` if ``start_monday`` is not a Monday or
+    ``weeks`` is negative.
+    """
+    if start_monday.weekday() != 0:
+        raise ValueError(f"start_monday {start_monday} is not a Monday")
+    if weeks < 0:
+        raise ValueError(f"weeks must be non-negative, got {weeks}")
+    if table is None:
+        table = get_rotation_table()
+
+    first_week = calculate_continuous_week(start_monday)
+    for offset in range(weeks):
+        # Wall-clock arithmetic on aware datetimes keeps every Monday at the
+        # same local time across DST transitions.
+        monday = start_monday + timedelta(weeks=offset)
+        continuous_week = first_week + offset
+        yield monday, continuous_week, table.for_week(continuous_week)
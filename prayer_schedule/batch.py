@@ -0,0 +1,111 @@
+"""Run the daily pipeline for many congregations in one process pool.
+
+Each :class:`~prayer_schedule.tenant.TenantContext` is pickled to a worker
+process and passed to :func:`~prayer_schedule.cli.main`, so one interpreter
+start-up is shared by every tenant a worker handles. Worker console output
+is captured per tenant instead of interleaving on the parent's stdout; in
+quiet mode workers log only warnings and errors.
+
+Every tenant in a batch needs its own ``output_dir``: the plan file,
+pages, logs and caches a run writes would otherwise collide in
+:data:`~prayer_schedule.config.DESKTOP_DIR`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, NamedTuple, Optional
+
+from .log import configure_logging
+from .tenant import TenantContext
+
+
+class TenantResult(NamedTuple):
+    """Outcome of one tenant's run."""
+
+    name: str
+    ok: bool
+    seconds: float
+    output: str
+
+
+class BatchReport(NamedTuple):
+    """Results in submission order plus wall-clock throughput."""
+
+    results: list[TenantResult]
+    elapsed: float
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for result in self.results if result.ok)
+
+    @property
+    def failed(self) -> list[str]:
+        return [result.name for result in self.results if not result.ok]
+
+    @property
+    def throughput(self) -> float:
+        """Tenants completed per second of wall-clock time."""
+        return len(self.results) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """Return a one-line ``[OK]``/``[X]`` summary for the console."""
+        status = "[OK]" if not self.failed else "[X]"
+        return (
+            f"{status} {self.succeeded}/{len(self.results)} tenants succeeded in "
+            f"{self.elapsed:.2f}s ({self.throughput:.1f} tenants/sec)"
+        )
+
+
+def run_tenant(tenant: TenantContext) -> TenantResult:
+    """Run :func:`~prayer_schedule.cli.main` for ``tenant``, capturing its output."""
+    # Imported here so worker processes pay for the CLI import only once they
+    # actually run a tenant.
+    from .cli import main
+
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(buffer):
+        ok = main(tenant)
+    return TenantResult(tenant.name, ok, time.perf_counter() - start, buffer.getvalue())
+
+
+def run_batch(
+    tenants: Iterable[TenantContext],
+    max_workers: Optional[int] = None,
+    quiet: bool = False,
+) -> BatchReport:
+    """Run every tenant on a :class:`ProcessPoolExecutor`.
+
+    ``max_workers`` defaults to the CPU count. Tenants are chunked across
+    workers to amortise pickling overhead. ``quiet=True`` sets each worker's
+    console log level to ``WARNING``, so :attr:`TenantResult.output` holds
+    only problems. Raises :class:`ValueError` if a tenant has no
+    ``output_dir`` or two tenants share one.
+    """
+    tenants = list(tenants)
+    missing = [tenant.name for tenant in tenants if tenant.output_dir is None]
+    if missing:
+        raise ValueError(f"batch tenants need an output_dir: {', '.join(missing)}")
+    seen: dict[str, str] = {}
+    for tenant in tenants:
+        key = os.path.normcase(os.path.abspath(tenant.output_dir))
+        if key in seen:
+            raise ValueError(
+                f"tenants {seen[key]!r} and {tenant.name!r} share output_dir {tenant.output_dir!r}"
+            )
+        seen[key] = tenant.name
+    start = time.perf_counter()
+    if not tenants:
+        return BatchReport([], 0.0)
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=configure_logging, initargs=(None, quiet)
+    ) as executor:
+        chunksize = max(1, len(tenants) // (workers * 4))
+        results = list(executor.map(run_tenant, tenants, chunksize=chunksize))
+    return BatchReport(results, time.perf_counter() - start)
@@ -0,0 +1,232 @@
+"""Bitset invariant checks over family IDs.
+
+Each elder-week is one Python ``int`` used as a fixed-width bitset: bit
+``i`` is set when the family with :class:`~prayer_schedule.directory.FamilyRegistry`
+ID ``i`` is assigned. The rotation invariants then become word-parallel
+integer operations instead of per-family hashing:
+
+* family count — the list length, which equals ``mask.bit_count()``
+  unless the list repeats a family
+* own family — ``mask & own_bit``
+* adjacent-week overlap — ``(this_week & next_week).bit_count()``
+* duplicates within a week — ``seen & mask`` while OR-ing masks together,
+  plus each list's own repeats, which a bitset alone would collapse
+* coverage — ``seen`` against the directory mask
+
+Masks are built through a ``bytearray`` (one pass over the IDs, one
+``int.from_bytes``) rather than ``mask |= 1 << i``, which would copy the
+whole growing integer once per family.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Mapping, Optional, Sequence
+
+from .algorithm import RotationTable
+from .config import FAMILIES_PER_ELDER_MAX, FAMILIES_PER_ELDER_MIN
+from .directory import FamilyRegistry
+
+
+def mask_of(family_ids: Iterable[int], width: int) -> int:
+    """Return the bitset with bit ``i`` set for every ID in ``family_ids``.
+
+    Raises :class:`ValueError` if an ID falls outside ``0..width-1``.
+    """
+    buffer = bytearray((width + 7) // 8)
+    for family_id in family_ids:
+        if not 0 <= family_id < width:
+            raise ValueError(f"family ID {family_id} outside bitset width {width}")
+        buffer[family_id >> 3] |= 1 << (family_id & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _mask_and_repeats(family_ids: Sequence[int], width: int) -> tuple[int, int]:
+    """Return ``(mask, repeats)``: the bitset of ``family_ids`` and of the IDs
+    listed more than once."""
+    mask = mask_of(family_ids, width)
+    if mask.bit_count() == len(family_ids):
+        return mask, 0
+    counts = Counter(family_ids)
+    return mask, mask_of((i for i, n in counts.items() if n > 1), width)
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the set bit positions of ``mask`` in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+@dataclass(frozen=True)
+class BitsetTable:
+    """One bitset per elder per cycle position of a :class:`RotationTable`.
+
+    ``masks[cycle_position][elder_idx]`` follows ``elders`` order, like
+    :attr:`RotationTable.encoded`; ``counts`` and ``repeats`` mirror it with
+    each list's length and the bitset of families it lists more than once.
+    ``full`` has a bit for every family in ``registry``.
+    """
+
+    elders: tuple[str, ...]
+    registry: FamilyRegistry
+    masks: tuple[tuple[int, ...], ...]
+    counts: tuple[tuple[int, ...], ...]
+    repeats: tuple[tuple[int, ...], ...]
+    full: int
+
+    @classmethod
+    def from_table(cls, table: RotationTable) -> "BitsetTable":
+        """Convert every encoded cycle position of ``table`` to bitsets."""
+        width = len(table.registry)
+        built = [
+            [_mask_and_repeats(family_ids, width) for family_ids in assignments]
+            for assignments in table.encoded
+        ]
+        return cls(
+            elders=table.elders,
+            registry=table.registry,
+            masks=tuple(tuple(mask for mask, _ in position) for position in built),
+            counts=tuple(
+                tuple(len(family_ids) for family_ids in assignments)
+                for assignments in table.encoded
+            ),
+            repeats=tuple(tuple(rep for _, rep in position) for position in built),
+            full=(1 << width) - 1,
+        )
+
+    def cycle_position(self, week_number: int) -> int:
+        """Return the rotation index for ``week_number`` (as :class:`RotationTable`)."""
+        return (week_number - 1) % len(self.masks)
+
+    def masks_for_week(self, week_number: int) -> tuple[int, ...]:
+        """Return per-elder bitsets (``elders`` order) for ``week_number``."""
+        return self.masks[self.cycle_position(week_number)]
+
+    def mask_for(self, families: Iterable[str]) -> int:
+        """Return the bitset of ``families``, skipping any not in ``registry``."""
+        ids = self.registry.ids
+        return mask_of(
+            (ids[family] for family in families if family in ids), len(self.registry)
+        )
+
+    def decode(self, mask: int) -> list[str]:
+        """Return the family strings whose bits are set in ``mask``."""
+        return self.registry.decode(iter_bits(mask))
+
+
+def _position_issues(
+    bitsets: BitsetTable,
+    cycle_position: int,
+    own_bits: tuple[int, ...],
+    expected: int,
+    bounds: tuple[int, int],
+) -> list[str]:
+    issues: list[str] = []
+    lo, hi = bounds
+    seen = 0
+    repeated = 0
+    for elder, mask, count, within, own in zip(
+        bitsets.elders,
+        bitsets.masks[cycle_position],
+        bitsets.counts[cycle_position],
+        bitsets.repeats[cycle_position],
+        own_bits,
+    ):
+        if not lo <= count <= hi:
+            issues.append(f"{elder}: {count} families (should be {lo}-{hi})")
+        if mask & own:
+            issues.append(f"{elder} has their own family in the list!")
+        repeated |= (seen & mask) | within
+        seen |= mask
+    for family in bitsets.decode(repeated):
+        issues.append(f"{family} assigned more than once this week")
+    missing = expected & ~seen
+    extra = seen & ~expected
+    if missing:
+        issues.append(f"{missing.bit_count()} families missing: {bitsets.decode(missing)[:5]}")
+    if extra:
+        issues.append(f"{extra.bit_count()} unknown families: {bitsets.decode(extra)[:5]}")
+    return issues
+
+
+def pair_issues(bitsets: BitsetTable, cycle_position: int, next_position: int) -> list[str]:
+    """Return one message per elder whose families at ``cycle_position``
+    repeat at ``next_position``."""
+    issues = []
+    for elder, this_week, next_week in zip(
+        bitsets.elders, bitsets.masks[cycle_position], bitsets.masks[next_position]
+    ):
+        overlap = (this_week & next_week).bit_count()
+        if overlap:
+            issues.append(f"{elder}: {overlap} repeats into the next week")
+    return issues
+
+
+def check_invariants(
+    table: RotationTable,
+    elder_families: Mapping[str, str],
+    families: Optional[Iterable[str]] = None,
+    min_count: int = FAMILIES_PER_ELDER_MIN,
+    max_count: int = FAMILIES_PER_ELDER_MAX,
+    start_week: int = 1,
+    weeks: Optional[int] = None,
+    bitsets: Optional[BitsetTable] = None,
+) -> tuple[bool, list[str]]:
+    """Check every week in ``start_week .. start_week + weeks - 1`` with bitsets.
+
+    Checks family counts, own families, duplicates and coverage of
+    ``families`` (default: every family in ``table.registry``) each week,
+    and overlap between each week and the next. ``weeks`` defaults to two
+    full cycles. Weeks sharing a cycle position are evaluated once, so any
+    horizon costs at most one pass per cycle position and one per adjacent
+    pair; each issue is reported once, prefixed by the first week it occurs.
+    Pass ``bitsets`` to reuse an existing :class:`BitsetTable` of ``table``.
+
+    Returns ``(is_valid, issues)`` like :func:`~prayer_schedule.validation.verify_schedule`.
+    """
+    if bitsets is None:
+        bitsets = BitsetTable.from_table(table)
+    pool_count = len(bitsets.masks)
+    if weeks is None:
+        weeks = pool_count * 2
+    if weeks < 0:
+        raise ValueError(f"weeks must be non-negative, got {weeks}")
+
+    issues: list[str] = []
+    if families is None:
+        expected = bitsets.full
+    else:
+        families = set(families)
+        expected = bitsets.mask_for(families)
+        absent = sorted(families - set(bitsets.registry.ids))
+        if absent:
+            issues.append(f"{len(absent)} families never assigned: {absent[:5]}")
+    own_bits = tuple(
+        bitsets.mask_for([elder_families[elder]]) if elder in elder_families else 0
+        for elder in bitsets.elders
+    )
+    bounds = (min_count, max_count)
+
+    checked_positions: set[int] = set()
+    checked_pairs: set[int] = set()
+    for week in range(start_week, start_week + weeks):
+        pos = bitsets.cycle_position(week)
+        if pos not in checked_positions:
+            checked_positions.add(pos)
+            issues.extend(
+                f"Week {week}: {issue}"
+                for issue in _position_issues(bitsets, pos, own_bits, expected, bounds)
+            )
+        if week + 1 < start_week + weeks and pos not in checked_pairs:
+            checked_pairs.add(pos)
+            issues.extend(
+                f"Week {week}->{week + 1}: {issue}"
+                for issue in pair_issues(bitsets, pos, (pos + 1) % pool_count)
+            )
+        if len(checked_positions) == pool_count and len(checked_pairs) == pool_count:
+            break
+
+    return (not issues), issues
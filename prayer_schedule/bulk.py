@@ -0,0 +1,190 @@
+"""Render the HTML and text schedule for every week in a date range.
+
+``archive/`` only holds the text files :func:`~prayer_schedule.file_io.archive_previous_schedule`
+captured on Mondays a run happened, so weeks the workflow missed have no
+copy. :func:`render_range` regenerates any span of weeks -- a year back, the
+next 52 -- from the verified schedule plan and writes each one to
+``archive/weeks/Prayer_Schedule_<monday>_Week<N>.html`` / ``.txt``. These
+are kept apart from the captured archive so the two never collide.
+
+Weeks are split into chunks rendered and written on a
+:class:`ProcessPoolExecutor`; each worker rebuilds the rotation table from
+the plan's assignments once per chunk. Pages are self-contained (inline
+stylesheet and script) so they open from any directory. Their "Last
+updated" line is the plan's compile time, not the current time, so a rerun
+against the same plan rewrites nothing.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Mapping, NamedTuple, Optional, Sequence
+
+from . import config
+from .algorithm import RotationTable, calculate_continuous_week, calculate_week_number
+from .config import REFERENCE_MONDAY
+from .directory import FamilyRegistry
+from .elders import ElderRecord, get_week_schedule
+from .file_io import _ARCHIVE_SUBDIR, _write_if_changed
+from .output import format_stamp, iter_html_schedule, iter_text_schedule
+from .plan import compile_plan, load_plan, plan_keys, plan_path
+from .tenant import TenantContext
+from .utils import week_monday
+
+WEEKS_SUBDIR: str = "weeks"
+
+
+class ChunkResult(NamedTuple):
+    """Files one worker wrote (or found already current) for its weeks."""
+
+    weeks: int
+    written: list[str]
+    unchanged: int
+
+
+class BulkReport(NamedTuple):
+    """Aggregate outcome of :func:`render_range`."""
+
+    first_monday: datetime
+    last_monday: datetime
+    weeks: int
+    written: list[str]
+    unchanged: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Weeks rendered per second of wall-clock time."""
+        return self.weeks / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """Return a one-line ``[OK]`` summary for the console."""
+        return (
+            f"[OK] {self.weeks} weeks {self.first_monday:%Y-%m-%d} to "
+            f"{self.last_monday:%Y-%m-%d} rendered in {self.elapsed:.2f}s "
+            f"({self.throughput:.0f} weeks/sec; {len(self.written)} files written, "
+            f"{self.unchanged} unchanged)"
+        )
+
+
+def week_file_stem(monday: datetime) -> str:
+    """Return ``Prayer_Schedule_<monday>_Week<N>`` for the week of ``monday``."""
+    return f"Prayer_Schedule_{monday:%Y-%m-%d}_Week{calculate_week_number(monday)}"
+
+
+def render_weeks(
+    pools: Sequence[Sequence[str]],
+    positions: Sequence[Mapping[str, Sequence[str]]],
+    elder_data: tuple[ElderRecord, ...],
+    first_week: int,
+    count: int,
+    weeks_dir: str,
+    updated: str,
+    church: str = config.CHURCH_NAME,
+) -> ChunkResult:
+    """Render and write continuous weeks ``first_week .. first_week + count - 1``.
+
+    ``pools`` and ``positions`` are a plan's pools and per-position
+    assignments as plain lists and dicts, which pickle where a
+    :class:`RotationTable` does not. ``updated`` is the "Last updated" text
+    shared by every page of the run (the plan's compile time); ``church``
+    names the congregation.
+    """
+    registry = FamilyRegistry.from_families(f for pool in pools for f in pool)
+    table = RotationTable.from_positions(
+        [record["name"] for record in elder_data], positions, registry
+    )
+    written: list[str] = []
+    unchanged = 0
+    for week in range(first_week, first_week + count):
+        monday = REFERENCE_MONDAY + timedelta(weeks=week - 1)
+        week_number = calculate_week_number(monday)
+        assignments = table.for_week(week)
+        schedule = get_week_schedule(week, elder_data)
+        # Stream each page into its tmp file so memory stays flat however
+        # large the directory is.
+        html = iter_html_schedule(
+            week_number, monday, assignments, schedule, updated=updated, church=church
+        )
+        text = iter_text_schedule(week_number, monday, assignments, schedule, church)
+        stem = os.path.join(weeks_dir, week_file_stem(monday))
+        for path, content in ((f"{stem}.html", html), (f"{stem}.txt", text)):
+            if _write_if_changed(path, content):
+                written.append(path)
+            else:
+                unchanged += 1
+    return ChunkResult(count, written, unchanged)
+
+
+def render_range(
+    start: datetime,
+    end: datetime,
+    tenant: Optional[TenantContext] = None,
+    max_workers: Optional[int] = None,
+    chunk_weeks: int = 8,
+) -> BulkReport:
+    """Render every week whose Monday falls in ``[week of start, week of end]``.
+
+    ``tenant`` defaults to :meth:`TenantContext.from_config`; files go to
+    ``archive/weeks/`` in its output directory. The rotation comes from the tenant's
+    verified plan (compiled first if its inputs changed). Chunks of
+    ``chunk_weeks`` weeks run on a process pool sized like
+    :func:`~prayer_schedule.batch.run_batch`; ``max_workers=0`` renders
+    in-process.
+
+    Raises :class:`ValueError` if ``start`` predates
+    :data:`~prayer_schedule.config.REFERENCE_MONDAY` or follows ``end``, or
+    if the tenant's inputs fail verification.
+    """
+    began = time.perf_counter()
+    if tenant is None:
+        tenant = TenantContext.from_config()
+    output_dir = config.DESKTOP_DIR if tenant.output_dir is None else tenant.output_dir
+    first_monday = week_monday(start)
+    last_monday = week_monday(end)
+    first = calculate_continuous_week(first_monday)
+    last = calculate_continuous_week(last_monday)
+    if last < first:
+        raise ValueError(f"range end {end:%Y-%m-%d} precedes start {start:%Y-%m-%d}")
+
+    plan_file = plan_path(tenant)
+    plan = load_plan(plan_file, plan_keys(tenant)) or compile_plan(tenant, plan_file)
+    if plan is None:
+        raise ValueError(f"{tenant.name}: inputs failed verification; nothing rendered")
+
+    weeks_dir = os.path.join(output_dir, _ARCHIVE_SUBDIR, WEEKS_SUBDIR)
+    os.makedirs(weeks_dir, exist_ok=True)
+
+    starts = list(range(first, last + 1, chunk_weeks))
+    sizes = [min(chunk_weeks, last + 1 - week) for week in starts]
+    positions = [
+        {elder: list(families) for elder, families in assignments.items()}
+        for assignments in plan.table.positions
+    ]
+    args = (
+        [plan.pools] * len(starts),
+        [positions] * len(starts),
+        [tenant.elder_data] * len(starts),
+        starts,
+        sizes,
+        [weeks_dir] * len(starts),
+        [format_stamp(datetime.fromisoformat(plan.verified_at))] * len(starts),
+        [tenant.name] * len(starts),
+    )
+    if max_workers == 0:
+        chunks = list(map(render_weeks, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunks = list(executor.map(render_weeks, *args))
+
+    return BulkReport(
+        first_monday,
+        last_monday,
+        sum(chunk.weeks for chunk in chunks),
+        [path for chunk in chunks for path in chunk.written],
+        sum(chunk.unchanged for chunk in chunks),
+        time.perf_counter() - began,
+    )
@@ -2,42 +2,60 @@
 
 from __future__ import annotations
 
-import traceback
+import logging
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from . import config
-from .algorithm import (
-    assign_families_for_week_v10,
-    calculate_continuous_week,
-    calculate_week_number,
-)
-from .config import DESKTOP_DIR, POOL_COUNT
+from .algorithm import calculate_continuous_week, calculate_week_number
 from .elders import get_week_schedule
 from .email_service import send_daily_combined_email
-from .file_io import archive_previous_schedule, log_activity, update_desktop_files
-from .output import generate_schedule_content
-from .utils import get_today
+from .file_io import (
+    _CURRENT_HTML_NAME,
+    _CURRENT_JSON_NAME,
+    _CURRENT_TEXT_NAME,
+    _TODAY_JSON_NAME,
+    archive_previous_schedule,
+    log_activity,
+    precompress,
+    update_desktop_files,
+)
+from .ical import write_feeds
+from .log import configure_logging
+from .output import generate_json_day, generate_json_schedule, html_assets
+from .plan import compile_plan, load_plan, plan_keys, plan_path
+from .render_cache import RenderCache, cached_schedule_content
+from .tenant import TenantContext
+from .utils import get_today, week_monday
 from .validation import (
-    validate_elder_data,
     validate_email_config,
-    validate_reassignment_map,
     verify_email_date,
     verify_schedule,
     verify_today_elder_assignment,
-    verify_v10_algorithm,
 )
 
+logger = logging.getLogger(__name__)
 
-def main() -> bool:
+
+def main(tenant: Optional[TenantContext] = None) -> bool:
     """Main execution with combined daily email.
 
     Behaviour:
       * Monday: Regenerate weekly schedule files + send combined email.
       * Tuesday-Sunday: Refresh HTML/text files + send combined email.
       * Every day: exactly 1 email (today's assignment + week overview).
+
+    ``tenant`` selects the congregation; the default,
+    :meth:`TenantContext.from_config`, is the one configured in this package.
+    Console output goes through :func:`~prayer_schedule.log.configure_logging`
+    (``PRAYER_SCHEDULE_LOG_LEVEL``, unless a caller configured it first).
     """
+    configure_logging()
     try:
-        today = get_today()
+        if tenant is None:
+            tenant = TenantContext.from_config()
+        output_dir = config.DESKTOP_DIR if tenant.output_dir is None else tenant.output_dir
+        today = get_today(tenant.timezone)
         is_monday = today.weekday() == 0
         day_names = [
             "Monday", "Tuesday", "Wednesday",
@@ -47,155 +65,180 @@ def main() -> bool:
 
         log_activity(
             f"Starting prayer schedule system ({today_name}) "
-            "(VERSION 11 - COMBINED EMAIL)"
+            "(VERSION 11 - COMBINED EMAIL)",
+            output_dir,
         )
-        print(f"\n[DATE] Server UTC time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"[DATE] Central Time (church local): {today.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"[DATE] Today: {today_name}, {today.strftime('%B %d, %Y')}")
+        logger.info(f"\n[DATE] Server UTC time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"[DATE] Central Time (church local): {today.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"[DATE] Today: {today_name}, {today.strftime('%B %d, %Y')}")
 
         # Startup config validation — fail loudly on any drift before doing work.
-        print("\nValidating configuration...")
-        elder_ok, elder_issues = validate_elder_data()
-        if not elder_ok:
-            for issue in elder_issues:
-                print(f"   [X] {issue}")
-            print("[X] ELDER DATA VALIDATION FAILED — aborting")
-            return False
-        map_ok, map_issues = validate_reassignment_map()
-        if not map_ok:
-            for issue in map_issues:
-                print(f"   [X] {issue}")
-            print("[X] REASSIGNMENT MAP VALIDATION FAILED — aborting")
-            return False
-        email_ok, email_issues = validate_email_config()
+        logger.info("\nValidating configuration...")
+        email_ok, email_issues = validate_email_config(tenant.email)
         if not email_ok:
             for issue in email_issues:
-                print(f"   [X] {issue}")
-            print("[X] EMAIL CONFIG VALIDATION FAILED — aborting")
-            return False
-        print("[OK] Elder data, reassignment map, and email config are consistent.")
-
-        # First verify the algorithm.
-        print("\nRunning algorithm verification...")
-        if not verify_v10_algorithm():
-            print("\n[X] V10 algorithm verification FAILED!")
-            print("Aborting to prevent generating incorrect schedules.")
+                logger.error(f"   [X] {issue}")
+            logger.error("[X] EMAIL CONFIG VALIDATION FAILED — aborting")
             return False
-
-        print("\n[OK] Algorithm verification PASSED!")
+        logger.info("[OK] Email config is consistent.")
+
+        # Reuse the compiled plan when its inputs are unchanged; otherwise
+        # validate and verify everything, and compile a fresh plan.
+        plan_file = plan_path(tenant)
+        plan = load_plan(plan_file, plan_keys(tenant))
+        if plan is not None:
+            logger.info(f"[OK] Verified schedule plan matches current inputs: {plan_file}")
+        else:
+            plan = compile_plan(tenant, plan_file)
+            if plan is None:
+                return False
+        table = plan.table
+        min_families, max_families = tenant.family_bounds(plan.pools)
 
         # Get current week information - always find this week's Monday.
-        days_back = today.weekday()
-        monday = today - timedelta(days=days_back)
-        monday = monday.replace(hour=0, minute=0, second=0, microsecond=0)
+        monday = week_monday(today)
 
         # Verify the email date is correct before proceeding.
         date_valid, date_msg = verify_email_date(today, monday)
-        print(f"\n[DATE CHECK] {date_msg}")
+        logger.info(f"\n[DATE CHECK] {date_msg}")
         if not date_valid:
-            print("[X] DATE VERIFICATION FAILED - aborting to prevent wrong-date email")
+            logger.error("[X] DATE VERIFICATION FAILED - aborting to prevent wrong-date email")
             return False
 
         week_num = calculate_week_number(monday)
         continuous_week_num = calculate_continuous_week(monday)
 
-        print("\nCrossville Church of Christ - Prayer Schedule Generator")
-        print("VERSION 10 - DAILY EMAIL EDITION")
-        print("=" * 60)
-        print(f"Today: {today_name}, {today.strftime('%B %d, %Y')}")
-        print(f"Week {week_num} ({monday.strftime('%B %d')} - {(monday + timedelta(days=6)).strftime('%B %d, %Y')})")
-        print(f"Continuous week: {continuous_week_num} (cycle position: {(continuous_week_num - 1) % POOL_COUNT})")
-        print(f"\nALL FILES WILL BE SAVED TO: {DESKTOP_DIR}")
+        logger.info(f"\n{tenant.name} - Prayer Schedule Generator")
+        logger.info("VERSION 10 - DAILY EMAIL EDITION")
+        logger.info("=" * 60)
+        logger.info(f"Today: {today_name}, {today.strftime('%B %d, %Y')}")
+        logger.info(f"Week {week_num} ({monday.strftime('%B %d')} - {(monday + timedelta(days=6)).strftime('%B %d, %Y')})")
+        logger.info(f"Continuous week: {continuous_week_num} (cycle position: {table.cycle_position(continuous_week_num)})")
+        logger.info(f"\nALL FILES WILL BE SAVED TO: {output_dir}")
 
         # Generate assignments using the continuous week number to avoid
         # year-boundary discontinuities in the rotation cycle.
-        elder_assignments = assign_families_for_week_v10(continuous_week_num)
+        elder_assignments = table.for_week(continuous_week_num)
 
         # Verify assignments.
-        print("\nVerifying current week assignments...")
-        is_valid, issues = verify_schedule(elder_assignments)
+        logger.info("\nVerifying current week assignments...")
+        is_valid, issues = verify_schedule(
+            elder_assignments, tenant.elder_families, min_families, max_families
+        )
 
         if not is_valid:
-            print("\n[X] VALIDATION FAILED:")
+            logger.error("\n[X] VALIDATION FAILED:")
             for issue in issues:
-                print(f"  - {issue}")
+                logger.error(f"  - {issue}")
             return False
 
-        print("[OK] All verification checks passed!")
+        logger.info("[OK] All verification checks passed!")
 
         # Sanity-check that today's scheduled elder(s) actually have families assigned.
-        schedule_for_today = get_week_schedule(week_num)
+        # Day duties follow the continuous week, like the pool rotation.
+        schedule = get_week_schedule(continuous_week_num, tenant.elder_data)
         today_ok, today_msg = verify_today_elder_assignment(
-            today, schedule_for_today, elder_assignments
+            today, schedule, elder_assignments
         )
-        print(f"[TODAY CHECK] {today_msg}")
+        logger.info(f"[TODAY CHECK] {today_msg}")
         if not today_ok:
-            print("[X] TODAY-ELDER VERIFICATION FAILED — aborting to prevent wrong email")
+            logger.error("[X] TODAY-ELDER VERIFICATION FAILED — aborting to prevent wrong email")
             return False
 
         # Show family counts.
-        print("\nFamily counts:")
+        logger.info("\nFamily counts:")
         total_families_assigned = 0
         for elder, families in elder_assignments.items():
-            print(f"  {elder}: {len(families)} families")
+            logger.info(f"  {elder}: {len(families)} families")
             total_families_assigned += len(families)
 
-        print(f"\nTotal families assigned this week: {total_families_assigned}")
-        print(f"Elders with assignments: {len(elder_assignments)}")
+        logger.info(f"\nTotal families assigned this week: {total_families_assigned}")
+        logger.info(f"Elders with assignments: {len(elder_assignments)}")
 
         # Show today's assignment.
-        schedule = get_week_schedule(week_num)
         todays_elders = schedule.get(today_name, [])
-        print(f"\nToday's prayer assignment ({today_name}):")
+        logger.info(f"\nToday's prayer assignment ({today_name}):")
         for elder in todays_elders:
             families = elder_assignments.get(elder, [])
-            print(f"  {elder}: {len(families)} families")
+            logger.info(f"  {elder}: {len(families)} families")
 
         if is_monday:
             # === MONDAY: Full regeneration ===
-            print("\n--- MONDAY: Full schedule regeneration ---")
+            logger.info("\n--- MONDAY: Full schedule regeneration ---")
 
             # Archive previous week's schedule before generating new one.
-            print("\nArchiving previous schedule...")
-            archive_previous_schedule()
+            logger.info("\nArchiving previous schedule...")
+            archive_previous_schedule(output_dir)
         else:
-            print(f"\n--- {today_name.upper()}: Daily update ---")
+            logger.info(f"\n--- {today_name.upper()}: Daily update ---")
 
         # Generate / refresh content every day (for day highlighting on website).
-        html_content, text_content = generate_schedule_content(
-            week_num, monday, elder_assignments
+        render_cache = RenderCache.for_tenant(tenant, output_dir)
+        html_content, text_content = cached_schedule_content(
+            render_cache, continuous_week_num, week_num, monday,
+            elder_assignments, schedule, tenant.inline_assets, tenant.name,
+        )
+        assets = None if tenant.inline_assets else html_assets()
+        json_content = generate_json_schedule(week_num, monday, elder_assignments, schedule)
+        today_json = generate_json_day(
+            week_num, monday, today_name, elder_assignments, schedule
         )
 
-        print("\nUpdating current week files...")
-        if not update_desktop_files(html_content, text_content):
-            print("\n[WARNING] Some files could not be updated")
+        logger.info("\nUpdating current week files...")
+        if not update_desktop_files(
+            html_content, text_content, output_dir, assets, json_content, today_json
+        ):
+            logger.warning("\n[WARNING] Some files could not be updated")
             return False
+        feed_files: list[str] = []
+        if config.CALENDAR_FEEDS:
+            try:
+                feeds = write_feeds(tenant, table, today, output_dir)
+                logger.info(f"   {feeds.summary()}")
+                feed_files = feeds.files
+            except OSError as exc:
+                logger.warning(f"   [WARNING] Could not write calendar feeds: {exc}")
+        if config.GZIP_LEVEL:
+            precompress(
+                output_dir,
+                [
+                    _CURRENT_HTML_NAME,
+                    _CURRENT_TEXT_NAME,
+                    _CURRENT_JSON_NAME,
+                    _TODAY_JSON_NAME,
+                    *(assets or ()),
+                    *feed_files,
+                ],
+                config.GZIP_LEVEL,
+            )
 
         log_activity(
             "Generated Week " + str(week_num) + " schedule (Monday full run)"
             if is_monday
-            else "Daily update for " + today_name + ", Week " + str(week_num)
+            else "Daily update for " + today_name + ", Week " + str(week_num),
+            output_dir,
         )
 
         # === EVERY DAY: Send one combined email ===
-        if config.EMAIL_ENABLED:
-            print(f"\nSending combined daily email for {today_name}...")
+        if tenant.email.enabled:
+            logger.info(f"\nSending combined daily email for {today_name}...")
             email_ok = send_daily_combined_email(
-                today, week_num, monday, elder_assignments
+                today, week_num, monday, elder_assignments,
+                schedule=schedule, settings=tenant.email, log_dir=output_dir,
+                cache=render_cache, church=tenant.name, site_url=tenant.site_url,
             )
             if not email_ok:
-                print("   [ERROR] Email delivery failed - schedule files were still saved")
+                logger.error("   [ERROR] Email delivery failed - schedule files were still saved")
                 return False
         else:
-            print("\nEmail delivery is disabled (set EMAIL_ENABLED=true to send)")
+            logger.info("\nEmail delivery is disabled (set EMAIL_ENABLED=true to send)")
 
-        print(f"\n[OK] {'Schedule generation' if is_monday else 'Daily update'} complete!")
-        print(f"All files have been saved to: {DESKTOP_DIR}")
+        logger.info(f"\n[OK] {'Schedule generation' if is_monday else 'Daily update'} complete!")
+        logger.info(f"All files have been saved to: {output_dir}")
 
         return True
 
     except Exception as exc:
-        print("\n[CRITICAL ERROR] Unexpected error occurred:")
-        print(f"  {exc}")
-        traceback.print_exc()
+        logger.critical("\n[CRITICAL ERROR] Unexpected error occurred:")
+        logger.critical(f"  {exc}", exc_info=True)
         return False
@@ -8,14 +8,27 @@ This module centralises:
   - Email delivery tuning parameters
   - DESKTOP_DIR / BASE_DIR auto-detection for CI vs. Desktop runs
   - Email credential / recipient configuration loaded from environment
+  - Console log level loaded from environment
 """
 
 from __future__ import annotations
 
+import logging
 import os
+import sys
 from datetime import datetime
+from typing import NamedTuple
 from zoneinfo import ZoneInfo
 
+logger = logging.getLogger(__name__)
+
+
+# ============== Congregation ==============
+# Display name and published site of this repository's church; other
+# congregations set their own on their TenantContext.
+CHURCH_NAME: str = "Crossville Church of Christ"
+SITE_URL: str = "https://vlcosent.github.io/prayer-schedule-automation/"
+
 
 # ============== SMTP ==============
 SMTP_SERVER: str = "smtp.gmail.com"
@@ -72,6 +85,10 @@ EMAIL_RETRY_MAX: int = 3
 
 
 # ============== Output directory auto-detection ==============
+def _is_ci() -> bool:
+    return os.environ.get("CI") == "true" or os.environ.get("GITHUB_ACTIONS") == "true"
+
+
 def _detect_desktop_dir() -> str:
     """Return the best-effort output directory.
 
@@ -81,14 +98,9 @@ def _detect_desktop_dir() -> str:
     finally the current working directory.
     """
     try:
-        is_ci = (
-            os.environ.get("CI") == "true"
-            or os.environ.get("GITHUB_ACTIONS") == "true"
-        )
-
-        if is_ci:
+        if _is_ci():
             desktop_dir = os.getcwd()
-            print(f"CI environment detected. Using current directory: {desktop_dir}")
+            logger.info(f"CI environment detected. Using current directory: {desktop_dir}")
             return desktop_dir
 
         desktop_dir = os.path.expanduser("~/Desktop")
@@ -96,13 +108,13 @@ def _detect_desktop_dir() -> str:
             desktop_dir = os.path.join(os.environ.get("USERPROFILE", ""), "Desktop")
             if not os.path.exists(desktop_dir):
                 desktop_dir = os.getcwd()
-                print(
+                logger.warning(
                     f"Warning: Could not find desktop, using current directory: {desktop_dir}"
                 )
         return desktop_dir
     except Exception:
         fallback = os.getcwd()
-        print(f"Warning: Could not find desktop, using current directory: {fallback}")
+        logger.warning(f"Warning: Could not find desktop, using current directory: {fallback}")
         return fallback
 
 
@@ -110,8 +122,83 @@ DESKTOP_DIR: str = _detect_desktop_dir()
 BASE_DIR: str = DESKTOP_DIR
 
 
+# ============== Website assets ==============
+# The desktop copy embeds its stylesheet and script so the single file opens
+# anywhere; the published (CI) page links shared, content-hashed copies under
+# ``assets/`` so browsers keep them across the hourly refresh. Override with
+# PRAYER_SCHEDULE_INLINE_ASSETS=true/false.
+INLINE_ASSETS: bool = (
+    os.environ.get("PRAYER_SCHEDULE_INLINE_ASSETS", "false" if _is_ci() else "true").lower()
+    == "true"
+)
+
+# ============== Precompressed artifacts ==============
+# Published files get ``<name>.gz`` siblings for static hosts and mirrors
+# that serve precompressed content. PRAYER_SCHEDULE_GZIP_LEVEL sets the
+# level (1-9); 0 turns it off, the default outside CI.
+
+
+def _gzip_level() -> int:
+    raw = os.environ.get("PRAYER_SCHEDULE_GZIP_LEVEL", "9" if _is_ci() else "0")
+    try:
+        level = int(raw)
+    except ValueError:
+        level = -1
+    if not 0 <= level <= 9:
+        logger.warning(f"Ignoring PRAYER_SCHEDULE_GZIP_LEVEL={raw!r}; expected 0-9")
+        return 0
+    return level
+
+
+GZIP_LEVEL: int = _gzip_level()
+
+# ============== Calendar feeds ==============
+# iCalendar feeds per elder and for the congregation under ``calendar/``.
+# Published from CI by default; PRAYER_SCHEDULE_CALENDAR_FEEDS=true/false
+# overrides.
+CALENDAR_FEEDS: bool = (
+    os.environ.get("PRAYER_SCHEDULE_CALENDAR_FEEDS", "true" if _is_ci() else "false").lower()
+    == "true"
+)
+
 # ============== Email credentials (from environment) ==============
 EMAIL_ENABLED: bool = os.environ.get("EMAIL_ENABLED", "false").lower() == "true"
 SENDER_EMAIL: str = os.environ.get("SENDER_EMAIL", "churchprayerlistelders@gmail.com")
 SENDER_PASSWORD: str = os.environ.get("SENDER_PASSWORD", "")
 RECIPIENT_EMAILS: str = os.environ.get("RECIPIENT_EMAILS", "")
+
+
+# ============== Console logging ==============
+# Level for the package's console output (see prayer_schedule.log). "WARNING"
+# keeps bulk and CI runs quiet; "DEBUG" adds per-call detail from hot paths.
+LOG_LEVEL: str = os.environ.get("PRAYER_SCHEDULE_LOG_LEVEL", "INFO").upper()
+if LOG_LEVEL not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+    LOG_LEVEL = "INFO"
+
+
+class EmailSettings(NamedTuple):
+    """SMTP delivery settings for one congregation.
+
+    :meth:`from_config` snapshots the module-level values above at call
+    time, so tests that monkeypatch ``config.SENDER_PASSWORD`` etc. still
+    take effect.
+    """
+
+    enabled: bool
+    sender_email: str
+    sender_password: str
+    recipient_emails: str
+    smtp_server: str = SMTP_SERVER
+    smtp_port: int = SMTP_PORT
+
+    @classmethod
+    def from_config(cls) -> "EmailSettings":
+        module = sys.modules[__name__]
+        return cls(
+            enabled=module.EMAIL_ENABLED,
+            sender_email=module.SENDER_EMAIL,
+            sender_password=module.SENDER_PASSWORD,
+            recipient_emails=module.RECIPIENT_EMAILS,
+            smtp_server=module.SMTP_SERVER,
+            smtp_port=module.SMTP_PORT,
+        )
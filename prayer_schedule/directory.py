@@ -4,13 +4,19 @@ The complete 161-family directory is embedded as a Python string constant so
 the project remains a zero-dependency, single-repository deliverable.
 ``parse_directory`` converts the CSV into a sorted list of ``"Last, First"``
 strings and performs defensive validation (missing columns, blank names,
-duplicates).
+duplicates). :class:`FamilyRegistry` interns those strings as dense integer
+IDs so the algorithm and validation layers can hash and compare small ints
+and resolve names only when rendering.
 """
 
 from __future__ import annotations
 
 import csv
+from array import array
+from dataclasses import dataclass
 from io import StringIO
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
 
 
 # Church Directory CSV - All 161 families
@@ -254,3 +260,58 @@ def parse_directory(csv_content: str | None = None) -> list[str]:
         )
 
     return sorted(all_families)
+
+
+@dataclass(frozen=True)
+class FamilyRegistry:
+    """Interned family strings with dense integer IDs.
+
+    IDs are positions in the sorted family list, so ``names[family_id]``
+    resolves an ID and the ID order matches :func:`parse_directory` order.
+    Encoded collections use ``array('I')`` (4 bytes per family).
+    """
+
+    names: tuple[str, ...]
+    ids: Mapping[str, int]
+
+    @classmethod
+    def from_families(cls, families: Iterable[str]) -> "FamilyRegistry":
+        """Intern ``families`` (sorted, duplicates collapsed)."""
+        names = tuple(sorted(set(families)))
+        ids = {name: family_id for family_id, name in enumerate(names)}
+        return cls(names=names, ids=MappingProxyType(ids))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id_of(self, family: str) -> int:
+        """Return the ID of ``family``; raises :class:`ValueError` if unknown."""
+        try:
+            return self.ids[family]
+        except KeyError:
+            raise ValueError(f"family not in registry: {family!r}") from None
+
+    def encode(self, families: Iterable[str]) -> array:
+        """Return ``families`` as an ``array('I')`` of IDs, preserving order."""
+        ids = self.ids
+        try:
+            return array("I", [ids[family] for family in families])
+        except KeyError as exc:
+            raise ValueError(f"family not in registry: {exc.args[0]!r}") from None
+
+    def decode(self, family_ids: Iterable[int]) -> list[str]:
+        """Resolve IDs back to family strings, preserving order."""
+        names = self.names
+        return [names[family_id] for family_id in family_ids]
+
+
+# Module-level cache so the live directory is interned once per process.
+_FAMILY_REGISTRY: Optional[FamilyRegistry] = None
+
+
+def get_family_registry() -> FamilyRegistry:
+    """Return the cached :class:`FamilyRegistry` for :data:`DIRECTORY_CSV`."""
+    global _FAMILY_REGISTRY
+    if _FAMILY_REGISTRY is None:
+        _FAMILY_REGISTRY = FamilyRegistry.from_families(parse_directory())
+    return _FAMILY_REGISTRY
@@ -1,24 +1,36 @@
-"""Elder data and the static weekly day-to-elder schedule.
+"""Elder data and the weekly day-to-elder schedule.
 
 ``ELDER_DATA`` is the single source of truth for the 7 church elders. The
 derived ``ELDERS`` list, ``ELDER_FAMILIES`` mapping, and ``get_week_schedule``
 function are all built from this list, so adding or removing an elder only
 requires editing ``ELDER_DATA`` (and the reassignment map in ``algorithm.py``).
+:class:`DaySchedule` turns a roster into per-week day -> elders mappings,
+cached per :func:`roster_version`.
 """
 
 from __future__ import annotations
 
-from typing import TypedDict
+import hashlib
+import json
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, NotRequired, Optional, Sequence, TypedDict
 
 from .config import DAYS_OF_WEEK
 
 
 class ElderRecord(TypedDict):
-    """Shape of each entry in :data:`ELDER_DATA`."""
+    """Shape of each entry in :data:`ELDER_DATA`.
+
+    ``days`` lists the weekday(s) the elder always prays on. An elder with
+    ``floating: True`` has no fixed day (``days`` must then be empty) and
+    :class:`DaySchedule` rotates them across the week instead.
+    """
 
     name: str
     family: str
     days: list[str]
+    floating: NotRequired[bool]
 
 
 # Elder roster: name, their own family string, and the day(s) of the week they
@@ -43,16 +55,115 @@ ELDERS: list[str] = [e["name"] for e in ELDER_DATA]
 ELDER_FAMILIES: dict[str, str] = {e["name"]: e["family"] for e in ELDER_DATA}
 
 
-def get_week_schedule(week_number: int) -> dict[str, list[str]]:
-    """Return the static day-to-elder mapping.
+def is_floating(elder: ElderRecord) -> bool:
+    """Return True if ``elder`` is marked ``floating`` (see :class:`DaySchedule`)."""
+    return bool(elder.get("floating"))
+
+
+def roster_entry(elder: ElderRecord) -> list:
+    """Return ``elder`` as a JSON-ready list for content hashing.
+
+    The floating marker is only appended when set, so hashes of fixed-day
+    rosters are the same as before the flag existed.
+    """
+    entry = [elder["name"], elder["family"], list(elder["days"])]
+    if is_floating(elder):
+        entry.append("floating")
+    return entry
+
+
+def roster_version(elder_data: Sequence[ElderRecord]) -> str:
+    """Return a short content hash identifying ``elder_data``.
 
-    Although ``week_number`` is accepted for forward compatibility, the
-    schedule is currently fixed (each day of the week has a single
-    assigned elder). The result is a mapping from day name
-    ("Monday".."Sunday") to an ordered list of elder names.
+    Any change to a name, family, day list or floating flag yields a new
+    version, so the version is a safe cache key for everything derived from
+    the roster.
     """
-    schedule: dict[str, list[str]] = {day: [] for day in DAYS_OF_WEEK}
-    for elder in ELDER_DATA:
-        for day in elder["days"]:
-            schedule[day].append(elder["name"])
+    canonical = json.dumps(
+        [roster_entry(e) for e in elder_data],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class DaySchedule:
+    """Precomputed day -> elders mapping for every week of one roster.
+
+    Elders are *fixed* to the days in their ``days`` list every week;
+    several elders may share a day and one elder may cover several.
+    Elders marked ``floating`` have no fixed day: the ``j``-th floating elder
+    (roster order) prays on day ``(j + week_number - 1) % 7``, so large
+    rosters spread evenly across the week and every floating elder visits
+    every weekday over a 7-week period. ``weeks`` holds one read-only
+    mapping per week of that period (a single one when nobody floats).
+    """
+
+    version: str
+    weeks: tuple[Mapping[str, tuple[str, ...]], ...]
+
+    @classmethod
+    def build(cls, elder_data: Sequence[ElderRecord]) -> "DaySchedule":
+        day_count = len(DAYS_OF_WEEK)
+        period = day_count if any(is_floating(e) for e in elder_data) else 1
+        weeks = []
+        for phase in range(period):
+            schedule: dict[str, list[str]] = {day: [] for day in DAYS_OF_WEEK}
+            slot = 0
+            for elder in elder_data:
+                if is_floating(elder):
+                    schedule[DAYS_OF_WEEK[(slot + phase) % day_count]].append(elder["name"])
+                    slot += 1
+                else:
+                    for day in elder["days"]:
+                        schedule[day].append(elder["name"])
+            weeks.append(MappingProxyType(
+                {day: tuple(elders) for day, elders in schedule.items()}
+            ))
+        return cls(version=roster_version(elder_data), weeks=tuple(weeks))
+
+    def for_week(self, week_number: int) -> Mapping[str, tuple[str, ...]]:
+        """Return the read-only day -> elders mapping for ``week_number``."""
+        return self.weeks[(week_number - 1) % len(self.weeks)]
+
+    def days_for(self, week_number: int, elder: str) -> list[str]:
+        """Return the days ``elder`` prays in ``week_number`` (Monday first)."""
+        return [day for day, elders in self.for_week(week_number).items() if elder in elders]
+
+
+# Built schedules keyed by :func:`roster_version`.
+_DAY_SCHEDULES: dict[str, DaySchedule] = {}
+
+
+def get_day_schedule(elder_data: Optional[Sequence[ElderRecord]] = None) -> DaySchedule:
+    """Return the cached :class:`DaySchedule` for ``elder_data`` (default: :data:`ELDER_DATA`).
+
+    The cache is keyed by content, so editing the roster (or patching
+    ``ELDER_DATA`` in a test) picks up a fresh schedule automatically.
+    """
+    if elder_data is None:
+        elder_data = ELDER_DATA
+    version = roster_version(elder_data)
+    schedule = _DAY_SCHEDULES.get(version)
+    if schedule is None:
+        schedule = _DAY_SCHEDULES[version] = DaySchedule.build(elder_data)
     return schedule
+
+
+def get_week_schedule(
+    week_number: int,
+    elder_data: Optional[Sequence[ElderRecord]] = None,
+) -> dict[str, list[str]]:
+    """Return the day-to-elder mapping for ``week_number``.
+
+    The result maps each day name ("Monday".."Sunday") to an ordered list
+    of elder names, taken from the cached :func:`get_day_schedule` for
+    ``elder_data`` (default: :data:`ELDER_DATA`). With the live roster every
+    elder has a fixed day, so every week yields the same mapping. A fresh
+    dict is returned on each call, so callers may mutate it.
+    """
+    return {
+        day: list(elders)
+        for day, elders in get_day_schedule(elder_data).for_week(week_number).items()
+    }
@@ -10,21 +10,27 @@ contains:
 
 from __future__ import annotations
 
+import logging
 import re
 import smtplib
 import time
-import traceback
 from datetime import datetime, timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formatdate, make_msgid
+from typing import Mapping, Optional, Sequence
 
 from . import config
+from .algorithm import calculate_continuous_week
 from .elders import get_week_schedule
 from .file_io import log_activity
-from .utils import escape_html
+from .output import DAYS
+from .render_cache import RenderCache
+from .utils import escape_attr, escape_html
 from .validation import verify_email_date
 
+logger = logging.getLogger(__name__)
+
 
 # Minimal address shape check; intentionally permissive (no RFC 5322 horror).
 # Goal: reject obvious typos like "not-an-email" or "@bad.com" before SMTP.
@@ -100,6 +106,31 @@ def _email_styles() -> dict[str, str]:
     }
 
 
+_EMAIL_DAY_PILL = (
+    '<div style="{pill_style}">{abbrev}<span style="{label_style}">{label}</span></div>\n'
+)
+
+_EMAIL_TODAY_BLOCK = """
+        <div style="{block_style}">
+            <p style="{name_style}">{elder}</p>
+            <p style="{count_style}">{count} families</p>
+            {families}
+        </div>"""
+
+_EMAIL_TABLE_ROW = """<tr>
+            <td style="{td_first}">{arrow}<strong>{day}</strong></td>
+            <td style="{td_rest}">{date}</td>
+            <td style="{td_rest}">{elders}</td>
+        </tr>"""
+
+_EMAIL_WEEK_BLOCK = """
+                <div style="{block_style}">
+                    <p style="{name_style}">{elder} &mdash; {day}, {date}</p>
+                    <p style="{count_style}">{count} families</p>
+                    {families}
+                </div>"""
+
+
 def _build_combined_email_html(
     today: datetime,
     today_name: str,
@@ -107,6 +138,8 @@ def _build_combined_email_html(
     monday: datetime,
     schedule: dict[str, list[str]],
     elder_assignments: dict[str, list[str]],
+    church: str = config.CHURCH_NAME,
+    site_url: Optional[str] = config.SITE_URL,
 ) -> str:
     """Return the full combined daily email as an HTML string.
 
@@ -118,7 +151,9 @@ def _build_combined_email_html(
       4. Today's families: Elder block(s) with numbered family lists
       5. Week schedule table: All 7 days, today's row highlighted with orange accent
       6. On Mondays only: Full prayer lists for every elder that week
-      7. Footer: Link to view full schedule online
+      7. Footer: Link to view full schedule online (when ``site_url`` is set)
+
+    ``church`` names the congregation in the header and footer.
     """
     s = _email_styles()
     is_monday = today.weekday() == 0
@@ -134,10 +169,18 @@ def _build_combined_email_html(
     for elder in todays_elders:
         today_family_count += len(elder_assignments.get(elder, []))
 
+    def family_list(families: Sequence[str]) -> str:
+        style = s['family_item']
+        return "".join([
+            f'<div style="{style}">{j}. {escape_html(family)}</div>\n'
+            for j, family in enumerate(families, 1)
+        ])
+
+    dates = [monday + timedelta(days=offset) for offset in range(7)]
+
     # --- Day navigation pills (matches website day-nav bar) ---
-    day_pills = ""
-    current_date = monday
-    for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
+    pills = []
+    for day, current_date in zip(DAYS, dates):
         is_today_pill = (day == today_name)
         is_past = (current_date < today and not is_today_pill)
 
@@ -151,32 +194,30 @@ def _build_combined_email_html(
             pill_style = s['day_pill']
             label_style = s['day_pill_label']
 
-        day_pills += f'<div style="{pill_style}">{day[:3]}<span style="{label_style}">{current_date.strftime("%b %d")}</span></div>\n'
-        current_date += timedelta(days=1)
+        pills.append(_EMAIL_DAY_PILL.format(
+            pill_style=pill_style,
+            abbrev=day[:3],
+            label_style=label_style,
+            label=current_date.strftime("%b %d"),
+        ))
+    day_pills = "".join(pills)
 
     # --- Today's prayer list sections ---
-    today_prayer_sections = ""
-    for elder in todays_elders:
-        families = elder_assignments.get(elder, [])
-        family_list = ""
-        for j, family in enumerate(families, 1):
-            family_list += f'<div style="{s["family_item"]}">{j}. {escape_html(family)}</div>\n'
-
-        today_prayer_sections += f"""
-        <div style="{s['elder_block_today']}">
-            <p style="{s['elder_name']}">{escape_html(elder)}</p>
-            <p style="{s['elder_count']}">{len(families)} families</p>
-            {family_list}
-        </div>"""
+    today_prayer_sections = "".join([
+        _EMAIL_TODAY_BLOCK.format(
+            block_style=s['elder_block_today'],
+            name_style=s['elder_name'],
+            elder=escape_html(elder),
+            count_style=s['elder_count'],
+            count=len(elder_assignments.get(elder, [])),
+            families=family_list(elder_assignments.get(elder, [])),
+        )
+        for elder in todays_elders
+    ])
 
     # --- Week schedule table ---
-    table_rows = ""
-    current_date = monday
-    for i, day in enumerate(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]):
-        elders = schedule[day]
-        elder_names_row = " &amp; ".join(escape_html(e) for e in elders)
-        date_str = current_date.strftime('%b %d')
-
+    rows = []
+    for i, (day, current_date) in enumerate(zip(DAYS, dates)):
         is_today = (day == today_name)
         if is_today:
             # First cell gets left border accent; inner cells get same style without border.
@@ -189,36 +230,44 @@ def _build_combined_email_html(
             td_first = s['td']
             td_rest = s['td']
 
-        arrow = "&#9654; " if is_today else ""
-        table_rows += f"""<tr>
-            <td style="{td_first}">{arrow}<strong>{day}</strong></td>
-            <td style="{td_rest}">{date_str}</td>
-            <td style="{td_rest}">{elder_names_row}</td>
-        </tr>"""
-        current_date += timedelta(days=1)
+        rows.append(_EMAIL_TABLE_ROW.format(
+            td_first=td_first,
+            td_rest=td_rest,
+            arrow="&#9654; " if is_today else "",
+            day=day,
+            date=current_date.strftime('%b %d'),
+            elders=" &amp; ".join(escape_html(e) for e in schedule[day]),
+        ))
+    table_rows = "".join(rows)
 
     # --- Monday-only: full prayer lists for all elders ---
     full_prayer_lists = ""
     if is_monday:
-        full_prayer_lists += f'<p style="{s["section_label"]}">ALL PRAYER LISTS THIS WEEK</p>'
-        current_date = monday
-        for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
-            elders = schedule[day]
-            for elder in elders:
+        sections = [f'<p style="{s["section_label"]}">ALL PRAYER LISTS THIS WEEK</p>']
+        for day, current_date in zip(DAYS, dates):
+            date_str = current_date.strftime('%b %d')
+            for elder in schedule[day]:
                 families = elder_assignments.get(elder, [])
-                date_str = current_date.strftime('%b %d')
-                family_list = ""
-                for j, family in enumerate(families, 1):
-                    family_list += f'<div style="{s["family_item"]}">{j}. {escape_html(family)}</div>\n'
-
-                full_prayer_lists += f"""
-                <div style="{s['elder_block']}">
-                    <p style="{s['elder_name']}">{escape_html(elder)} &mdash; {day}, {date_str}</p>
-                    <p style="{s['elder_count']}">{len(families)} families</p>
-                    {family_list}
-                </div>"""
-            current_date += timedelta(days=1)
-        full_prayer_lists += f'<div style="{s["divider"]}"></div>'
+                sections.append(_EMAIL_WEEK_BLOCK.format(
+                    block_style=s['elder_block'],
+                    name_style=s['elder_name'],
+                    elder=escape_html(elder),
+                    day=day,
+                    date=date_str,
+                    count_style=s['elder_count'],
+                    count=len(families),
+                    families=family_list(families),
+                ))
+        sections.append(f'<div style="{s["divider"]}"></div>')
+        full_prayer_lists = "".join(sections)
+
+    church_html = escape_html(church)
+    site_link = ""
+    if site_url:
+        site_link = (
+            f'<a href="{escape_attr(site_url)}" style="{s["footer_link"]}">'
+            "View Full Schedule Online</a>\n        "
+        )
 
     html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -229,7 +278,7 @@ def _build_combined_email_html(
 
     <!-- Header -->
     <div style="{s['header']}">
-        <h1 style="{s['header_h1']}">Crossville Church of Christ</h1>
+        <h1 style="{s['header_h1']}">{church_html}</h1>
         <h2 style="{s['header_h2']}">Daily Prayer Reminder</h2>
         <p style="{s['header_sub']}">{today.strftime('%A, %B %d, %Y')}: {elder_names_display} &mdash; Week {week_num}</p>
     </div>
@@ -273,8 +322,7 @@ def _build_combined_email_html(
 
     <!-- Footer -->
     <div style="{s['footer']}">
-        <a href="https://vlcosent.github.io/prayer-schedule-automation/" style="{s['footer_link']}">View Full Schedule Online</a>
-        <p style="{s['footer_text']}">Crossville Church of Christ &bull; Elder Prayer List</p>
+        {site_link}<p style="{s['footer_text']}">{church_html} &bull; Elder Prayer List</p>
     </div>
 
 </div>
@@ -288,7 +336,13 @@ def send_daily_combined_email(
     today: datetime,
     week_num: int,
     monday: datetime,
-    elder_assignments: dict[str, list[str]],
+    elder_assignments: Mapping[str, Sequence[str]],
+    schedule: Optional[Mapping[str, Sequence[str]]] = None,
+    settings: Optional[config.EmailSettings] = None,
+    log_dir: Optional[str] = None,
+    cache: Optional[RenderCache] = None,
+    church: str = config.CHURCH_NAME,
+    site_url: Optional[str] = config.SITE_URL,
 ) -> bool:
     """Send ONE combined daily email with today's prayer assignment + week overview.
 
@@ -299,37 +353,47 @@ def send_daily_combined_email(
     * Week-at-a-glance schedule table (today's row highlighted)
     * On Mondays only: full prayer lists for all elders that week
 
+    ``schedule`` defaults to :func:`get_week_schedule` for the continuous
+    week of ``monday``, ``settings`` to
+    :meth:`EmailSettings.from_config`, and activity-log lines go to
+    ``log_dir`` (default: :data:`DESKTOP_DIR`). With a ``cache``, the HTML
+    body is reused from an earlier run on the same day. ``church`` and
+    ``site_url`` brand the message (see :func:`_build_combined_email_html`).
+
     Returns ``True`` when at least one recipient received the email.
     """
-    if not config.EMAIL_ENABLED:
-        print("   [INFO] Email is disabled (EMAIL_ENABLED not set to 'true')")
+    if settings is None:
+        settings = config.EmailSettings.from_config()
+
+    if not settings.enabled:
+        logger.info("   [INFO] Email is disabled (EMAIL_ENABLED not set to 'true')")
         return False
 
-    if not config.SENDER_PASSWORD:
-        print("   [WARNING] Email password not configured (SENDER_PASSWORD not set)")
-        print("   [INFO] Skipping email delivery")
+    if not settings.sender_password:
+        logger.warning("   [WARNING] Email password not configured (SENDER_PASSWORD not set)")
+        logger.info("   [INFO] Skipping email delivery")
         return False
 
     try:
         # Parse recipient emails and filter out malformed entries so a typo
         # in RECIPIENT_EMAILS doesn't cause the SMTP server to silently bounce.
         raw_recipients = [
-            email.strip() for email in config.RECIPIENT_EMAILS.split(',') if email.strip()
+            email.strip() for email in settings.recipient_emails.split(',') if email.strip()
         ]
         recipients = [e for e in raw_recipients if _EMAIL_RX.match(e)]
         for bad in raw_recipients:
             if bad not in recipients:
-                print(f"   [WARNING] Skipping malformed recipient address: {bad!r}")
+                logger.warning(f"   [WARNING] Skipping malformed recipient address: {bad!r}")
 
         if not recipients:
-            print("   [ERROR] No valid recipient addresses to send to")
+            logger.error("   [ERROR] No valid recipient addresses to send to")
             return False
 
         # Verify the date is correct before composing the email.
         date_valid, date_msg = verify_email_date(today, monday)
-        print(f"   [DATE CHECK] {date_msg}")
+        logger.info(f"   [DATE CHECK] {date_msg}")
         if not date_valid:
-            print("   [X] DATE VERIFICATION FAILED - not sending email")
+            logger.error("   [X] DATE VERIFICATION FAILED - not sending email")
             return False
 
         # Determine today's day name.
@@ -338,11 +402,12 @@ def send_daily_combined_email(
         today_formatted = today.strftime('%A, %B %d, %Y')
 
         # Get today's schedule.
-        schedule = get_week_schedule(week_num)
+        if schedule is None:
+            schedule = get_week_schedule(calculate_continuous_week(monday))
         todays_elders = schedule.get(today_name, [])
 
         if not todays_elders:
-            print(f"   [INFO] No elders assigned for {today_name} - skipping email")
+            logger.info(f"   [INFO] No elders assigned for {today_name} - skipping email")
             return False
 
         elder_names = " & ".join(todays_elders)
@@ -378,7 +443,7 @@ def send_daily_combined_email(
             f"Daily Prayer Reminder - {today_formatted}: {elder_names}",
             "subject",
         )
-        plain_body = f"""Crossville Church of Christ
+        plain_body = f"""{church}
 Daily Prayer Reminder - {today_formatted}: {elder_names}
 Week {week_num} ({date_range})
 
@@ -386,12 +451,24 @@ Today's Elder: {elder_names}
 {elder_details}
 {week_overview}
 Please keep these families in your prayers.
-
-View the full schedule online: https://vlcosent.github.io/prayer-schedule-automation/
 """
-        html_body = _build_combined_email_html(
-            today, today_name, week_num, monday, schedule, elder_assignments
-        )
+        if site_url:
+            plain_body += f"\nView the full schedule online: {site_url}\n"
+        if cache is None:
+            html_body = _build_combined_email_html(
+                today, today_name, week_num, monday, schedule, elder_assignments,
+                church, site_url,
+            )
+        else:
+            html_body = cache.fetch(
+                "email",
+                calculate_continuous_week(monday),
+                today_name,
+                lambda: {"html": _build_combined_email_html(
+                    today, today_name, week_num, monday, schedule, elder_assignments,
+                    church, site_url,
+                )},
+            )["html"]
 
         # Connect to Gmail SMTP server with retry for transient failures.
         max_retries = config.EMAIL_RETRY_MAX
@@ -399,36 +476,42 @@ View the full schedule online: https://vlcosent.github.io/prayer-schedule-automa
         server: smtplib.SMTP | None = None
         for attempt in range(1, max_retries + 1):
             try:
-                print(f"   [EMAIL] Connecting to {config.SMTP_SERVER}:{config.SMTP_PORT} (attempt {attempt}/{max_retries})...")
-                print(f"   [EMAIL] Email date: {today_formatted}")
+                logger.info(f"   [EMAIL] Connecting to {settings.smtp_server}:{settings.smtp_port} (attempt {attempt}/{max_retries})...")
+                logger.info(f"   [EMAIL] Email date: {today_formatted}")
                 server = smtplib.SMTP(
-                    config.SMTP_SERVER,
-                    config.SMTP_PORT,
+                    settings.smtp_server,
+                    settings.smtp_port,
                     timeout=config.EMAIL_CONNECT_TIMEOUT,
                 )
                 server.starttls()
-                print(f"   [EMAIL] Logging in as {config.SENDER_EMAIL}...")
-                server.login(config.SENDER_EMAIL, config.SENDER_PASSWORD)
+                logger.info(f"   [EMAIL] Logging in as {settings.sender_email}...")
+                server.login(settings.sender_email, settings.sender_password)
                 break  # Connected successfully.
 
             except smtplib.SMTPAuthenticationError as exc:
-                print(f"   [ERROR] Email authentication failed: {exc}")
-                print("   [INFO] Please verify SENDER_PASSWORD is a valid Gmail App Password")
-                log_activity(f"Email FAILED (auth error): {exc}")
+                logger.error(f"   [ERROR] Email authentication failed: {exc}")
+                logger.info("   [INFO] Please verify SENDER_PASSWORD is a valid Gmail App Password")
+                log_activity(f"Email FAILED (auth error): {exc}", log_dir)
                 return False
             except (smtplib.SMTPException, OSError) as exc:
                 last_error = exc
-                print(f"   [WARNING] Connection attempt {attempt} failed: {exc}")
+                logger.warning(f"   [WARNING] Connection attempt {attempt} failed: {exc}")
                 if attempt < max_retries:
                     wait = 2 ** attempt  # 2s, 4s.
-                    print(f"   [INFO] Retrying in {wait}s...")
+                    logger.info(f"   [INFO] Retrying in {wait}s...")
                     time.sleep(wait)
         else:
             # All connection retries exhausted.
-            print(f"   [ERROR] SMTP connection failed after {max_retries} attempts: {last_error}")
-            log_activity(f"Email FAILED (connection) after {max_retries} attempts: {last_error}")
+            logger.error(f"   [ERROR] SMTP connection failed after {max_retries} attempts: {last_error}")
+            log_activity(f"Email FAILED (connection) after {max_retries} attempts: {last_error}", log_dir)
             return False
 
+        # Explicit utf-8 so non-ASCII names (e.g., José) don't trip the
+        # default us-ascii encoder. The bodies are encoded once and the same
+        # parts are attached to every recipient's message.
+        plain_part = MIMEText(plain_body, 'plain', 'utf-8')
+        html_part = MIMEText(html_body, 'html', 'utf-8')
+
         # Send individually to each recipient for better deliverability.
         succeeded: list[str] = []
         failed: list[str] = []
@@ -436,53 +519,53 @@ View the full schedule online: https://vlcosent.github.io/prayer-schedule-automa
             for recipient in recipients:
                 try:
                     msg = MIMEMultipart('alternative')
-                    msg['From'] = _reject_crlf(config.SENDER_EMAIL, "SENDER_EMAIL")
+                    msg['From'] = _reject_crlf(settings.sender_email, "SENDER_EMAIL")
                     msg['To'] = _reject_crlf(recipient, "recipient")
                     msg['Subject'] = subject
                     msg['Date'] = formatdate(localtime=True)
                     msg['Message-ID'] = make_msgid(domain='gmail.com')
-                    msg['Reply-To'] = config.SENDER_EMAIL
+                    msg['Reply-To'] = settings.sender_email
                     # Gmail & RFC 8058 best practice: machine-readable unsubscribe
                     # endpoint. "mailto:" form works everywhere; the sender then
                     # removes the address from RECIPIENT_EMAILS manually. Keeps us
                     # out of spam folders and satisfies Gmail's 2024 bulk-sender
                     # requirements.
-                    msg['List-Unsubscribe'] = f'<mailto:{config.SENDER_EMAIL}?subject=Unsubscribe>'
+                    msg['List-Unsubscribe'] = f'<mailto:{settings.sender_email}?subject=Unsubscribe>'
                     msg['List-Unsubscribe-Post'] = 'List-Unsubscribe=One-Click'
-                    msg['X-Mailer'] = 'Crossville-CoC-Prayer-Schedule/1.0'
+                    msg['X-Mailer'] = 'Prayer-Schedule/1.0'
 
-                    # Explicit utf-8 so non-ASCII names (e.g., José) don't trip
-                    # the default us-ascii encoder.
-                    msg.attach(MIMEText(plain_body, 'plain', 'utf-8'))
-                    msg.attach(MIMEText(html_body, 'html', 'utf-8'))
+                    msg.attach(plain_part)
+                    msg.attach(html_part)
 
                     assert server is not None  # narrows type for mypy
                     server.send_message(msg)
                     succeeded.append(recipient)
-                    print(f"   [OK] Sent to {recipient}")
+                    logger.info(f"   [OK] Sent to {recipient}")
                 except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError) as exc:
                     failed.append(recipient)
-                    print(f"   [WARNING] Failed to send to {recipient}: {exc}")
+                    logger.warning(f"   [WARNING] Failed to send to {recipient}: {exc}")
         finally:
             if server is not None:
                 server.quit()
 
         # Report results.
         if failed:
-            print(f"   [WARNING] Failed recipients ({len(failed)}): {', '.join(failed)}")
+            logger.warning(f"   [WARNING] Failed recipients ({len(failed)}): {', '.join(failed)}")
             log_activity(
                 f"Email partially sent for {today_name}, {today.strftime('%B %d, %Y')}: "
-                f"{len(succeeded)} succeeded, {len(failed)} failed ({', '.join(failed)})"
+                f"{len(succeeded)} succeeded, {len(failed)} failed ({', '.join(failed)})",
+                log_dir,
             )
         if succeeded:
-            print(
+            logger.info(
                 f"   [OK] Daily email sent for {today_name}, {today.strftime('%B %d, %Y')} "
                 f"to {len(succeeded)} of {len(recipients)} recipient(s)"
             )
             if not failed:
                 log_activity(
                     f"Email sent for {today_name}, {today.strftime('%B %d, %Y')} "
-                    f"to {len(succeeded)} recipient(s)"
+                    f"to {len(succeeded)} recipient(s)",
+                    log_dir,
                 )
             # Partial success returns True so the workflow records this date
             # as "sent" and won't re-fire. Failed addresses (logged above) are
@@ -490,12 +573,11 @@ View the full schedule online: https://vlcosent.github.io/prayer-schedule-automa
             # RECIPIENT_EMAILS rather than letting the retry loop hammer Gmail.
             return True
         else:
-            print(f"   [ERROR] Email delivery failed for all {len(recipients)} recipients")
-            log_activity(f"Email FAILED for all recipients on {today_name}, {today.strftime('%B %d, %Y')}")
+            logger.error(f"   [ERROR] Email delivery failed for all {len(recipients)} recipients")
+            log_activity(f"Email FAILED for all recipients on {today_name}, {today.strftime('%B %d, %Y')}", log_dir)
             return False
 
     except Exception as exc:
-        print(f"   [ERROR] Failed to send email: {exc}")
-        traceback.print_exc()
-        log_activity(f"Email FAILED (unexpected error): {exc}")
+        logger.error(f"   [ERROR] Failed to send email: {exc}", exc_info=True)
+        log_activity(f"Email FAILED (unexpected error): {exc}", log_dir)
         return False
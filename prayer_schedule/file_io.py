@@ -1,25 +1,55 @@
-"""File system I/O helpers: atomic writes, schedule archiving, and logging."""
+"""File system I/O helpers: atomic writes, schedule archiving, precompression, and logging."""
 
 from __future__ import annotations
 
+import filecmp
+import gzip
+import hashlib
+import json
+import logging
 import os
 import re
 import shutil
-import sys
 from datetime import datetime
+from typing import Iterable, Mapping, Optional, Union
 
 from .config import CENTRAL_TZ, DESKTOP_DIR
+from .output import ASSET_DIR
+
+logger = logging.getLogger(__name__)
 
 
 _CURRENT_HTML_NAME: str = "Prayer_Schedule_Current_Week.html"
 _CURRENT_TEXT_NAME: str = "Prayer_Schedule_Current_Week.txt"
+_CURRENT_JSON_NAME: str = "Prayer_Schedule_Current_Week.json"
+_TODAY_JSON_NAME: str = "Prayer_Schedule_Today.json"
 _LOG_FILE_NAME: str = "prayer_schedule_log.txt"
 _ARCHIVE_SUBDIR: str = "archive"
-
-
-def _atomic_write(path: str, content: str) -> None:
+_CALENDAR_SUBDIR: str = "calendar"
+_LANDING_PAGE_NAME: str = "index.html"
+PRECOMPRESS_MANIFEST_NAME: str = "precompress_manifest.json"
+# Text formats worth a ``.gz`` sibling; everything else is served as is.
+_PRECOMPRESS_SUFFIXES: tuple[str, ...] = (".html", ".txt", ".css", ".js", ".ics")
+# ``<stem>.<12 hex digits><suffix>``, as named by output.html_assets().
+_HASHED_NAME_RX = re.compile(r"^(?P<stem>.+)\.[0-9a-f]{12}(?P<suffix>\.[A-Za-z0-9]+)$")
+
+
+def _atomic_write(
+    path: str,
+    content: Union[str, Iterable[str]],
+    skip_unchanged: bool = False,
+    newline: Optional[str] = None,
+) -> bool:
     """Write ``content`` to ``path`` atomically via a ``<path>.tmp`` intermediate.
 
+    ``content`` is a string or an iterable of string chunks (e.g. from
+    :func:`~prayer_schedule.output.iter_html_schedule`), which are written to
+    the tmp file as they are produced so the whole document is never held
+    in memory. With ``skip_unchanged`` the tmp file is discarded instead of
+    renamed when ``path`` already holds the same bytes. ``newline`` is
+    passed to :func:`open`; ``""`` writes line endings untranslated. Returns
+    ``True`` when ``path`` was replaced.
+
     Raises :class:`FileNotFoundError` / :class:`PermissionError` / :class:`OSError`
     on failure rather than swallowing them. If any step fails after the tmp
     file is created, the tmp file is unlinked so it doesn't accumulate or
@@ -29,9 +59,16 @@ def _atomic_write(path: str, content: str) -> None:
     try:
         # Write to the temp file first; on success, atomically rename over the
         # target. ``os.replace`` is atomic on POSIX and overwrites on Windows.
-        with open(tmp_path, "w", encoding="utf-8") as handle:
-            handle.write(content)
+        with open(tmp_path, "w", encoding="utf-8", newline=newline) as handle:
+            if isinstance(content, str):
+                handle.write(content)
+            else:
+                handle.writelines(content)
+        if skip_unchanged and os.path.isfile(path) and filecmp.cmp(tmp_path, path, shallow=False):
+            os.unlink(tmp_path)
+            return False
         os.replace(tmp_path, path)
+        return True
     except BaseException:
         try:
             os.unlink(tmp_path)
@@ -40,72 +77,261 @@ def _atomic_write(path: str, content: str) -> None:
         raise
 
 
-def update_desktop_files(html_content: str, text_content: str) -> bool:
-    """Write the current HTML and text schedule files to :data:`DESKTOP_DIR`.
+def _write_if_changed(
+    path: str,
+    content: Union[str, Iterable[str]],
+    newline: Optional[str] = None,
+) -> bool:
+    """Atomically write ``content`` unless ``path`` already holds it.
 
-    Pre-checks ``DESKTOP_DIR`` exists and is writable; each file is written
-    to a temporary path and then atomically renamed. Returns ``True`` on
-    success, ``False`` on any failure (and prints a diagnostic message).
+    A string is compared before anything is written; streamed chunks are
+    written to the tmp file and compared there. ``newline`` is as for
+    :func:`_atomic_write`. Returns ``True`` when the file was written.
     """
-    success = True
+    if not isinstance(content, str):
+        return _atomic_write(path, content, skip_unchanged=True, newline=newline)
+    try:
+        with open(path, "r", encoding="utf-8", newline=newline) as handle:
+            if handle.read() == content:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    return _atomic_write(path, content, newline=newline)
+
+
+def _write_assets(assets: Mapping[str, str], output_dir: str) -> None:
+    """Write content-hashed asset files and drop superseded versions.
 
-    desktop_html = os.path.join(DESKTOP_DIR, _CURRENT_HTML_NAME)
-    desktop_text = os.path.join(DESKTOP_DIR, _CURRENT_TEXT_NAME)
+    A name that already exists already holds that content, so it is left
+    alone. Older ``<stem>.<hash><suffix>`` siblings of each asset are
+    removed once the new one is in place.
+    """
+    for rel_path, content in assets.items():
+        path = os.path.join(output_dir, *rel_path.split("/"))
+        asset_dir, name = os.path.split(path)
+        os.makedirs(asset_dir, exist_ok=True)
+        if not os.path.exists(path):
+            _atomic_write(path, content)
+            logger.info(f"   [OK] Wrote asset: {rel_path}")
+        match = _HASHED_NAME_RX.match(name)
+        if match is None:
+            continue
+        for other in os.listdir(asset_dir):
+            stale = _HASHED_NAME_RX.match(other)
+            if (
+                other != name
+                and stale is not None
+                and stale.group("stem", "suffix") == match.group("stem", "suffix")
+            ):
+                os.remove(os.path.join(asset_dir, other))
+
+
+def update_desktop_files(
+    html_content: Union[str, Iterable[str]],
+    text_content: Union[str, Iterable[str]],
+    output_dir: Optional[str] = None,
+    assets: Optional[Mapping[str, str]] = None,
+    json_content: Optional[str] = None,
+    today_json_content: Optional[str] = None,
+) -> bool:
+    """Write the current HTML, text and JSON schedule files to ``output_dir``.
+
+    ``output_dir`` defaults to :data:`DESKTOP_DIR`. Pre-checks the directory
+    exists and is writable; each file (a string or an iterable of chunks,
+    streamed as produced) is written to a temporary path and then
+    atomically renamed. ``assets`` (relative path -> content, see
+    :func:`~prayer_schedule.output.html_assets`) are written first so the
+    page never links a file that is not there yet. The week's JSON export
+    and today's slice are written when given. Returns ``True`` on success,
+    ``False`` on any failure (and prints a diagnostic message).
+    """
+    success = True
+    output_dir = DESKTOP_DIR if output_dir is None else output_dir
 
     # Pre-check: the output directory must exist and be writable.
-    if not os.path.isdir(DESKTOP_DIR):
-        print(f"   [ERROR] Output directory does not exist: {DESKTOP_DIR}")
+    if not os.path.isdir(output_dir):
+        logger.error(f"   [ERROR] Output directory does not exist: {output_dir}")
         return False
-    if not os.access(DESKTOP_DIR, os.W_OK):
-        print(f"   [ERROR] Output directory is not writable: {DESKTOP_DIR}")
+    if not os.access(output_dir, os.W_OK):
+        logger.error(f"   [ERROR] Output directory is not writable: {output_dir}")
         return False
 
+    if assets:
+        try:
+            _write_assets(assets, output_dir)
+        except OSError as exc:
+            logger.error(f"   [ERROR] Failed to write page assets: {exc}")
+            return False
+
+    files = [
+        ("HTML file", _CURRENT_HTML_NAME, html_content),
+        ("text file", _CURRENT_TEXT_NAME, text_content),
+        ("JSON file", _CURRENT_JSON_NAME, json_content),
+        ("JSON day file", _TODAY_JSON_NAME, today_json_content),
+    ]
+    for label, name, content in files:
+        if content is None:
+            continue
+        path = os.path.join(output_dir, name)
+        try:
+            if _write_if_changed(path, content):
+                logger.info(f"   [OK] Updated: {path}")
+            else:
+                logger.info(f"   [OK] Unchanged: {path}")
+        except FileNotFoundError as exc:
+            logger.error(f"   [ERROR] Failed to write {label} (not found): {exc}")
+            success = False
+        except PermissionError as exc:
+            logger.error(f"   [ERROR] Failed to write {label} (permission denied): {exc}")
+            success = False
+        except OSError as exc:
+            logger.error(f"   [ERROR] Failed to write {label}: {exc}")
+            success = False
+
+    return success
+
+
+def published_files(root: str) -> list[str]:
+    """Return the ``/``-separated paths under ``root`` that the site publishes.
+
+    That is the landing page and current schedule files that exist, plus
+    every text file under ``assets/``, ``archive/`` and ``calendar/``.
+    """
+    rel_paths = [
+        name
+        for name in (
+            _LANDING_PAGE_NAME,
+            _CURRENT_HTML_NAME,
+            _CURRENT_TEXT_NAME,
+            _CURRENT_JSON_NAME,
+            _TODAY_JSON_NAME,
+        )
+        if os.path.isfile(os.path.join(root, name))
+    ]
+    for subdir in (ASSET_DIR, _ARCHIVE_SUBDIR, _CALENDAR_SUBDIR):
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root, subdir)):
+            dirnames.sort()
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            rel_paths.extend(
+                f"{rel_dir}/{name}"
+                for name in sorted(filenames)
+                if name.endswith(_PRECOMPRESS_SUFFIXES)
+            )
+    return rel_paths
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _gzip_file(path: str, gz_path: str, level: int) -> None:
+    """Compress ``path`` to ``gz_path`` atomically, byte-for-byte reproducibly."""
+    tmp_path = f"{gz_path}.tmp"
     try:
-        _atomic_write(desktop_html, html_content)
-        print(f"   [OK] Updated: {desktop_html}")
-    except FileNotFoundError as exc:
-        print(f"   [ERROR] Failed to write HTML file (not found): {exc}")
-        success = False
-    except PermissionError as exc:
-        print(f"   [ERROR] Failed to write HTML file (permission denied): {exc}")
-        success = False
-    except OSError as exc:
-        print(f"   [ERROR] Failed to write HTML file: {exc}")
-        success = False
+        # No name and a zero mtime in the header: the same input always
+        # produces the same bytes, so unchanged files never look changed.
+        with open(path, "rb") as source, open(tmp_path, "wb") as raw:
+            with gzip.GzipFile(
+                filename="", mode="wb", compresslevel=level, fileobj=raw, mtime=0
+            ) as target:
+                shutil.copyfileobj(source, target)
+        os.replace(tmp_path, gz_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
+
+def precompress(root: str, rel_paths: Iterable[str], level: int) -> list[str]:
+    """Write a gzip ``<file>.gz`` sibling for each of ``rel_paths`` under ``root``.
+
+    ``root/precompress_manifest.json`` records each source's size, SHA-256
+    and compression level; a file whose entry still matches (and whose
+    ``.gz`` exists) is skipped, so only changed files are recompressed.
+    Entries whose source has gone (e.g. a superseded hashed asset) have
+    their ``.gz`` removed. Failures are logged per file and never raise.
+    Returns the paths that were (re)compressed.
+    """
+    manifest_path = os.path.join(root, PRECOMPRESS_MANIFEST_NAME)
     try:
-        _atomic_write(desktop_text, text_content)
-        print(f"   [OK] Updated: {desktop_text}")
-    except FileNotFoundError as exc:
-        print(f"   [ERROR] Failed to write text file (not found): {exc}")
-        success = False
-    except PermissionError as exc:
-        print(f"   [ERROR] Failed to write text file (permission denied): {exc}")
-        success = False
-    except OSError as exc:
-        print(f"   [ERROR] Failed to write text file: {exc}")
-        success = False
+        with open(manifest_path, "r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        if not isinstance(manifest, dict):
+            manifest = {}
+    except (OSError, ValueError):
+        manifest = {}
+
+    compressed: list[str] = []
+    for rel_path in rel_paths:
+        path = os.path.join(root, *rel_path.split("/"))
+        try:
+            size = os.path.getsize(path)
+            entry = manifest.get(rel_path)
+            current = (
+                isinstance(entry, dict)
+                and entry.get("size") == size
+                and entry.get("level") == level
+                and os.path.isfile(f"{path}.gz")
+            )
+            digest = _file_digest(path)
+            if current and entry.get("sha256") == digest:
+                continue
+            _gzip_file(path, f"{path}.gz", level)
+        except OSError as exc:
+            logger.warning(f"   [WARNING] Could not precompress {rel_path}: {exc}")
+            continue
+        manifest[rel_path] = {"size": size, "sha256": digest, "level": level}
+        compressed.append(rel_path)
+
+    stale = [
+        rel_path
+        for rel_path in manifest
+        if not os.path.isfile(os.path.join(root, *rel_path.split("/")))
+    ]
+    for rel_path in stale:
+        try:
+            os.remove(os.path.join(root, *rel_path.split("/")) + ".gz")
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning(f"   [WARNING] Could not remove stale {rel_path}.gz: {exc}")
+            continue
+        del manifest[rel_path]
 
-    return success
+    if compressed or stale:
+        try:
+            _atomic_write(manifest_path, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+        except OSError as exc:
+            logger.warning(f"   [WARNING] Could not update precompression manifest: {exc}")
+    if compressed:
+        logger.info(f"   [OK] Precompressed {len(compressed)} file(s) at gzip level {level}")
+    return compressed
 
 
-def archive_previous_schedule() -> bool:
+def archive_previous_schedule(output_dir: Optional[str] = None) -> bool:
     """Archive the previous week's text file before a Monday regeneration.
 
     Moves ``Prayer_Schedule_Current_Week.txt`` to
-    ``archive/Prayer_Schedule_<date>[_WeekNN].txt``. Returns ``True`` on a
-    successful archive, ``False`` when there is nothing to archive or when
-    an error occurs (a diagnostic is printed either way so the CI log tells
-    the story).
+    ``archive/Prayer_Schedule_<date>[_WeekNN].txt`` inside ``output_dir``
+    (default: :data:`DESKTOP_DIR`). Returns ``True`` on a successful archive,
+    ``False`` when there is nothing to archive or when an error occurs (a
+    diagnostic is printed either way so the CI log tells the story).
     """
-    current_txt = os.path.join(DESKTOP_DIR, _CURRENT_TEXT_NAME)
+    output_dir = DESKTOP_DIR if output_dir is None else output_dir
+    current_txt = os.path.join(output_dir, _CURRENT_TEXT_NAME)
 
     if not os.path.exists(current_txt):
-        print("   [INFO] No previous schedule to archive (first run or file doesn't exist)")
+        logger.info("   [INFO] No previous schedule to archive (first run or file doesn't exist)")
         return False
 
     try:
-        archive_dir = os.path.join(DESKTOP_DIR, _ARCHIVE_SUBDIR)
+        archive_dir = os.path.join(output_dir, _ARCHIVE_SUBDIR)
         os.makedirs(archive_dir, exist_ok=True)
 
         # Use Central time so the archive filename always reflects the
@@ -122,7 +348,7 @@ def archive_previous_schedule() -> bool:
             if match:
                 week_num = match.group(1)
         except OSError as exc:
-            print(f"   [INFO] Could not extract week number from file: {exc}")
+            logger.info(f"   [INFO] Could not extract week number from file: {exc}")
 
         if week_num:
             base_name = f"Prayer_Schedule_{timestamp}_Week{week_num}"
@@ -144,21 +370,23 @@ def archive_previous_schedule() -> bool:
         shutil.copy2(current_txt, archive_path)
         os.remove(current_txt)
 
-        print(f"   [ARCHIVED] Previous schedule moved to: archive/{archive_name}")
+        logger.info(f"   [ARCHIVED] Previous schedule moved to: archive/{archive_name}")
         return True
 
     except (OSError, shutil.Error) as exc:
-        print(f"   [WARNING] Could not archive previous schedule: {exc}")
-        print("   [INFO] Continuing with schedule generation...")
+        logger.warning(f"   [WARNING] Could not archive previous schedule: {exc}")
+        logger.info("   [INFO] Continuing with schedule generation...")
         return False
 
 
 _LOG_MAX_BYTES: int = 1_048_576  # 1 MB; rotates to <log>.1 above this size.
 
 
-def log_activity(message: str) -> None:
+def log_activity(message: str, output_dir: Optional[str] = None) -> None:
     """Append ``message`` to the activity log file with a UTC-less timestamp.
 
+    The log lives in ``output_dir`` (default: :data:`DESKTOP_DIR`).
+
     Matches the original line format exactly::
 
         [YYYY-MM-DD HH:MM:SS] <message>
@@ -168,7 +396,9 @@ def log_activity(message: str) -> None:
     unbounded file. CI doesn't hit this path because each run starts fresh.
     """
     try:
-        log_file = os.path.join(DESKTOP_DIR, _LOG_FILE_NAME)
+        log_file = os.path.join(
+            DESKTOP_DIR if output_dir is None else output_dir, _LOG_FILE_NAME
+        )
         try:
             if os.path.getsize(log_file) > _LOG_MAX_BYTES:
                 os.replace(log_file, f"{log_file}.1")
@@ -179,4 +409,4 @@ def log_activity(message: str) -> None:
                 f"[{datetime.now(CENTRAL_TZ).strftime('%Y-%m-%d %H:%M:%S')}] {message}\n"
             )
     except OSError as exc:
-        print(f"   [WARNING] Logging failed: {exc}", file=sys.stderr)
+        logger.warning(f"   [WARNING] Logging failed: {exc}")
@@ -0,0 +1,371 @@
+"""Property-based fuzzing of the full rotation stack.
+
+The unit tests and ``comprehensive_verification.py`` exercise the one real
+161-family directory, which is how a hand-tuned reassignment map once hid
+drift. This module generates random congregations from an integer seed and
+pushes each through everything the daily run relies on:
+
+1. :func:`~prayer_schedule.validation.validate_elder_data` must accept
+   exactly the inputs the generator built to be valid (collisions that
+   collapse to duplicate families, or an elder family missing from the
+   directory, must be rejected);
+2. the reassignment solver either returns a map or raises
+   :class:`ValueError` (*infeasible* is an allowed outcome);
+3. a solved map must pass
+   :func:`~prayer_schedule.validation.validate_reassignment_map`, build a
+   :class:`~prayer_schedule.algorithm.RotationTable`, and satisfy every
+   invariant in :func:`~prayer_schedule.bitsets.check_invariants`;
+4. :func:`~prayer_schedule.validation.verify_schedule` must agree with the
+   bitset engine on every cycle position.
+
+Anything else is a *failure*. :func:`run_fuzz` spreads seed blocks across a
+:class:`ProcessPoolExecutor` (one small result per block, so millions of
+cases cost little IPC) and :func:`shrink_case` reduces each failure to a
+minimal congregation that still fails. A case is fully determined by its
+seed, so ``fuzz_rotation.py --replay SEED`` reproduces it anywhere.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import random
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Callable, NamedTuple, Optional
+
+from .bitsets import check_invariants
+from .config import DAYS_OF_WEEK
+from .directory import parse_directory
+from .elders import ElderRecord
+from .pools import build_pools
+from .tenant import TenantContext
+from .validation import validate_elder_data, validate_reassignment_map, verify_schedule
+
+OUTCOMES: tuple[str, ...] = ("ok", "rejected", "infeasible", "fail")
+STAGES: tuple[str, ...] = ("validation", "map", "invariants", "verify_schedule", "exception")
+
+# Few surnames so the same last name (and near-identical rows) recur often.
+_LAST_NAMES = ("Brown", "Davis", "Smith", "Wood", "Fox", "O'Neil", "Núñez", "Lee-Park")
+_FIRST_NAMES = ("Ann", "Bob", "Cy & Di", "Ed; Flo, Gus", "Hal", "Ida & Jo", "Kay")
+
+
+@dataclass(frozen=True)
+class FuzzCase:
+    """One generated congregation and what the generator expects of it.
+
+    ``expect_valid`` is ``False`` when the generator deliberately planted
+    something :func:`validate_elder_data` (or directory parsing) must reject.
+    """
+
+    seed: int
+    directory_csv: str
+    elder_data: tuple[ElderRecord, ...]
+    expect_valid: bool
+    notes: tuple[str, ...] = ()
+
+    def tenant(self) -> TenantContext:
+        """Return a context that solves its own map with default bounds."""
+        return TenantContext(
+            name=f"fuzz-{self.seed}",
+            elder_data=self.elder_data,
+            directory_csv=self.directory_csv,
+            expected_elder_count=len(self.elder_data),
+        )
+
+    def describe(self) -> str:
+        """Return a paste-able description of the case."""
+        lines = [f"seed={self.seed} expect_valid={self.expect_valid} notes={list(self.notes)}"]
+        lines.append("elder_data=[")
+        lines.extend(f"    {dict(record)!r}," for record in self.elder_data)
+        lines.append("]")
+        lines.append("directory_csv:")
+        lines.append(self.directory_csv.rstrip("\n"))
+        return "\n".join(lines)
+
+
+class CaseResult(NamedTuple):
+    """Outcome of one case: one of :data:`OUTCOMES` plus a short detail.
+
+    ``stage`` names the check a ``"fail"`` tripped (one of :data:`STAGES`);
+    :func:`shrink_case` only keeps reductions that fail at the same stage.
+    """
+
+    seed: int
+    outcome: str
+    detail: str
+    stage: str = ""
+
+
+def _directory_csv(rows: list[tuple[str, str]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["Last Name", "First Names"])
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def generate_case(seed: int) -> FuzzCase:
+    """Build a random congregation; the same ``seed`` always gives the same case."""
+    rng = random.Random(seed)
+    notes: list[str] = []
+    expect_valid = True
+
+    elder_count = rng.choice((2, 3, 5, 7, 7, 8, 12, rng.randint(2, 40)))
+    scale = rng.choice((1, 2, 3, 10, 23, 100))
+    family_count = rng.randint(elder_count, elder_count * scale + elder_count)
+
+    rows: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    while len(rows) < family_count:
+        last = rng.choice(_LAST_NAMES)
+        first = f"{rng.choice(_FIRST_NAMES)} {rng.randrange(10 * family_count)}"
+        if f"{last}, {first}" not in seen:
+            seen.add(f"{last}, {first}")
+            rows.append((last, first))
+
+    if rng.random() < 0.05:
+        # Differs only in padding, which parsing strips into a duplicate.
+        last, first = rng.choice(rows)
+        rows.append((f" {last}", f"{first} "))
+        notes.append("padded duplicate row")
+        expect_valid = False
+    rng.shuffle(rows)
+    directory_csv = _directory_csv(rows)
+
+    families = sorted(seen)
+    if rng.random() < 0.3:
+        # Crowd every elder family into as few pools as possible.
+        pools = build_pools(families, elder_count)
+        crowded = [f for pool in rng.sample(pools, rng.randint(1, 2)) for f in pool]
+        own = [rng.choice(crowded) for _ in range(elder_count)]
+        notes.append("elder families share pools")
+    else:
+        own = rng.sample(families, elder_count) if family_count >= elder_count else []
+    if rng.random() < 0.1:
+        sharer = rng.randrange(1, elder_count)
+        own[sharer] = own[0]
+        notes.append("two elders share a family")
+    if rng.random() < 0.03:
+        own[rng.randrange(elder_count)] = "Missing, Family"
+        notes.append("elder family not in directory")
+        expect_valid = False
+
+    # Deal the seven days round-robin so every day is always covered; elders
+    # past the seventh either float or double up on a random day.
+    days = list(DAYS_OF_WEEK)
+    rng.shuffle(days)
+    elder_days: list[list[str]] = [[] for _ in own]
+    for day_idx, day in enumerate(days):
+        elder_days[day_idx % elder_count].append(day)
+    for idx in range(len(days), elder_count):
+        if rng.random() < 0.5:
+            elder_days[idx] = [rng.choice(days)]
+    elder_data = tuple(
+        {"name": f"Elder {idx:02d}", "family": family, "days": elder_days[idx]}
+        | ({} if elder_days[idx] else {"floating": True})
+        for idx, family in enumerate(own)
+    )
+    return FuzzCase(seed, directory_csv, elder_data, expect_valid, tuple(notes))
+
+
+def run_case(case: FuzzCase) -> CaseResult:
+    """Push ``case`` through the whole stack and classify the outcome."""
+    try:
+        return _run_case(case)
+    except Exception:  # noqa: BLE001 - every unexpected error is a finding
+        detail = traceback.format_exc(limit=3).strip().splitlines()[-1]
+        return CaseResult(case.seed, "fail", detail, "exception")
+
+
+def _run_case(case: FuzzCase) -> CaseResult:
+    tenant = case.tenant()
+    try:
+        families = parse_directory(case.directory_csv)
+        valid, issues = validate_elder_data(
+            case.elder_data, case.directory_csv, len(case.elder_data)
+        )
+    except ValueError as exc:
+        valid, issues = False, [str(exc)]
+    if valid != case.expect_valid:
+        return CaseResult(
+            case.seed, "fail",
+            f"validation returned {valid}, expected {case.expect_valid}: {issues[:2]}",
+            "validation",
+        )
+    if not valid:
+        return CaseResult(case.seed, "rejected", issues[0] if issues else "")
+
+    pools = tenant.master_pools()
+    try:
+        reassignment_map = tenant.resolve_reassignment_map(pools)
+    except ValueError as exc:
+        return CaseResult(case.seed, "infeasible", str(exc))
+
+    map_ok, map_issues = validate_reassignment_map(
+        pools, tenant.elders, tenant.elder_families, reassignment_map
+    )
+    if not map_ok:
+        return CaseResult(case.seed, "fail", f"solved map invalid: {map_issues[0]}", "map")
+    table = tenant.build_rotation_table(pools, reassignment_map)
+    lo, hi = tenant.family_bounds(pools)
+    ok, issues = check_invariants(table, tenant.elder_families, families, lo, hi)
+    if not ok:
+        return CaseResult(case.seed, "fail", issues[0], "invariants")
+    for pos, assignments in enumerate(table.positions):
+        schedule_ok, schedule_issues = verify_schedule(assignments, tenant.elder_families, lo, hi)
+        if not schedule_ok:
+            return CaseResult(
+                case.seed, "fail",
+                f"verify_schedule disagrees at cycle position {pos}: {schedule_issues[0]}",
+                "verify_schedule",
+            )
+    return CaseResult(case.seed, "ok", "")
+
+
+class BlockResult(NamedTuple):
+    """Outcome counts for a block of seeds plus its first failures."""
+
+    counts: dict[str, int]
+    failures: list[CaseResult]
+
+
+def run_block(start_seed: int, count: int, max_failures: int = 20) -> BlockResult:
+    """Run seeds ``start_seed .. start_seed + count - 1`` in this process."""
+    counts = dict.fromkeys(OUTCOMES, 0)
+    failures: list[CaseResult] = []
+    for seed in range(start_seed, start_seed + count):
+        result = run_case(generate_case(seed))
+        counts[result.outcome] += 1
+        if result.outcome == "fail" and len(failures) < max_failures:
+            failures.append(result)
+    return BlockResult(counts, failures)
+
+
+def _remove_family(case: FuzzCase, family: str) -> FuzzCase:
+    buffer = io.StringIO(case.directory_csv)
+    rows = [
+        row for row in csv.reader(buffer)
+        if len(row) < 2 or f"{row[0].strip()}, {row[1].strip()}" != family
+    ]
+    return replace(case, directory_csv=_directory_csv(rows[1:]))
+
+
+def _remove_elder(case: FuzzCase, idx: int) -> FuzzCase:
+    # Hand the dropped elder's days to a neighbour so no day goes uncovered
+    # (which would turn any failure into a validation rejection).
+    records = [dict(record) for record in case.elder_data]
+    dropped = records.pop(idx)
+    heir = records[idx - 1 if idx else 0]
+    heir["days"] = list(heir["days"]) + [d for d in dropped["days"] if d not in heir["days"]]
+    if heir["days"]:
+        heir.pop("floating", None)
+    return replace(case, elder_data=tuple(records))
+
+
+def shrink_case(
+    case: FuzzCase,
+    still_fails: Optional[Callable[[FuzzCase], bool]] = None,
+) -> FuzzCase:
+    """Greedily drop elders and directory rows while ``case`` keeps failing.
+
+    ``still_fails`` defaults to "fails at the same stage as ``case``". Elders
+    are removed one at a time (the last one first, its days handed to a
+    neighbour), then non-elder families in shrinking chunks; the result
+    fails and no single further removal keeps it failing.
+    """
+    if still_fails is None:
+        stage = run_case(case).stage
+
+        def still_fails(candidate: FuzzCase) -> bool:
+            result = run_case(candidate)
+            return result.outcome == "fail" and result.stage == stage
+
+    progress = True
+    while progress:
+        progress = False
+        for idx in reversed(range(len(case.elder_data))):
+            if len(case.elder_data) <= 1:
+                break
+            candidate = _remove_elder(case, idx)
+            if still_fails(candidate):
+                case, progress = candidate, True
+
+        try:
+            families = parse_directory(case.directory_csv)
+        except ValueError:
+            continue
+        protected = {record["family"] for record in case.elder_data}
+        removable = [family for family in families if family not in protected]
+        chunk = max(1, len(removable) // 2)
+        while chunk >= 1 and removable:
+            kept = []
+            for start in range(0, len(removable), chunk):
+                group = removable[start:start + chunk]
+                candidate = case
+                for family in group:
+                    candidate = _remove_family(candidate, family)
+                if still_fails(candidate):
+                    case, progress = candidate, True
+                else:
+                    kept.extend(group)
+            removable = kept
+            chunk //= 2
+    return case
+
+
+class FuzzReport(NamedTuple):
+    """Aggregate outcome of :func:`run_fuzz`."""
+
+    counts: dict[str, int]
+    failures: list[CaseResult]
+    minimal: list[FuzzCase]
+    elapsed: float
+
+    @property
+    def cases(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def throughput(self) -> float:
+        """Cases completed per second of wall-clock time."""
+        return self.cases / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """Return a one-line ``[OK]``/``[X]`` summary for the console."""
+        status = "[OK]" if not self.counts["fail"] else "[X]"
+        breakdown = ", ".join(f"{outcome} {self.counts[outcome]}" for outcome in OUTCOMES)
+        return (
+            f"{status} {self.cases} cases ({breakdown}) in {self.elapsed:.2f}s "
+            f"({self.throughput:.0f} cases/sec)"
+        )
+
+
+def run_fuzz(
+    cases: int,
+    seed: int = 0,
+    max_workers: Optional[int] = None,
+    block_size: int = 200,
+    shrink: int = 3,
+) -> FuzzReport:
+    """Fuzz seeds ``seed .. seed + cases - 1`` on a process pool.
+
+    ``max_workers`` defaults to the executor's own default (CPU count).
+    Up to ``shrink`` failures are reduced with :func:`shrink_case` in the
+    parent once the pool finishes.
+    """
+    start = time.perf_counter()
+    counts = dict.fromkeys(OUTCOMES, 0)
+    failures: list[CaseResult] = []
+    starts = list(range(seed, seed + cases, block_size))
+    sizes = [min(block_size, seed + cases - block_start) for block_start in starts]
+    if starts:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for block in executor.map(run_block, starts, sizes):
+                for outcome, count in block.counts.items():
+                    counts[outcome] += count
+                failures.extend(block.failures)
+    minimal = [shrink_case(generate_case(result.seed)) for result in failures[:shrink]]
+    return FuzzReport(counts, failures, minimal, time.perf_counter() - start)
@@ -0,0 +1,250 @@
+"""iCalendar feeds of the prayer schedule: one per elder and one combined.
+
+:func:`write_feeds` publishes ``calendar/<elder>.ics`` for each elder and
+``calendar/congregation.ics`` for everyone, covering a rolling window of
+weeks around today. Each elder's feed has an all-day event, with a morning
+reminder, on every day they pray; its description is that day's family
+list. The combined feed has one event per day naming the day's elders
+and their families.
+
+Event UIDs are derived from the date and elder, so they stay the same
+from run to run. ``calendar_state.json`` records a hash of each event's
+content together with its ``SEQUENCE`` and ``DTSTAMP``. An event whose
+content is unchanged is emitted byte-for-byte as before. Only a changed
+event gets a new stamp and a bumped sequence. A feed whose events did
+not change is therefore not rewritten, so calendar clients re-sync
+nothing.
+
+Assignments come from the rotation table
+(:meth:`~prayer_schedule.algorithm.RotationTable.for_week`, the
+precomputed form of
+:func:`~prayer_schedule.algorithm.assign_families_for_week_v10`) and
+days from :func:`~prayer_schedule.elders.get_week_schedule`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Mapping, NamedTuple, Optional, Sequence
+
+from . import config
+from .algorithm import RotationTable, calculate_continuous_week, calculate_week_number
+from .config import REFERENCE_MONDAY
+from .elders import get_week_schedule
+from .file_io import _CALENDAR_SUBDIR, _atomic_write, _write_if_changed
+from .output import DAYS
+from .tenant import TenantContext
+from .utils import week_monday
+
+CALENDAR_STATE_NAME: str = "calendar_state.json"
+CONGREGATION_FEED_NAME: str = "congregation.ics"
+FEED_WEEKS_BEHIND: int = 1
+FEED_WEEKS_AHEAD: int = 8
+# All-day events start at midnight; remind at 7 AM on the day.
+REMINDER_TRIGGER: str = "PT7H"
+
+
+class FeedReport(NamedTuple):
+    """Outcome of :func:`write_feeds`; ``files`` are ``/``-separated, relative
+    to the output directory."""
+
+    files: list[str]
+    events: int
+    changed: int
+    written: list[str]
+
+    def summary(self) -> str:
+        """Return a one-line ``[OK]`` summary for the console."""
+        return (
+            f"[OK] {len(self.files)} calendar feeds, {self.events} events "
+            f"({self.changed} changed, {len(self.written)} files written)"
+        )
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+
+
+def elder_feed_name(elder: str) -> str:
+    """Return the feed file name for ``elder``, e.g. ``frank-bohannon.ics``."""
+    return f"{_slug(elder)}.ics"
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT value (RFC 5545 section 3.3.11)."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold ``line`` at 75 octets without splitting a UTF-8 character."""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line
+    parts = []
+    start, limit = 0, 75
+    while start < len(data):
+        end = min(start + limit, len(data))
+        while end < len(data) and data[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode("utf-8"))
+        # Continuation lines start with a space, which counts toward 75.
+        start, limit = end, 74
+    return "\r\n ".join(parts)
+
+
+def _calendar(tenant: TenantContext, name: str, events: Sequence[Sequence[str]]) -> str:
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//{_escape(tenant.name)}//Prayer Schedule//EN",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_escape(name)}",
+        "REFRESH-INTERVAL;VALUE=DURATION:PT12H",
+        "X-PUBLISHED-TTL:PT12H",
+    ]
+    for event in events:
+        lines.extend(event)
+    lines.append("END:VCALENDAR")
+    return "".join(f"{_fold(line)}\r\n" for line in lines)
+
+
+def _load_state(path: str) -> dict[str, dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            state = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def write_feeds(
+    tenant: TenantContext,
+    table: RotationTable,
+    today: datetime,
+    output_dir: Optional[str] = None,
+    weeks_behind: int = FEED_WEEKS_BEHIND,
+    weeks_ahead: int = FEED_WEEKS_AHEAD,
+    now: Optional[datetime] = None,
+) -> FeedReport:
+    """Write every elder's feed and the congregation feed under ``calendar/``.
+
+    The window runs from ``weeks_behind`` weeks before ``today``'s week
+    (never before :data:`~prayer_schedule.config.REFERENCE_MONDAY`) through
+    ``weeks_ahead`` weeks starting with it. ``output_dir`` defaults to
+    :data:`~prayer_schedule.config.DESKTOP_DIR`; ``now`` (default: the
+    current time) stamps events whose content changed. Feeds are only
+    rewritten when their content changed. Raises :class:`OSError` if a feed
+    cannot be written.
+    """
+    output_dir = config.DESKTOP_DIR if output_dir is None else output_dir
+    now = datetime.now(timezone.utc) if now is None else now
+    stamp = f"{now.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}"
+    domain = f"{_slug(tenant.name)}.prayer-schedule"
+    feed_dir = os.path.join(output_dir, _CALENDAR_SUBDIR)
+    state_path = os.path.join(output_dir, CALENDAR_STATE_NAME)
+    previous = _load_state(state_path)
+    state: dict[str, dict] = {}
+    changed = 0
+
+    def event(uid: str, body: list[str]) -> list[str]:
+        nonlocal changed
+        digest = hashlib.sha256("\n".join(body).encode("utf-8")).hexdigest()[:16]
+        entry = previous.get(uid)
+        valid = (
+            isinstance(entry, dict)
+            and isinstance(entry.get("sequence"), int)
+            and isinstance(entry.get("stamp"), str)
+        )
+        if not valid or entry.get("hash") != digest:
+            entry = {
+                "hash": digest,
+                "sequence": entry["sequence"] + 1 if valid else 0,
+                "stamp": stamp,
+            }
+            changed += 1
+        state[uid] = entry
+        return [
+            "BEGIN:VEVENT",
+            f"UID:{uid}",
+            f"DTSTAMP:{entry['stamp']}",
+            f"LAST-MODIFIED:{entry['stamp']}",
+            f"SEQUENCE:{entry['sequence']}",
+            *body,
+            "END:VEVENT",
+        ]
+
+    elder_events: dict[str, list[list[str]]] = {elder: [] for elder in tenant.elders}
+    congregation_events: list[list[str]] = []
+    this_week = calculate_continuous_week(week_monday(today))
+    first = max(this_week - weeks_behind, calculate_continuous_week(REFERENCE_MONDAY))
+    for week in range(first, this_week + weeks_ahead):
+        monday = REFERENCE_MONDAY + timedelta(weeks=week - 1)
+        week_number = calculate_week_number(monday)
+        assignments: Mapping[str, Sequence[str]] = table.for_week(week)
+        schedule = get_week_schedule(week, tenant.elder_data)
+        for offset, day in enumerate(DAYS):
+            elders = schedule[day]
+            if not elders:
+                continue
+            date = monday + timedelta(days=offset)
+            dates = [
+                f"DTSTART;VALUE=DATE:{date:%Y%m%d}",
+                f"DTEND;VALUE=DATE:{date + timedelta(days=1):%Y%m%d}",
+                "TRANSP:TRANSPARENT",
+            ]
+            label = f"{day}, {date:%B %d} (Week {week_number})"
+            heading = f"Prayer list for {label}:\n"
+            sections = []
+            for elder in elders:
+                families = assignments[elder]
+                listing = "\n".join(f"{n}. {family}" for n, family in enumerate(families, 1))
+                sections.append(f"{elder} ({len(families)} families):\n{listing}")
+                summary = f"Pray for {len(families)} families"
+                body = [
+                    *dates,
+                    f"SUMMARY:{_escape(summary)}",
+                    f"DESCRIPTION:{_escape(heading + listing)}",
+                    "BEGIN:VALARM",
+                    "ACTION:DISPLAY",
+                    f"TRIGGER;RELATED=START:{REMINDER_TRIGGER}",
+                    f"DESCRIPTION:{_escape(summary + ' today')}",
+                    "END:VALARM",
+                ]
+                elder_events[elder].append(event(f"{date:%Y%m%d}-{_slug(elder)}@{domain}", body))
+            description = "\n\n".join([label, *sections])
+            body = [
+                *dates,
+                f"SUMMARY:{_escape('Prayer list: ' + ' & '.join(elders))}",
+                f"DESCRIPTION:{_escape(description)}",
+            ]
+            congregation_events.append(event(f"{date:%Y%m%d}@{domain}", body))
+
+    feeds = {
+        elder_feed_name(elder): _calendar(tenant, f"Prayer Schedule - {elder}", events)
+        for elder, events in elder_events.items()
+    }
+    feeds[CONGREGATION_FEED_NAME] = _calendar(
+        tenant, f"{tenant.name} Prayer Schedule", congregation_events
+    )
+
+    os.makedirs(feed_dir, exist_ok=True)
+    written = [
+        path
+        for path, content in (
+            (os.path.join(feed_dir, name), content) for name, content in feeds.items()
+        )
+        if _write_if_changed(path, content, newline="")
+    ]
+    if changed or set(state) != set(previous):
+        _atomic_write(state_path, json.dumps(state, indent=2, sort_keys=True) + "\n")
+    files = [f"{_CALENDAR_SUBDIR}/{name}" for name in feeds]
+    return FeedReport(files, len(state), changed, written)
@@ -0,0 +1,348 @@
+"""Incremental re-verification of the rotation after small input changes.
+
+:func:`verify_full` checks every rotation invariant over one full cycle of
+a :class:`~prayer_schedule.algorithm.RotationTable` and keeps each result
+under a fine-grained key:
+
+* a *cell* ``(cycle_position, elder)``: family count within bounds and no
+  own family;
+* a *pair* ``(cycle_position, elder)``: no family repeated from that
+  position to the next (wrapping at the end of the cycle);
+* a *position*: no family assigned twice and every directory family
+  covered.
+
+After an edit, :func:`reverify` works out from a :class:`ChangeDelta` which
+cells, pairs and positions can possibly have changed and re-checks only
+those, carrying every other stored result forward. A family added to pool
+``p`` touches one elder per position (whoever holds ``p`` that week); an
+elder's own-family change touches that elder's row plus the reassignment
+targets of their conflict positions; a map edit touches the owners and
+targets of that position.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping, NamedTuple, Optional
+
+from .algorithm import RotationTable
+from .pools import PoolDelta
+
+Cell = tuple[int, str]
+
+
+class ChangeDelta(NamedTuple):
+    """What changed between two verified inputs.
+
+    ``pools`` comes from :func:`~prayer_schedule.pools.rebalance_pools`;
+    ``elders`` names elders whose own family changed; ``map_positions``
+    names cycle positions whose reassignment entries were edited. Own-family
+    and map differences are also detected automatically by :func:`reverify`,
+    so these two are hints rather than requirements.
+    """
+
+    pools: PoolDelta = PoolDelta(added={}, removed={}, moved={})
+    elders: frozenset[str] = frozenset()
+    map_positions: frozenset[int] = frozenset()
+
+
+@dataclass(frozen=True)
+class VerificationResult:
+    """Stored per-cell, per-pair and per-position issues for one table.
+
+    Also records the table and inputs the results were computed from, so a
+    later :func:`reverify` can compare against them. ``checked`` counts the
+    checks evaluated to produce this result (all of them for
+    :func:`verify_full`, only the re-checked ones for :func:`reverify`).
+    """
+
+    table: RotationTable = field(repr=False)
+    elders: tuple[str, ...]
+    elder_families: Mapping[str, str]
+    reassignment_map: Mapping[int, Mapping[str, str]]
+    families: frozenset[str]
+    bounds: tuple[int, int]
+    cell_issues: Mapping[Cell, tuple[str, ...]] = field(repr=False)
+    pair_issues: Mapping[Cell, tuple[str, ...]] = field(repr=False)
+    position_issues: Mapping[int, tuple[str, ...]] = field(repr=False)
+    checked: int = 0
+
+    @property
+    def issues(self) -> list[str]:
+        """Every stored issue, ordered by position then elder."""
+        found: list[str] = []
+        for pos in sorted(self.position_issues):
+            found.extend(self.position_issues[pos])
+        for key in sorted(self.cell_issues, key=lambda cell: (cell[0], self.elders.index(cell[1]))):
+            found.extend(self.cell_issues[key])
+        for key in sorted(self.pair_issues, key=lambda cell: (cell[0], self.elders.index(cell[1]))):
+            found.extend(self.pair_issues[key])
+        return found
+
+    @property
+    def ok(self) -> bool:
+        return not any(self.cell_issues.values()) and not any(
+            self.pair_issues.values()
+        ) and not any(self.position_issues.values())
+
+
+def _check_cell(
+    table: RotationTable,
+    pos: int,
+    elder: str,
+    elder_families: Mapping[str, str],
+    bounds: tuple[int, int],
+) -> tuple[str, ...]:
+    families = table.positions[pos][elder]
+    issues = []
+    lo, hi = bounds
+    if not lo <= len(families) <= hi:
+        issues.append(
+            f"Cycle position {pos}: {elder}: {len(families)} families (should be {lo}-{hi})"
+        )
+    if elder_families.get(elder) in families:
+        issues.append(f"Cycle position {pos}: {elder} has their own family in the list!")
+    return tuple(issues)
+
+
+def _check_pair(table: RotationTable, pos: int, elder_idx: int) -> tuple[str, ...]:
+    nxt = (pos + 1) % len(table.encoded)
+    overlap = set(table.encoded[pos][elder_idx]).intersection(table.encoded[nxt][elder_idx])
+    if not overlap:
+        return ()
+    return (
+        f"Cycle position {pos}->{nxt}: {table.elders[elder_idx]} repeats "
+        f"{len(overlap)} families",
+    )
+
+
+def _check_position(table: RotationTable, pos: int, families: frozenset[str]) -> tuple[str, ...]:
+    registry = table.registry
+    seen: set[int] = set()
+    repeated: set[int] = set()
+    for family_ids in table.encoded[pos]:
+        for family_id in family_ids:
+            if family_id in seen:
+                repeated.add(family_id)
+            seen.add(family_id)
+    issues = [
+        f"Cycle position {pos}: {family} assigned more than once"
+        for family in sorted(registry.decode(repeated))
+    ]
+    covered = set(registry.decode(seen))
+    missing = families - covered
+    extra = covered - families
+    if missing:
+        issues.append(f"Cycle position {pos}: {len(missing)} families missing: {sorted(missing)[:5]}")
+    if extra:
+        issues.append(f"Cycle position {pos}: {len(extra)} unknown families: {sorted(extra)[:5]}")
+    return tuple(issues)
+
+
+def _position_still_exact(
+    previous: VerificationResult,
+    table: RotationTable,
+    pos: int,
+    changed: Iterable[str],
+    families: frozenset[str],
+    added: frozenset[str],
+    removed: frozenset[str],
+) -> bool:
+    """Return whether position ``pos`` still covers ``families`` exactly once.
+
+    Only valid when the previous result had no issues at ``pos``: the
+    untouched cells then hold ``previous.families`` minus the old contents
+    ``X`` of the ``changed`` cells, each once, so the position is exact iff
+    the new contents ``Y`` of those cells are duplicate-free, stay inside
+    ``families``, hold every ``added`` family and no untouched one, and
+    re-cover every surviving family of ``X`` (which must hold every
+    ``removed`` one). That costs O(|X| + |Y|) instead of a full scan.
+    """
+    before = previous.table.positions[pos]
+    after = table.positions[pos]
+    old: set[str] = set()
+    new: set[str] = set()
+    count = 0
+    for elder in changed:
+        old.update(before[elder])
+        new.update(after[elder])
+        count += len(after[elder])
+    if count != len(new):
+        return False
+    if not removed <= old or not added <= new:
+        return False
+    if any(
+        family not in families or (family in previous.families and family not in old)
+        for family in new
+    ):
+        return False
+    return all(family in new for family in old if family in families)
+
+
+def _evaluate(
+    table: RotationTable,
+    cells: Iterable[Cell],
+    pairs: Iterable[Cell],
+    positions: Iterable[int],
+    elder_families: Mapping[str, str],
+    families: frozenset[str],
+    bounds: tuple[int, int],
+) -> tuple[dict[Cell, tuple[str, ...]], dict[Cell, tuple[str, ...]], dict[int, tuple[str, ...]]]:
+    elder_index = {elder: idx for idx, elder in enumerate(table.elders)}
+    cell_issues = {
+        (pos, elder): _check_cell(table, pos, elder, elder_families, bounds)
+        for pos, elder in cells
+    }
+    pair_issues = {
+        (pos, elder): _check_pair(table, pos, elder_index[elder]) for pos, elder in pairs
+    }
+    position_issues = {pos: _check_position(table, pos, families) for pos in positions}
+    return cell_issues, pair_issues, position_issues
+
+
+def verify_full(
+    table: RotationTable,
+    elder_families: Mapping[str, str],
+    reassignment_map: Mapping[int, Mapping[str, str]],
+    families: Iterable[str],
+    min_count: int,
+    max_count: int,
+) -> VerificationResult:
+    """Check every cell, pair and position of ``table`` from scratch."""
+    families = frozenset(families)
+    bounds = (min_count, max_count)
+    every_cell = [(pos, elder) for pos in range(len(table.positions)) for elder in table.elders]
+    cell_issues, pair_issues, position_issues = _evaluate(
+        table, every_cell, every_cell, range(len(table.positions)),
+        elder_families, families, bounds,
+    )
+    return VerificationResult(
+        table=table,
+        elders=table.elders,
+        elder_families=dict(elder_families),
+        reassignment_map={pos: dict(m) for pos, m in reassignment_map.items()},
+        families=families,
+        bounds=bounds,
+        cell_issues=cell_issues,
+        pair_issues=pair_issues,
+        position_issues=position_issues,
+        checked=len(cell_issues) + len(pair_issues) + len(position_issues),
+    )
+
+
+def affected_checks(
+    previous: VerificationResult,
+    table: RotationTable,
+    delta: ChangeDelta,
+    elder_families: Mapping[str, str],
+    reassignment_map: Mapping[int, Mapping[str, str]],
+) -> tuple[set[Cell], set[Cell], set[int]]:
+    """Return the ``(cells, pairs, positions)`` that ``delta`` can affect.
+
+    Own-family and map differences between ``previous`` and the new inputs
+    are added to whatever ``delta`` declares.
+    """
+    pool_count = len(table.positions)
+    elders = table.elders
+    pools = delta.pools
+
+    owners = set(delta.elders)
+    owners.update(
+        elder for elder in elders
+        if previous.elder_families.get(elder) != elder_families.get(elder)
+    )
+    touched = set(pools.added) | set(pools.removed) | set(pools.moved)
+    owners.update(
+        elder for elder in elders
+        if elder_families.get(elder) in touched or previous.elder_families.get(elder) in touched
+    )
+    map_positions = set(delta.map_positions)
+    map_positions.update(
+        pos for pos in set(previous.reassignment_map) | set(reassignment_map)
+        if dict(previous.reassignment_map.get(pos, {})) != dict(reassignment_map.get(pos, {}))
+    )
+
+    cells: set[Cell] = set()
+    # Whoever holds a changed pool in each position.
+    for pool_idx in pools.affected_pools:
+        for pos in range(pool_count):
+            cells.add((pos, elders[(pool_idx - pos) % pool_count]))
+    # An owner's whole row, plus the targets of their reassignments.
+    for elder in owners:
+        cells.update((pos, elder) for pos in range(pool_count))
+    for mapping in (previous.reassignment_map, reassignment_map):
+        for pos, entries in mapping.items():
+            for owner, target in entries.items():
+                if owner in owners or pos in map_positions:
+                    cells.add((pos, owner))
+                    cells.add((pos, target))
+
+    pairs = set(cells)
+    pairs.update(((pos - 1) % pool_count, elder) for pos, elder in cells)
+    if pools:
+        # The directory itself changed: every position's coverage is in play.
+        positions = set(range(pool_count))
+    else:
+        positions = {pos for pos, _ in cells}
+    return cells, pairs, positions
+
+
+def reverify(
+    previous: VerificationResult,
+    table: RotationTable,
+    delta: ChangeDelta,
+    elder_families: Mapping[str, str],
+    reassignment_map: Mapping[int, Mapping[str, str]],
+    families: Iterable[str],
+    min_count: Optional[int] = None,
+    max_count: Optional[int] = None,
+) -> VerificationResult:
+    """Re-check only what ``delta`` can affect, reusing ``previous`` otherwise.
+
+    ``table`` must be built from the new inputs. Bounds default to the
+    previous ones; when the roster, cycle length or bounds differ, nothing
+    can be reused and this falls back to :func:`verify_full`.
+    """
+    bounds = (
+        previous.bounds[0] if min_count is None else min_count,
+        previous.bounds[1] if max_count is None else max_count,
+    )
+    if (
+        table.elders != previous.elders
+        or bounds != previous.bounds
+        or len(table.positions) != len(previous.position_issues)
+    ):
+        return verify_full(table, elder_families, reassignment_map, families, *bounds)
+
+    families = frozenset(families)
+    cells, pairs, positions = affected_checks(
+        previous, table, delta, elder_families, reassignment_map
+    )
+    new_cells, new_pairs, _ = _evaluate(
+        table, cells, pairs, (), elder_families, families, bounds
+    )
+    changed_by_position: dict[int, list[str]] = {pos: [] for pos in positions}
+    for pos, elder in cells:
+        changed_by_position[pos].append(elder)
+    added = families - previous.families
+    removed = previous.families - families
+    new_positions = {}
+    for pos, changed in changed_by_position.items():
+        if not previous.position_issues[pos] and _position_still_exact(
+            previous, table, pos, changed, families, added, removed
+        ):
+            new_positions[pos] = ()
+        else:
+            new_positions[pos] = _check_position(table, pos, families)
+    return VerificationResult(
+        table=table,
+        elders=table.elders,
+        elder_families=dict(elder_families),
+        reassignment_map={pos: dict(m) for pos, m in reassignment_map.items()},
+        families=families,
+        bounds=bounds,
+        cell_issues={**previous.cell_issues, **new_cells},
+        pair_issues={**previous.pair_issues, **new_pairs},
+        position_issues={**previous.position_issues, **new_positions},
+        checked=len(new_cells) + len(new_pairs) + len(new_positions),
+    )
@@ -0,0 +1,78 @@
+"""Console logging for the prayer schedule package.
+
+Every module logs through ``logging.getLogger(__name__)`` under the
+``prayer_schedule`` logger instead of calling ``print``. Nothing is written
+until :func:`configure_logging` attaches the console handler, which the
+daily run (:func:`~prayer_schedule.cli.main`) and every script in the
+repository do on start-up; code using the package as a library calls it
+too to see the report. The handler
+emits the bare message, so the ``[OK]``/``[X]`` console format is unchanged;
+levels decide what is shown:
+
+* ``DEBUG`` — per-call detail from hot paths such as week calculation;
+* ``INFO`` — the daily run's progress report (the default);
+* ``WARNING`` — quiet mode for batch runs and CI: only problems;
+* ``ERROR`` — failed checks and aborts.
+
+The default level comes from ``PRAYER_SCHEDULE_LOG_LEVEL``
+(:data:`~prayer_schedule.config.LOG_LEVEL`).
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+from typing import Optional, Union
+
+from . import config
+
+logger = logging.getLogger("prayer_schedule")
+
+
+class _ConsoleHandler(logging.StreamHandler):
+    """Stream handler bound to whatever ``sys.stdout`` is at emit time.
+
+    Binding late keeps ``contextlib.redirect_stdout`` (per-tenant capture in
+    :mod:`prayer_schedule.batch`) and pytest's ``capsys`` working.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):  # type: ignore[override]
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+
+_HANDLER: Optional[_ConsoleHandler] = None
+
+
+def configure_logging(
+    level: Union[int, str, None] = None,
+    quiet: bool = False,
+) -> logging.Logger:
+    """Attach the console handler to the package logger and set its level.
+
+    ``quiet=True`` selects ``WARNING``. Otherwise ``level`` defaults to
+    :data:`~prayer_schedule.config.LOG_LEVEL` on the first call and leaves
+    the current level alone on later calls, so an earlier quiet or debug
+    setting survives :func:`~prayer_schedule.cli.main` calling this again.
+    Safe to call repeatedly; returns the package logger.
+    """
+    global _HANDLER
+    first = _HANDLER is None
+    if first:
+        _HANDLER = _ConsoleHandler()
+        _HANDLER.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(_HANDLER)
+    if quiet:
+        logger.setLevel(logging.WARNING)
+    elif level is not None:
+        logger.setLevel(level)
+    elif first:
+        logger.setLevel(config.LOG_LEVEL)
+    return logger
@@ -1,82 +1,74 @@
-"""Generate the HTML and plain-text schedule files for the current week.
+"""Generate the HTML, plain-text and JSON schedule files for the current week.
 
 The public orchestrator :func:`generate_schedule_content` returns the
 ``(html, text)`` tuple that ``cli.main`` writes to disk. The two content
 formats are produced by :func:`generate_html_schedule` and
 :func:`generate_text_schedule` respectively. Both must remain **byte-identical**
-to the original single-file implementation, so the f-string literals below
+to the original single-file implementation, so the template literals below
 preserve every space, newline, and indentation character from that version.
+
+The literals are ``str.format`` constants (family lines, the hot path, are
+f-strings inline); each renderer collects the pieces in a list and joins
+them once, so rendering stays linear in the number of families.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime, timedelta
+from typing import Iterator, Mapping, Optional, Sequence
 
-from .config import CENTRAL_TZ
+from .config import CENTRAL_TZ, CHURCH_NAME
+from .algorithm import calculate_continuous_week
 from .elders import get_week_schedule
 from .utils import escape_attr, escape_html
 
 
-def generate_html_schedule(
-    week_number: int,
-    start_date: datetime,
-    elder_assignments: dict[str, list[str]],
-) -> str:
-    """Build the HTML version of the weekly schedule as a single string.
+DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
-    The output intentionally preserves the exact formatting of the previous
-    single-file implementation (including indentation, embedded CSS, inline
-    JavaScript, and the "Last updated" timestamp line).
-    """
-    schedule = get_week_schedule(week_number)
-    end_date = start_date + timedelta(days=6)
-    date_range = f"{start_date.strftime('%B %d')} - {end_date.strftime('%B %d, %Y')}"
+# Family lines per chunk yielded by the iter_* renderers.
+STREAM_BATCH = 512
 
-    # HTML version for desktop - Professional style with FIXED ENCODING
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <title>Prayer Schedule - Week {week_number}</title>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="refresh" content="3600">
-    <style>
-        body {{
+# Stylesheet and day-highlighting script. The desktop copy inlines them;
+# the published page links them as shared, content-hashed files (see
+# :func:`html_assets`) so browsers cache them across the hourly refresh.
+_STYLES = """        body {
             font-family: 'Segoe UI', Arial, sans-serif;
             line-height: 1.6;
             color: #333;
             margin: 0;
             padding: 20px;
             background: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
-        .header {{
+        }
+        .header {
             background: #2c3e50;
             color: white;
             padding: 30px;
             text-align: center;
-        }}
-        .header h1 {{ margin: 0 0 10px 0; font-size: 2.5em; }}
-        .header h2 {{ margin: 0 0 10px 0; font-size: 1.8em; }}
-        .header h3 {{ margin: 0; font-size: 1.2em; opacity: 0.9; }}
-        .content {{ padding: 30px; }}
+        }
+        .header h1 { margin: 0 0 10px 0; font-size: 2.5em; }
+        .header h2 { margin: 0 0 10px 0; font-size: 1.8em; }
+        .header h3 { margin: 0; font-size: 1.2em; opacity: 0.9; }
+        .content { padding: 30px; }
         /* Day-of-week navigation bar */
-        .day-nav {{
+        .day-nav {
             display: flex;
             justify-content: center;
             gap: 4px;
             padding: 15px 20px;
             background: #1a252f;
             flex-wrap: wrap;
-        }}
-        .day-nav .day-pill {{
+        }
+        .day-nav .day-pill {
             padding: 10px 18px;
             border-radius: 25px;
             font-size: 0.95em;
@@ -88,155 +80,251 @@ def generate_html_schedule(
             cursor: default;
             text-align: center;
             min-width: 80px;
-        }}
-        .day-nav .day-pill.today {{
+        }
+        .day-nav .day-pill.today {
             background: #e67e22;
             color: white;
             border-color: #e67e22;
             box-shadow: 0 2px 12px rgba(230, 126, 34, 0.4);
             transform: scale(1.08);
-        }}
-        .day-nav .day-pill.past {{
+        }
+        .day-nav .day-pill.past {
             color: #5a6a7a;
             border-color: #2c3e50;
-        }}
-        .day-nav .day-pill.future {{
+        }
+        .day-nav .day-pill.future {
             color: #8899a6;
             border-color: #2c3e50;
-        }}
-        .day-nav .day-pill .day-label {{
+        }
+        .day-nav .day-pill .day-label {
             display: block;
             font-size: 0.85em;
             opacity: 0.7;
-        }}
-        .day-nav .day-pill.today .day-label {{
+        }
+        .day-nav .day-pill.today .day-label {
             opacity: 1;
-        }}
+        }
         /* Today's prayer focus banner */
-        .today-banner {{
+        .today-banner {
             background: linear-gradient(135deg, #e67e22, #d35400);
             color: white;
             padding: 25px 30px;
             text-align: center;
             display: none;
-        }}
-        .today-banner h2 {{
+        }
+        .today-banner h2 {
             margin: 0 0 8px 0;
             font-size: 1.5em;
-        }}
-        .today-banner .today-elder {{
+        }
+        .today-banner .today-elder {
             font-size: 1.3em;
             font-weight: bold;
             margin: 5px 0;
-        }}
-        .today-banner .today-count {{
+        }
+        .today-banner .today-count {
             font-size: 0.95em;
             opacity: 0.9;
-        }}
-        .schedule-table {{
+        }
+        .schedule-table {
             width: 100%;
             border-collapse: collapse;
             margin: 30px 0;
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
-        .schedule-table th, .schedule-table td {{
+        }
+        .schedule-table th, .schedule-table td {
             border: 1px solid #ddd;
             padding: 15px;
             text-align: left;
-        }}
-        .schedule-table th {{
+        }
+        .schedule-table th {
             background: #3498db;
             color: white;
             font-size: 1.1em;
-        }}
-        .schedule-table tr:nth-child(even) {{ background-color: #f8f9fa; }}
-        .schedule-table tr:hover {{ background-color: #e8f4f8; }}
-        .schedule-table tr.today-row {{
+        }
+        .schedule-table tr:nth-child(even) { background-color: #f8f9fa; }
+        .schedule-table tr:hover { background-color: #e8f4f8; }
+        .schedule-table tr.today-row {
             background-color: #fef3e2 !important;
             border-left: 4px solid #e67e22;
-        }}
-        .schedule-table tr.today-row td {{
+        }
+        .schedule-table tr.today-row td {
             font-weight: bold;
             color: #d35400;
-        }}
-        .highlight {{ background-color: #fff3cd !important; font-weight: bold; }}
-        .prayer-list {{
+        }
+        .highlight { background-color: #fff3cd !important; font-weight: bold; }
+        .prayer-list {
             margin: 40px 0;
             page-break-inside: avoid;
             border-left: 4px solid #3498db;
             padding-left: 20px;
-        }}
-        .prayer-list.today-prayer-list {{
+        }
+        .prayer-list.today-prayer-list {
             border-left-color: #e67e22;
             background: #fef9f3;
             padding: 20px;
             border-radius: 0 8px 8px 0;
-        }}
-        .prayer-list h3 {{
+        }
+        .prayer-list h3 {
             color: #2c3e50;
             border-bottom: 2px solid #3498db;
             padding-bottom: 10px;
             font-size: 1.3em;
-        }}
-        .prayer-list.today-prayer-list h3 {{
+        }
+        .prayer-list.today-prayer-list h3 {
             color: #d35400;
             border-bottom-color: #e67e22;
-        }}
-        .family-list {{
+        }
+        .family-list {
             columns: 2;
             column-gap: 40px;
             list-style-type: none;
             padding: 0;
-        }}
-        .family-list li {{
+        }
+        .family-list li {
             margin: 8px 0;
             padding: 5px;
             border-radius: 5px;
             transition: background-color 0.3s;
-        }}
-        .family-list li:hover {{
+        }
+        .family-list li:hover {
             background-color: #e8f4f8;
-        }}
-        .family-list li:before {{
+        }
+        .family-list li:before {
             content: "\\2022";  /* FIXED: Using proper CSS escape for bullet */
             color: #3498db;
             font-weight: bold;
             margin-right: 8px;
-        }}
-        .today-prayer-list .family-list li:before {{
+        }
+        .today-prayer-list .family-list li:before {
             color: #e67e22;
-        }}
-        .update-time {{
+        }
+        .update-time {
             text-align: center;
             color: #7f8c8d;
             margin-top: 20px;
             font-style: italic;
-        }}
-        .note {{
+        }
+        .note {
             background-color: #e8f4fd;
             border-left: 4px solid #3498db;
             padding: 15px;
             margin: 20px 0;
-        }}
-        @media print {{
-            body {{ background: white; }}
-            .container {{ box-shadow: none; }}
-            .day-nav {{ display: none; }}
-            .today-banner {{ display: none !important; }}
-        }}
-        @media (max-width: 600px) {{
-            .day-nav .day-pill {{
+        }
+        @media print {
+            body { background: white; }
+            .container { box-shadow: none; }
+            .day-nav { display: none; }
+            .today-banner { display: none !important; }
+        }
+        @media (max-width: 600px) {
+            .day-nav .day-pill {
                 padding: 8px 10px;
                 min-width: 40px;
                 font-size: 0.8em;
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+_SCRIPT = """    (function() {
+        // Get today's date in YYYY-MM-DD format (local timezone)
+        var now = new Date();
+        var yyyy = now.getFullYear();
+        var mm = String(now.getMonth() + 1).padStart(2, '0');
+        var dd = String(now.getDate()).padStart(2, '0');
+        var todayStr = yyyy + '-' + mm + '-' + dd;
+        var todayDayIdx = now.getDay(); // 0=Sun, 1=Mon, ...
+
+        // Highlight the day pill
+        var pills = document.querySelectorAll('.day-pill');
+        var foundToday = false;
+        pills.forEach(function(pill) {
+            var pillDate = pill.getAttribute('data-date');
+            if (pillDate === todayStr) {
+                pill.classList.add('today');
+                foundToday = true;
+            } else if (pillDate < todayStr) {
+                pill.classList.add('past');
+            } else {
+                pill.classList.add('future');
+            }
+        });
+
+        // Highlight today's row in the schedule table
+        var rows = document.querySelectorAll('.schedule-table tr[data-date]');
+        rows.forEach(function(row) {
+            if (row.getAttribute('data-date') === todayStr) {
+                row.classList.add('today-row');
+            }
+        });
+
+        // Highlight today's prayer list sections and show the banner
+        var prayerLists = document.querySelectorAll('.prayer-list[data-date]');
+        var todayElders = [];
+        var todayFamilyCount = 0;
+        prayerLists.forEach(function(pl) {
+            if (pl.getAttribute('data-date') === todayStr) {
+                pl.classList.add('today-prayer-list');
+                todayElders.push(pl.getAttribute('data-elder'));
+                todayFamilyCount += parseInt(pl.getAttribute('data-count') || '0');
+            }
+        });
+
+        // Show the today banner if we found today in the schedule
+        if (todayElders.length > 0) {
+            var banner = document.getElementById('todayBanner');
+            var elderEl = document.getElementById('todayElder');
+            var countEl = document.getElementById('todayCount');
+            if (banner && elderEl && countEl) {
+                elderEl.textContent = todayElders.join(' & ');
+                countEl.textContent = todayFamilyCount + ' families being prayed for today';
+                banner.style.display = 'block';
+            }
+        }
+    })();
+"""
+
+ASSET_DIR = "assets"
+
+
+def _asset_path(stem: str, content: str, suffix: str) -> str:
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    return f"{ASSET_DIR}/{stem}.{digest}{suffix}"
+
+
+STYLESHEET_PATH = _asset_path("prayer_schedule", _STYLES, ".css")
+SCRIPT_PATH = _asset_path("prayer_schedule", _SCRIPT, ".js")
+
+_INLINE_STYLES = f"    <style>\n{_STYLES}    </style>"
+_INLINE_SCRIPT = f"    <script>\n{_SCRIPT}    </script>"
+_LINKED_STYLES = f'    <link rel="stylesheet" href="{STYLESHEET_PATH}">'
+_LINKED_SCRIPT = f'    <script src="{SCRIPT_PATH}"></script>'
+
+
+def html_assets() -> dict[str, str]:
+    """Return the shared asset files as ``{relative path: content}``.
+
+    Paths are relative to the output directory and carry a hash of their
+    content, so they can be served with a long cache lifetime: any change
+    to the styles or script yields a new name, and pages linking the old
+    one keep working until they are regenerated.
+    """
+    return {STYLESHEET_PATH: _STYLES, SCRIPT_PATH: _SCRIPT}
+
+
+# HTML version for desktop - Professional style with FIXED ENCODING
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <title>Prayer Schedule - Week {week_number}</title>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta http-equiv="refresh" content="3600">
+{styles}
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>Crossville Church of Christ</h1>
+            <h1>{church}</h1>
             <h2>Elder Prayer Schedule - Week {week_number}</h2>
             <h3>{date_range}</h3>
         </div>
@@ -245,20 +333,13 @@ def generate_html_schedule(
         <div class="day-nav" id="dayNav">
     """
 
-    # Generate day pills with data attributes for JS highlighting
-    current_date_for_nav = start_date
-    for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
-        elders_for_day = schedule[day]
-        elder_names_for_nav = " & ".join(elders_for_day)
-        date_str = current_date_for_nav.strftime('%Y-%m-%d')
-        html += f"""        <div class="day-pill" data-date="{date_str}" data-day="{day}">
-                {day[:3]}
-                <span class="day-label">{current_date_for_nav.strftime('%b %d')}</span>
+_HTML_DAY_PILL = """        <div class="day-pill" data-date="{date}" data-day="{day}">
+                {abbrev}
+                <span class="day-label">{label}</span>
             </div>
     """
-        current_date_for_nav += timedelta(days=1)
 
-    html += f"""    </div>
+_HTML_TABLE_OPEN = """    </div>
 
         <!-- Today's prayer focus banner (shown dynamically via JS) -->
         <div class="today-banner" id="todayBanner">
@@ -283,198 +364,346 @@ def generate_html_schedule(
                 </tr>
     """
 
-    # Add daily schedule rows.
-    current_date = start_date
-    for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
-        elders = schedule[day]
-        elder_names = " &amp; ".join(escape_html(e) for e in elders)
-        highlight_class = "highlight" if len(elders) > 1 else ""
-        date_attr = current_date.strftime('%Y-%m-%d')
-
-        html += f"""
-                <tr class="{highlight_class}" data-date="{date_attr}" data-day="{day}">
+_HTML_ROW = """
+                <tr class="{highlight}" data-date="{date}" data-day="{day}">
                     <td><strong>{day}</strong></td>
-                    <td>{current_date.strftime('%B %d')}</td>
-                    <td>{elder_names}</td>
+                    <td>{label}</td>
+                    <td>{elders}</td>
                 </tr>
         """
-        current_date += timedelta(days=1)
-
-    # NOTE: The original template contains trailing whitespace after the
-    # </table> line (and before the <h2>).  It is reproduced verbatim here so
-    # the emitted HTML is byte-identical to the pre-refactor output.
-    html += (
-        "\n"
-        "            </table>\n"
-        "            \n"
-        "            <h2>Prayer Lists for This Week</h2>\n"
-        "    "
-    )
-
-    # Add prayer lists.
-    current_date = start_date
-    for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
-        elders = schedule[day]
-        date_attr = current_date.strftime('%Y-%m-%d')
 
-        for elder in elders:
-            prayer_group = elder_assignments[elder]
-            elder_attr = escape_attr(elder)
-            elder_text = escape_html(elder)
-
-            html += f"""
-            <div class="prayer-list" data-date="{date_attr}" data-day="{day}" data-elder="{elder_attr}" data-count="{len(prayer_group)}">
-                <h3>{elder_text} - {day}, {current_date.strftime('%B %d')}</h3>
-                <p><em>{len(prayer_group)} families to pray for:</em></p>
+# NOTE: The original template contains trailing whitespace after the
+# </table> line (and before the <h2>).  It is reproduced verbatim here so
+# the emitted HTML is byte-identical to the pre-refactor output.
+_HTML_LISTS_OPEN = (
+    "\n"
+    "            </table>\n"
+    "            \n"
+    "            <h2>Prayer Lists for This Week</h2>\n"
+    "    "
+)
+
+_HTML_LIST_OPEN = """
+            <div class="prayer-list" data-date="{date}" data-day="{day}" data-elder="{elder_attr}" data-count="{count}">
+                <h3>{elder} - {day}, {label}</h3>
+                <p><em>{count} families to pray for:</em></p>
                 <ul class="family-list">
             """
 
-            for family in prayer_group:
-                family_escaped = escape_html(family)
-                html += f"            <li>{family_escaped}</li>\n"
-
-            html += """            </ul>
+_HTML_LIST_CLOSE = """            </ul>
             </div>
             """
 
-        current_date += timedelta(days=1)
-
-    # Footer with JavaScript for dynamic day highlighting.
-    # Use Central time so the "Last updated" stamp reflects church-local
-    # calendar/clock, not the runner's UTC; matches archive/log timestamps.
-    html += f"""
+# Footer with JavaScript for dynamic day highlighting.
+_HTML_FOOTER = """
             <div class="update-time">
-                Last updated: {datetime.now(CENTRAL_TZ).strftime('%B %d, %Y at %I:%M %p')}
+                Last updated: {updated}
                 <br>Daily emails sent every morning. Schedule regenerated each Monday.
             </div>
         </div>
     </div>
 
-    <script>
-    (function() {{
-        // Get today's date in YYYY-MM-DD format (local timezone)
-        var now = new Date();
-        var yyyy = now.getFullYear();
-        var mm = String(now.getMonth() + 1).padStart(2, '0');
-        var dd = String(now.getDate()).padStart(2, '0');
-        var todayStr = yyyy + '-' + mm + '-' + dd;
-        var todayDayIdx = now.getDay(); // 0=Sun, 1=Mon, ...
+{script}
+</body>
+</html>
+    """
 
-        // Highlight the day pill
-        var pills = document.querySelectorAll('.day-pill');
-        var foundToday = false;
-        pills.forEach(function(pill) {{
-            var pillDate = pill.getAttribute('data-date');
-            if (pillDate === todayStr) {{
-                pill.classList.add('today');
-                foundToday = true;
-            }} else if (pillDate < todayStr) {{
-                pill.classList.add('past');
-            }} else {{
-                pill.classList.add('future');
-            }}
-        }});
+_TEXT_HEAD = """============================================================
+{church}
+Week {week_number}: {date_range}
+============================================================
 
-        // Highlight today's row in the schedule table
-        var rows = document.querySelectorAll('.schedule-table tr[data-date]');
-        rows.forEach(function(row) {{
-            if (row.getAttribute('data-date') === todayStr) {{
-                row.classList.add('today-row');
-            }}
-        }});
+Note: Each day of the week has one elder assigned.
 
-        // Highlight today's prayer list sections and show the banner
-        var prayerLists = document.querySelectorAll('.prayer-list[data-date]');
-        var todayElders = [];
-        var todayFamilyCount = 0;
-        prayerLists.forEach(function(pl) {{
-            if (pl.getAttribute('data-date') === todayStr) {{
-                pl.classList.add('today-prayer-list');
-                todayElders.push(pl.getAttribute('data-elder'));
-                todayFamilyCount += parseInt(pl.getAttribute('data-count') || '0');
-            }}
-        }});
+"""
 
-        // Show the today banner if we found today in the schedule
-        if (todayElders.length > 0) {{
-            var banner = document.getElementById('todayBanner');
-            var elderEl = document.getElementById('todayElder');
-            var countEl = document.getElementById('todayCount');
-            if (banner && elderEl && countEl) {{
-                elderEl.textContent = todayElders.join(' & ');
-                countEl.textContent = todayFamilyCount + ' families being prayed for today';
-                banner.style.display = 'block';
-            }}
-        }}
-    }})();
-    </script>
-</body>
-</html>
+_TEXT_DAY = "{day}, {label}: {elders}\n"
+
+_TEXT_LISTS_OPEN = f"\n{'='*60}\nPRAYER LISTS\n{'='*60}\n"
+
+_TEXT_LIST_OPEN = (
+    "\n{elder} - {day}, {label}\n"
+    + "-" * 50 + "\n"
+    "{count} families:\n\n"
+)
+
+_TEXT_FOOTER = "=" * 60 + "\n" + "-- {church} Elder Ministry --\n"
+
+
+def format_stamp(moment: datetime) -> str:
+    """Return the page's "Last updated" text for ``moment``."""
+    # Use Central time so the "Last updated" stamp reflects church-local
+    # calendar/clock, not the runner's UTC; matches archive/log timestamps.
+    return moment.astimezone(CENTRAL_TZ).strftime('%B %d, %Y at %I:%M %p')
+
+
+def updated_stamp() -> str:
+    """Return the page's "Last updated" text for the current moment."""
+    return format_stamp(datetime.now(CENTRAL_TZ))
+
+
+def iter_html_schedule(
+    week_number: int,
+    start_date: datetime,
+    elder_assignments: Mapping[str, Sequence[str]],
+    schedule: Optional[Mapping[str, Sequence[str]]] = None,
+    inline_assets: bool = True,
+    updated: Optional[str] = None,
+    church: str = CHURCH_NAME,
+) -> Iterator[str]:
+    """Yield the HTML version of the weekly schedule in chunks.
+
+    The output intentionally preserves the exact formatting of the previous
+    single-file implementation (including indentation, embedded CSS, inline
+    JavaScript, and the "Last updated" timestamp line). ``schedule`` (day ->
+    elders) defaults to :func:`get_week_schedule` for the continuous week
+    of ``start_date``. With ``inline_assets`` false the page links the
+    files from :func:`html_assets` instead of embedding the stylesheet and
+    script. ``updated`` replaces the :func:`updated_stamp` text and
+    ``church`` is the congregation named in the header.
+
+    Family lists are yielded :data:`STREAM_BATCH` lines at a time, so a
+    consumer writing each chunk out holds a bounded amount of text however
+    large the directory is.
     """
+    if schedule is None:
+        schedule = get_week_schedule(calculate_continuous_week(start_date))
+    end_date = start_date + timedelta(days=6)
+    date_range = f"{start_date.strftime('%B %d')} - {end_date.strftime('%B %d, %Y')}"
+    dates = [start_date + timedelta(days=offset) for offset in range(7)]
+
+    yield _HTML_HEAD.format(
+        church=escape_html(church),
+        week_number=week_number,
+        date_range=date_range,
+        styles=_INLINE_STYLES if inline_assets else _LINKED_STYLES,
+    )
 
-    return html
+    # Day pills with data attributes for JS highlighting.
+    yield "".join([
+        _HTML_DAY_PILL.format(
+            date=current_date.strftime('%Y-%m-%d'),
+            day=day,
+            abbrev=day[:3],
+            label=current_date.strftime('%b %d'),
+        )
+        for day, current_date in zip(DAYS, dates)
+    ])
+
+    yield _HTML_TABLE_OPEN
+
+    # Daily schedule rows.
+    yield "".join([
+        _HTML_ROW.format(
+            highlight="highlight" if len(schedule[day]) > 1 else "",
+            date=current_date.strftime('%Y-%m-%d'),
+            day=day,
+            label=current_date.strftime('%B %d'),
+            elders=" &amp; ".join(escape_html(e) for e in schedule[day]),
+        )
+        for day, current_date in zip(DAYS, dates)
+    ])
+
+    yield _HTML_LISTS_OPEN
+
+    # Prayer lists.
+    for day, current_date in zip(DAYS, dates):
+        date_attr = current_date.strftime('%Y-%m-%d')
+        label = current_date.strftime('%B %d')
+        for elder in schedule[day]:
+            prayer_group = elder_assignments[elder]
+            yield _HTML_LIST_OPEN.format(
+                date=date_attr,
+                day=day,
+                elder_attr=escape_attr(elder),
+                count=len(prayer_group),
+                elder=escape_html(elder),
+                label=label,
+            )
+            for first in range(0, len(prayer_group), STREAM_BATCH):
+                yield "".join([
+                    f"            <li>{escape_html(family)}</li>\n"
+                    for family in prayer_group[first:first + STREAM_BATCH]
+                ])
+            yield _HTML_LIST_CLOSE
+
+    yield _HTML_FOOTER.format(
+        updated=updated_stamp() if updated is None else updated,
+        script=_INLINE_SCRIPT if inline_assets else _LINKED_SCRIPT,
+    )
 
 
-def generate_text_schedule(
+def generate_html_schedule(
     week_number: int,
     start_date: datetime,
-    elder_assignments: dict[str, list[str]],
+    elder_assignments: Mapping[str, Sequence[str]],
+    schedule: Optional[Mapping[str, Sequence[str]]] = None,
+    inline_assets: bool = True,
+    updated: Optional[str] = None,
+    church: str = CHURCH_NAME,
 ) -> str:
-    """Build the plain-text version of the weekly schedule as a single string."""
-    schedule = get_week_schedule(week_number)
+    """Build the HTML version of the weekly schedule as a single string.
+
+    See :func:`iter_html_schedule` for the arguments.
+    """
+    return "".join(iter_html_schedule(
+        week_number, start_date, elder_assignments, schedule, inline_assets, updated, church
+    ))
+
+
+def iter_text_schedule(
+    week_number: int,
+    start_date: datetime,
+    elder_assignments: Mapping[str, Sequence[str]],
+    schedule: Optional[Mapping[str, Sequence[str]]] = None,
+    church: str = CHURCH_NAME,
+) -> Iterator[str]:
+    """Yield the plain-text version of the weekly schedule in chunks.
+
+    ``church`` is the congregation named in the banner and footer.
+    """
+    if schedule is None:
+        schedule = get_week_schedule(calculate_continuous_week(start_date))
     end_date = start_date + timedelta(days=6)
     date_range = f"{start_date.strftime('%B %d')} - {end_date.strftime('%B %d, %Y')}"
+    dates = [start_date + timedelta(days=offset) for offset in range(7)]
 
-    text = f"""============================================================
-CROSSVILLE CHURCH OF CHRIST
-Week {week_number}: {date_range}
-============================================================
+    yield _TEXT_HEAD.format(
+        church=church.upper(), week_number=week_number, date_range=date_range
+    )
 
-Note: Each day of the week has one elder assigned.
+    # Daily schedule.
+    yield "".join([
+        _TEXT_DAY.format(
+            day=day,
+            label=current_date.strftime('%B %d'),
+            elders=" & ".join(schedule[day]),
+        )
+        for day, current_date in zip(DAYS, dates)
+    ])
+
+    yield _TEXT_LISTS_OPEN
+
+    # Prayer lists.
+    for day, current_date in zip(DAYS, dates):
+        label = current_date.strftime('%B %d')
+        for elder in schedule[day]:
+            prayer_group = elder_assignments[elder]
+            yield _TEXT_LIST_OPEN.format(
+                elder=elder, day=day, label=label, count=len(prayer_group),
+            )
+            for first in range(0, len(prayer_group), STREAM_BATCH):
+                yield "".join([
+                    f"{number:3}. {family}\n"
+                    for number, family in enumerate(
+                        prayer_group[first:first + STREAM_BATCH], first + 1
+                    )
+                ])
+            yield "\n"
 
-"""
+    yield _TEXT_FOOTER.format(church=church)
 
-    # Add daily schedule.
-    current_date = start_date
-    for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
-        elders = schedule[day]
-        elder_names = " & ".join(elders)
-        text += f"{day}, {current_date.strftime('%B %d')}: {elder_names}\n"
-        current_date += timedelta(days=1)
 
-    text += f"\n{'='*60}\nPRAYER LISTS\n{'='*60}\n"
+def generate_text_schedule(
+    week_number: int,
+    start_date: datetime,
+    elder_assignments: Mapping[str, Sequence[str]],
+    schedule: Optional[Mapping[str, Sequence[str]]] = None,
+    church: str = CHURCH_NAME,
+) -> str:
+    """Build the plain-text version of the weekly schedule as a single string."""
+    return "".join(
+        iter_text_schedule(week_number, start_date, elder_assignments, schedule, church)
+    )
 
-    # Add prayer lists.
-    current_date = start_date
-    for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
-        elders = schedule[day]
 
-        for elder in elders:
-            prayer_group = elder_assignments[elder]
+SCHEDULE_JSON_VERSION = 1
 
-            text += f"\n{elder} - {day}, {current_date.strftime('%B %d')}\n"
-            text += f"{'-'*50}\n"
-            text += f"{len(prayer_group)} families:\n\n"
 
-            for i, family in enumerate(prayer_group, 1):
-                text += f"{i:3}. {family}\n"
+def _compact_json(document: Mapping[str, object]) -> str:
+    return json.dumps(document, ensure_ascii=False, separators=(",", ":")) + "\n"
 
-            text += "\n"
 
-        current_date += timedelta(days=1)
+def generate_json_schedule(
+    week_number: int,
+    start_date: datetime,
+    elder_assignments: Mapping[str, Sequence[str]],
+    schedule: Optional[Mapping[str, Sequence[str]]] = None,
+) -> str:
+    """Return the week as a compact, versioned JSON document.
 
-    text += "=" * 60 + "\n"
-    text += "-- Crossville Church of Christ Elder Ministry --\n"
+    Schema (version :data:`SCHEDULE_JSON_VERSION`)::
 
-    return text
+        {"version": 1, "week": 20, "start": "2026-05-11", "end": "2026-05-17",
+         "days": {"Monday": ["Elder"], ...},
+         "families": ["Last, First", ...],
+         "elders": {"Elder": [0, 1, ...], ...}}
+
+    ``days`` gives the elders praying each day; ``elders`` lists each
+    elder's families, in prayer-list order, as indexes into ``families``,
+    which names every family once. Bump :data:`SCHEDULE_JSON_VERSION` on
+    any change a client would have to know about.
+    """
+    if schedule is None:
+        schedule = get_week_schedule(calculate_continuous_week(start_date))
+    elders = list(dict.fromkeys(elder for day in DAYS for elder in schedule[day]))
+    index: dict[str, int] = {}
+    family_lists = {
+        elder: [index.setdefault(family, len(index)) for family in elder_assignments[elder]]
+        for elder in elders
+    }
+    return _compact_json({
+        "version": SCHEDULE_JSON_VERSION,
+        "week": week_number,
+        "start": f"{start_date:%Y-%m-%d}",
+        "end": f"{start_date + timedelta(days=6):%Y-%m-%d}",
+        "days": {day: list(schedule[day]) for day in DAYS},
+        "families": list(index),
+        "elders": family_lists,
+    })
+
+
+def generate_json_day(
+    week_number: int,
+    start_date: datetime,
+    day: str,
+    elder_assignments: Mapping[str, Sequence[str]],
+    schedule: Optional[Mapping[str, Sequence[str]]] = None,
+) -> str:
+    """Return one day's slice of :func:`generate_json_schedule`.
+
+    ``{"version": 1, "week": 20, "date": "2026-05-12", "day": "Tuesday",
+    "elders": [{"name": "Elder", "families": ["Last, First", ...]}]}`` --
+    a few hundred bytes, with names inline, for clients that only show
+    today.
+    """
+    if schedule is None:
+        schedule = get_week_schedule(calculate_continuous_week(start_date))
+    return _compact_json({
+        "version": SCHEDULE_JSON_VERSION,
+        "week": week_number,
+        "date": f"{start_date + timedelta(days=DAYS.index(day)):%Y-%m-%d}",
+        "day": day,
+        "elders": [
+            {"name": elder, "families": list(elder_assignments[elder])}
+            for elder in schedule[day]
+        ],
+    })
 
 
 def generate_schedule_content(
     week_number: int,
     start_date: datetime,
-    elder_assignments: dict[str, list[str]],
+    elder_assignments: Mapping[str, Sequence[str]],
+    schedule: Optional[Mapping[str, Sequence[str]]] = None,
+    inline_assets: bool = True,
+    church: str = CHURCH_NAME,
 ) -> tuple[str, str]:
     """Return ``(html, text)`` schedule content for the given week."""
-    html = generate_html_schedule(week_number, start_date, elder_assignments)
-    text = generate_text_schedule(week_number, start_date, elder_assignments)
+    if schedule is None:
+        schedule = get_week_schedule(calculate_continuous_week(start_date))
+    html = generate_html_schedule(
+        week_number, start_date, elder_assignments, schedule, inline_assets, church=church
+    )
+    text = generate_text_schedule(week_number, start_date, elder_assignments, schedule, church)
     return html, text
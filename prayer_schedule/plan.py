@@ -0,0 +1,243 @@
+"""Compiled, verified schedule plans.
+
+The directory, roster and reassignment map change rarely, yet every daily
+run used to re-parse the directory, re-validate the roster and map, and
+re-verify two full rotation cycles. :func:`compile_plan` does that work once
+and writes a versioned JSON plan holding the pools, the resolved
+reassignment map, every cycle position's assignments and the verification
+verdict. The plan is keyed by content hashes of its inputs
+(:func:`plan_keys`); :func:`load_plan` returns it only when those keys still
+match and its own checksum is intact, so ``cli.main`` falls back to full
+verification (and recompiles) whenever anything changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Mapping, Optional
+
+from . import config
+from .algorithm import RotationTable
+from .directory import FamilyRegistry
+from .elders import roster_entry
+from .file_io import _atomic_write
+from .tenant import TenantContext
+from .validation import validate_elder_data, validate_reassignment_map, verify_v10_algorithm
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the plan layout changes, so every previously compiled plan
+# is treated as stale. Edits to the rotation rules are caught by
+# :data:`_RULE_MODULES` without a bump.
+PLAN_FORMAT: int = 1
+PLAN_FILE_NAME: str = "prayer_schedule_plan.json"
+
+# Modules whose source determines a plan's pools, map and assignments.
+_RULE_MODULES = ("algorithm.py", "pools.py", "reassignment.py")
+
+_source_hashes: dict[tuple[str, ...], Optional[str]] = {}
+
+
+def _content_hash(value: Any) -> str:
+    canonical = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def source_hash(names: tuple[str, ...]) -> Optional[str]:
+    """Return a hash of the named package modules' source (computed once).
+
+    Returns ``None`` when any of them cannot be read (e.g. a zipapp or an
+    install without ``.py`` files), so callers can fall back instead of
+    failing the run.
+    """
+    if names not in _source_hashes:
+        digest = hashlib.sha256()
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        try:
+            for name in names:
+                with open(os.path.join(package_dir, name), "rb") as handle:
+                    digest.update(handle.read())
+        except OSError as exc:
+            logger.debug(f"   [INFO] Cannot read package source for hashing: {exc}")
+            _source_hashes[names] = None
+        else:
+            _source_hashes[names] = digest.hexdigest()
+    return _source_hashes[names]
+
+
+def plan_path(tenant: TenantContext) -> str:
+    """Return where ``tenant``'s plan lives (next to its schedule files)."""
+    output_dir = config.DESKTOP_DIR if tenant.output_dir is None else tenant.output_dir
+    return os.path.join(output_dir, PLAN_FILE_NAME)
+
+
+def plan_keys(tenant: TenantContext) -> dict[str, str]:
+    """Return the content hashes a plan for ``tenant`` must match.
+
+    A tenant without an explicit map is keyed on the solver's inputs (the
+    family bounds), since the solved map is a pure function of them plus the
+    directory and roster. ``rules`` hashes the rotation modules' source, so
+    a code change invalidates plans too (``"unknown"`` when the source
+    cannot be read, leaving :data:`PLAN_FORMAT` as the only guard).
+    """
+    if tenant.reassignment_map is None:
+        map_key = _content_hash(["solved", list(tenant.family_bounds())])
+    else:
+        map_key = _content_hash(
+            {str(pos): dict(m) for pos, m in tenant.reassignment_map.items()}
+        )
+    return {
+        "format": str(PLAN_FORMAT),
+        "rules": source_hash(_RULE_MODULES) or "unknown",
+        "directory": _content_hash(tenant.directory_csv),
+        "elders": _content_hash([roster_entry(e) for e in tenant.elder_data]),
+        "reassignment_map": map_key,
+        "family_bounds": _content_hash(list(tenant.family_bounds())),
+    }
+
+
+@dataclass(frozen=True)
+class SchedulePlan:
+    """A verified rotation for one set of inputs, ready to serve any week."""
+
+    keys: Mapping[str, str]
+    pools: tuple[tuple[str, ...], ...]
+    reassignment_map: Mapping[int, Mapping[str, str]]
+    table: RotationTable
+    verified_at: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON-ready payload, including its checksum."""
+        body = {
+            "format": PLAN_FORMAT,
+            "keys": dict(self.keys),
+            "pools": [list(pool) for pool in self.pools],
+            "reassignment_map": {
+                str(pos): dict(m) for pos, m in self.reassignment_map.items()
+            },
+            "elders": list(self.table.elders),
+            "positions": [
+                {elder: list(families) for elder, families in assignments.items()}
+                for assignments in self.table.positions
+            ],
+            "verified": True,
+            "verified_at": self.verified_at,
+        }
+        body["checksum"] = _content_hash(body)
+        return body
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "SchedulePlan":
+        """Rebuild a plan from :meth:`to_dict` output.
+
+        Raises :class:`ValueError` on a format mismatch, a bad checksum or
+        an unverified plan.
+        """
+        body = dict(payload)
+        checksum = body.pop("checksum", None)
+        if body.get("format") != PLAN_FORMAT:
+            raise ValueError(f"plan format {body.get('format')!r}, expected {PLAN_FORMAT}")
+        if checksum != _content_hash(body):
+            raise ValueError("plan checksum mismatch")
+        if body.get("verified") is not True:
+            raise ValueError("plan was not verified")
+        pools = tuple(tuple(pool) for pool in body["pools"])
+        registry = FamilyRegistry.from_families(f for pool in pools for f in pool)
+        table = RotationTable.from_positions(body["elders"], body["positions"], registry)
+        return cls(
+            keys=dict(body["keys"]),
+            pools=pools,
+            reassignment_map={int(pos): dict(m) for pos, m in body["reassignment_map"].items()},
+            table=table,
+            verified_at=body["verified_at"],
+        )
+
+    def save(self, path: str) -> None:
+        """Write the plan to ``path`` atomically (see ``file_io._atomic_write``)."""
+        _atomic_write(path, json.dumps(self.to_dict(), ensure_ascii=False, indent=1) + "\n")
+
+
+def load_plan(path: str, keys: Mapping[str, str]) -> Optional[SchedulePlan]:
+    """Return the plan at ``path`` if it is intact and matches ``keys``.
+
+    Returns ``None`` (never raises) when the file is missing, unreadable,
+    corrupt, from another format, or compiled from different inputs.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if payload.get("keys") != dict(keys):
+            return None
+        return SchedulePlan.from_dict(payload)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def compile_plan(
+    tenant: Optional[TenantContext] = None,
+    path: Optional[str] = None,
+) -> Optional[SchedulePlan]:
+    """Validate and verify ``tenant``'s inputs, then save the resulting plan.
+
+    Prints the same ``[OK]``/``[X]`` report as the daily run. Returns
+    ``None`` (and writes nothing) when any check fails. ``tenant`` defaults
+    to :meth:`TenantContext.from_config`, ``path`` to :func:`plan_path`.
+    """
+    if tenant is None:
+        tenant = TenantContext.from_config()
+    if path is None:
+        path = plan_path(tenant)
+
+    elder_count = tenant.expected_elder_count
+    elder_ok, elder_issues = validate_elder_data(
+        tenant.elder_data,
+        tenant.directory_csv,
+        len(tenant.elder_data) if elder_count is None else elder_count,
+    )
+    if not elder_ok:
+        for issue in elder_issues:
+            logger.error(f"   [X] {issue}")
+        logger.error("[X] ELDER DATA VALIDATION FAILED — aborting")
+        return None
+    master_pools = tenant.master_pools()
+    reassignment_map = tenant.resolve_reassignment_map(master_pools)
+    map_ok, map_issues = validate_reassignment_map(
+        master_pools, tenant.elders, tenant.elder_families, reassignment_map
+    )
+    if not map_ok:
+        for issue in map_issues:
+            logger.error(f"   [X] {issue}")
+        logger.error("[X] REASSIGNMENT MAP VALIDATION FAILED — aborting")
+        return None
+    logger.info("[OK] Elder data and reassignment map are consistent.")
+
+    logger.info("\nRunning algorithm verification...")
+    table = tenant.build_rotation_table(master_pools, reassignment_map)
+    min_families, max_families = tenant.family_bounds(master_pools)
+    if not verify_v10_algorithm(
+        table, tenant.elder_families, tenant.families(), min_families, max_families
+    ):
+        logger.error("\n[X] V10 algorithm verification FAILED!")
+        logger.error("Aborting to prevent generating incorrect schedules.")
+        return None
+    logger.info("\n[OK] Algorithm verification PASSED!")
+
+    plan = SchedulePlan(
+        keys=plan_keys(tenant),
+        pools=tuple(tuple(pool) for pool in master_pools),
+        reassignment_map=reassignment_map,
+        table=table,
+        verified_at=datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+    )
+    try:
+        plan.save(path)
+        logger.info(f"[OK] Compiled schedule plan: {path}")
+    except OSError as exc:
+        # A missing plan only costs the next run a full verification.
+        logger.warning(f"   [WARNING] Could not save schedule plan: {exc}")
+    return plan
@@ -0,0 +1,157 @@
+"""Pool construction for arbitrary directory and roster sizes.
+
+:func:`build_pools` balances any number of families across any number of
+pools using extended-slice index arithmetic over one sorted list, so even
+directories of 100k+ families are split in a few milliseconds. Pool sizes
+differ by at most one: with ``N`` families and ``P`` pools, the first
+``N % P`` pools get ``ceil(N / P)`` families and the rest ``floor(N / P)``.
+:class:`PoolIndex` answers "which pool holds this family?" in O(1).
+
+:func:`rebalance_pools` is the incremental alternative to rebuilding: it
+carries existing pools forward across a directory edit, so one family added
+or removed moves at most one other family, and reports exactly what moved.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping, NamedTuple, Optional, Sequence
+
+
+def pool_size_bounds(family_count: int, pool_count: int) -> tuple[int, int]:
+    """Return ``(smallest, largest)`` pool size for a balanced split."""
+    if pool_count < 1:
+        raise ValueError(f"pool_count must be at least 1, got {pool_count}")
+    return family_count // pool_count, -(-family_count // pool_count)
+
+
+def build_pools(families: Iterable[str], pool_count: int) -> list[list[str]]:
+    """Deal ``families`` round-robin into ``pool_count`` sorted pools.
+
+    Family ``i`` of the sorted input lands in pool ``i % pool_count``, which
+    is exactly the slice ``ordered[pool_idx::pool_count]``; slicing a sorted
+    list keeps each pool sorted without a per-pool sort.
+    """
+    if pool_count < 1:
+        raise ValueError(f"pool_count must be at least 1, got {pool_count}")
+    # Timsort is linear on the already-sorted output of parse_directory().
+    ordered = sorted(families)
+    return [ordered[pool_idx::pool_count] for pool_idx in range(pool_count)]
+
+
+@dataclass(frozen=True)
+class PoolIndex:
+    """O(1) membership answers for a fixed set of pools.
+
+    ``pool_of`` maps each family to its pool index and ``members`` holds one
+    frozenset per pool, replacing linear ``family in pool_list`` scans.
+    """
+
+    pool_of: Mapping[str, int]
+    members: tuple[frozenset[str], ...]
+
+    @classmethod
+    def from_pools(cls, pools: Sequence[Sequence[str]]) -> "PoolIndex":
+        """Index ``pools``; each family is expected in exactly one pool."""
+        pool_of = {
+            family: pool_idx
+            for pool_idx, pool in enumerate(pools)
+            for family in pool
+        }
+        members = tuple(frozenset(pool) for pool in pools)
+        return cls(pool_of=MappingProxyType(pool_of), members=members)
+
+    def pool_for(self, family: Optional[str]) -> Optional[int]:
+        """Return the pool index holding ``family``, or ``None``."""
+        return self.pool_of.get(family) if family is not None else None
+
+    def contains(self, pool_idx: int, family: Optional[str]) -> bool:
+        """Return whether ``family`` is in pool ``pool_idx``."""
+        return family is not None and self.pool_of.get(family) == pool_idx
+
+
+class PoolDelta(NamedTuple):
+    """What :func:`rebalance_pools` changed, keyed by family string."""
+
+    added: dict[str, int]
+    removed: dict[str, int]
+    moved: dict[str, tuple[int, int]]
+
+    @property
+    def affected_pools(self) -> set[int]:
+        """Pool indices whose membership changed."""
+        pools = set(self.added.values()) | set(self.removed.values())
+        for source, target in self.moved.values():
+            pools.update((source, target))
+        return pools
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.moved)
+
+
+def rebalance_pools(
+    previous_pools: Sequence[Sequence[str]],
+    families: Iterable[str],
+) -> tuple[list[list[str]], PoolDelta]:
+    """Carry ``previous_pools`` forward onto the directory ``families``.
+
+    Families still present keep their pool. Departed families are dropped,
+    new families (in sorted order) each join the currently smallest pool,
+    and, only if a removal left two pools more than one apart, the
+    alphabetically last family of the largest pool moves to the smallest.
+    Ties go to the lowest pool index, so the result is deterministic.
+
+    A single addition therefore moves nothing else and a single removal
+    moves at most one family; sizes always end within one of each other.
+    Returns ``(new_pools, delta)`` with every pool sorted. Raises
+    :class:`ValueError` if a family appears in more than one previous pool.
+    """
+    pool_count = len(previous_pools)
+    if pool_count < 1:
+        raise ValueError("previous_pools must contain at least one pool")
+
+    current = set(families)
+    previous_index = PoolIndex.from_pools(previous_pools)
+    if len(previous_index.pool_of) != sum(len(pool) for pool in previous_pools):
+        raise ValueError("a family appears in more than one previous pool")
+
+    removed = {
+        family: pool_idx
+        for family, pool_idx in previous_index.pool_of.items()
+        if family not in current
+    }
+    pools = [
+        [family for family in pool if family in current]
+        for pool in previous_pools
+    ]
+
+    def smallest() -> int:
+        return min(range(pool_count), key=lambda idx: (len(pools[idx]), idx))
+
+    added: dict[str, int] = {}
+    for family in sorted(current.difference(previous_index.pool_of)):
+        target = smallest()
+        pools[target].append(family)
+        added[family] = target
+
+    moved: dict[str, tuple[int, int]] = {}
+    while True:
+        target = smallest()
+        source = max(range(pool_count), key=lambda idx: (len(pools[idx]), -idx))
+        if len(pools[source]) - len(pools[target]) <= 1:
+            break
+        family = max(pools[source])
+        pools[source].remove(family)
+        pools[target].append(family)
+        if family in added:
+            added[family] = target
+        else:
+            origin = moved.pop(family, (source, target))[0]
+            if origin == target:
+                continue
+            moved[family] = (origin, target)
+
+    for pool in pools:
+        pool.sort()
+    return pools, PoolDelta(added=added, removed=removed, moved=moved)
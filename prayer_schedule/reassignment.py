@@ -0,0 +1,236 @@
+"""Automatic solver for the per-cycle reassignment map.
+
+Whenever an elder's own family lands in the pool they are assigned for a
+cycle position, that family is filtered out and handed to another elder
+(see :data:`~prayer_schedule.algorithm.FIXED_REASSIGNMENT_MAP`).
+:func:`solve_reassignment_map` picks those targets automatically as a
+min-cost flow per cycle position:
+
+* a target must be *adjacency-safe*: the family must not sit in the
+  target's own pool in the previous or next week;
+* a target must not share the family (two elders may belong to one
+  household), or they would be handed their own family; nor may it have
+  been handed the same family at the neighbouring cycle position, which
+  happens when two elders of one household sit next to each other;
+* no target may exceed ``max_count`` families, and the solution is
+  rejected if any elder ends below ``min_count``;
+* among the feasible choices, the sum of squared weekly counts is
+  minimised, which spreads extra families as evenly as possible (ties go
+  to the earlier elder in roster order, so output is deterministic).
+
+``calc_reassignments.py`` prints the solver's map whenever the live map has
+drifted, ready to paste into ``algorithm.py``.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Mapping, Optional, Sequence
+
+from .config import FAMILIES_PER_ELDER_MAX, FAMILIES_PER_ELDER_MIN
+from .pools import PoolIndex
+
+
+def find_conflicts(
+    master_pools: Sequence[Sequence[str]],
+    elders: Sequence[str],
+    elder_families: Mapping[str, str],
+    pool_index: Optional[PoolIndex] = None,
+) -> dict[int, list[str]]:
+    """Return ``cycle_position -> [elder, ...]`` whose own family is filtered.
+
+    Elders appear in roster order. Positions without conflicts are omitted.
+    Each elder conflicts at most once per cycle: exactly at the position
+    where they are assigned the pool holding their own family.
+    """
+    pool_count = len(master_pools)
+    if pool_index is None:
+        pool_index = PoolIndex.from_pools(master_pools)
+    conflicts: dict[int, list[str]] = {}
+    for elder_idx, elder in enumerate(elders):
+        family_pool = pool_index.pool_for(elder_families.get(elder))
+        if family_pool is None:
+            continue
+        cycle_position = (family_pool - elder_idx) % pool_count
+        conflicts.setdefault(cycle_position, []).append(elder)
+    return {pos: conflicts[pos] for pos in sorted(conflicts)}
+
+
+def _min_cost_assignment(
+    candidates: list[list[int]],
+    capacity: list[int],
+    base_count: list[int],
+    tie_scale: int,
+) -> Optional[list[int]]:
+    """Assign each conflict ``k`` to one of ``candidates[k]`` at minimum cost.
+
+    Successive shortest paths with Dijkstra and potentials on the network
+    ``source -> conflict -> elder -> sink``. Each elder-to-sink edge is
+    split into unit edges whose cost grows with the elder's load (convex),
+    so the optimum minimises the sum of squared counts. Returns the chosen
+    elder per conflict, or ``None`` when not every conflict can be placed.
+    """
+    n_conflicts = len(candidates)
+    n_elders = len(capacity)
+    source = 0
+    sink = 1 + n_conflicts + n_elders
+    node_count = sink + 1
+
+    # Edge arrays: to, residual capacity, cost; edge e ^ 1 is its reverse.
+    to: list[int] = []
+    cap: list[int] = []
+    cost: list[int] = []
+    graph: list[list[int]] = [[] for _ in range(node_count)]
+
+    def add_edge(u: int, v: int, c: int, w: int) -> None:
+        graph[u].append(len(to))
+        to.append(v)
+        cap.append(c)
+        cost.append(w)
+        graph[v].append(len(to))
+        to.append(u)
+        cap.append(0)
+        cost.append(-w)
+
+    conflict_edges: list[list[tuple[int, int]]] = []
+    for k, elder_indices in enumerate(candidates):
+        add_edge(source, 1 + k, 1, 0)
+        edges = []
+        for elder_idx in elder_indices:
+            edges.append((len(to), elder_idx))
+            # Roster order breaks ties without outweighing a load difference.
+            add_edge(1 + k, 1 + n_conflicts + elder_idx, 1, elder_idx)
+        conflict_edges.append(edges)
+    for elder_idx in range(n_elders):
+        for extra in range(1, capacity[elder_idx] + 1):
+            marginal = 2 * (base_count[elder_idx] + extra) - 1
+            add_edge(1 + n_conflicts + elder_idx, sink, 1, marginal * tie_scale)
+
+    potential = [0] * node_count
+    for _ in range(n_conflicts):
+        dist: list[Optional[int]] = [None] * node_count
+        prev_edge = [-1] * node_count
+        dist[source] = 0
+        heap = [(0, source)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d != dist[u]:
+                continue
+            for e in graph[u]:
+                if cap[e] <= 0:
+                    continue
+                v = to[e]
+                nd = d + cost[e] + potential[u] - potential[v]
+                current = dist[v]
+                if current is None or nd < current:
+                    dist[v] = nd
+                    prev_edge[v] = e
+                    heapq.heappush(heap, (nd, v))
+        if dist[sink] is None:
+            return None
+        for node, d in enumerate(dist):
+            if d is not None:
+                potential[node] += d
+        node = sink
+        while node != source:
+            e = prev_edge[node]
+            cap[e] -= 1
+            cap[e ^ 1] += 1
+            node = to[e ^ 1]
+
+    chosen: list[int] = []
+    for edges in conflict_edges:
+        chosen.append(next(elder_idx for e, elder_idx in edges if cap[e] == 0))
+    return chosen
+
+
+def solve_reassignment_map(
+    master_pools: Optional[Sequence[Sequence[str]]] = None,
+    elders: Optional[Sequence[str]] = None,
+    elder_families: Optional[Mapping[str, str]] = None,
+    min_count: int = FAMILIES_PER_ELDER_MIN,
+    max_count: int = FAMILIES_PER_ELDER_MAX,
+) -> dict[int, dict[str, str]]:
+    """Compute an adjacency-safe, count-balanced reassignment map.
+
+    Arguments default to the live pools and roster. The result has the same
+    shape as :data:`~prayer_schedule.algorithm.FIXED_REASSIGNMENT_MAP`:
+    ``cycle_position -> {owner_elder: target_elder}`` for positions with at
+    least one conflict.
+
+    Raises :class:`ValueError` (naming the cycle position) when no target
+    assignment satisfies the adjacency rule and the ``min_count..max_count``
+    window.
+    """
+    if master_pools is None or elders is None or elder_families is None:
+        from .algorithm import get_master_pools
+        from .elders import ELDER_FAMILIES, ELDERS
+
+        master_pools = get_master_pools() if master_pools is None else master_pools
+        elders = ELDERS if elders is None else elders
+        elder_families = ELDER_FAMILIES if elder_families is None else elder_families
+
+    pool_count = len(master_pools)
+    if len(elders) != pool_count:
+        raise ValueError(
+            f"{len(elders)} elders but {pool_count} pools; the rotation needs one pool per elder"
+        )
+
+    pool_index = PoolIndex.from_pools(master_pools)
+    pool_sizes = [len(pool) for pool in master_pools]
+
+    result: dict[int, dict[str, str]] = {}
+    # (cycle_position, family) -> target index, for households shared by
+    # elders whose conflicts fall on neighbouring positions.
+    handed: dict[tuple[int, str], int] = {}
+    conflicts = find_conflicts(master_pools, elders, elder_families, pool_index)
+    for cycle_position, owners in conflicts.items():
+        owner_set = set(owners)
+        base_count = [
+            pool_sizes[(idx + cycle_position) % pool_count] - (1 if elder in owner_set else 0)
+            for idx, elder in enumerate(elders)
+        ]
+        capacity = [max(0, max_count - count) for count in base_count]
+
+        candidates: list[list[int]] = []
+        for owner in owners:
+            family = elder_families[owner]
+            family_pool = pool_index.pool_of[family]
+            neighbours = {
+                handed.get(((cycle_position + step) % pool_count, family))
+                for step in (-1, 1)
+            }
+            safe = [
+                idx
+                for idx in range(pool_count)
+                if elder_families.get(elders[idx]) != family
+                and idx not in neighbours
+                and (idx + cycle_position - 1) % pool_count != family_pool
+                and (idx + cycle_position + 1) % pool_count != family_pool
+            ]
+            candidates.append(safe)
+
+        tie_scale = len(owners) * pool_count + 1
+        chosen = _min_cost_assignment(candidates, capacity, base_count, tie_scale)
+        if chosen is None:
+            raise ValueError(
+                f"Cycle position {cycle_position}: no adjacency-safe targets keep "
+                f"every elder within {min_count}-{max_count} families"
+            )
+
+        final_count = list(base_count)
+        for target_idx in chosen:
+            final_count[target_idx] += 1
+        short = [elders[idx] for idx, count in enumerate(final_count) if count < min_count]
+        if short:
+            raise ValueError(
+                f"Cycle position {cycle_position}: {short} would fall below "
+                f"{min_count} families"
+            )
+
+        for owner, target_idx in zip(owners, chosen):
+            handed[(cycle_position, elder_families[owner])] = target_idx
+        result[cycle_position] = {
+            owner: elders[target_idx] for owner, target_idx in zip(owners, chosen)
+        }
+    return result
@@ -0,0 +1,203 @@
+"""Content-addressed cache for rendered schedule pages and email bodies.
+
+The HTML/text schedule for a week is a pure function of the continuous
+week, the congregation's inputs and the renderer code; the combined email
+also depends on the day. :class:`RenderCache` stores them on disk under a
+key hashed from exactly those parts -- (continuous week, day for emails,
+roster hash, directory hash, template version) -- so every later run that
+week reuses the rendered page. The template version hashes the renderer
+modules' source, so any edit to a template or renderer invalidates every
+entry; when that source cannot be read the cache is disabled rather than
+risk serving stale output.
+
+The schedule page's "Last updated" stamp is the one part that changes from
+run to run: it is cached as the text on either side of the stamp and the
+current stamp is spliced in on every hit.
+
+Entries are small JSON files; a hit refreshes the file's mtime and
+:meth:`RenderCache.put` evicts the least recently used entries beyond
+``max_entries``. Like :func:`~prayer_schedule.plan.load_plan`, a missing,
+corrupt or mismatched entry is treated as a miss and never raises.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Callable, Mapping, Optional, Sequence
+
+from . import config
+from .file_io import _atomic_write
+from .output import generate_html_schedule, generate_text_schedule, updated_stamp
+from .plan import _content_hash, plan_keys, source_hash
+from .tenant import TenantContext
+
+logger = logging.getLogger(__name__)
+
+RENDER_CACHE_DIR_NAME: str = ".render_cache"
+RENDER_CACHE_MAX_ENTRIES: int = 64
+
+# Modules whose source determines rendered output.
+_RENDERER_MODULES = ("output.py", "email_service.py", "render_cache.py")
+# Stands in for the "Last updated" stamp while a page is rendered for caching.
+_STAMP_SLOT = "\x00updated\x00"
+
+
+
+def template_version() -> Optional[str]:
+    """Return a hash of the renderer modules' source, or ``None`` if unreadable."""
+    return source_hash(_RENDERER_MODULES)
+
+
+class RenderCache:
+    """On-disk LRU cache of rendered strings for one congregation.
+
+    ``inputs`` identifies everything outside the week and day that the
+    output depends on; :meth:`for_tenant` builds it from the tenant's
+    roster, directory, map and rotation-code hashes (see
+    :func:`~prayer_schedule.plan.plan_keys`), its asset mode and its name
+    and site URL. Without a
+    :func:`template_version` the cache is disabled: every lookup misses and
+    nothing is stored.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        inputs: Mapping[str, str],
+        max_entries: int = RENDER_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.directory = directory
+        version = template_version()
+        self.enabled = version is not None
+        self.inputs = {**inputs, "template": version or ""}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_tenant(cls, tenant: TenantContext, output_dir: Optional[str] = None) -> "RenderCache":
+        """Return the cache kept next to ``tenant``'s schedule files."""
+        if output_dir is None:
+            output_dir = config.DESKTOP_DIR if tenant.output_dir is None else tenant.output_dir
+        keys = plan_keys(tenant)
+        inputs = {
+            "roster": _content_hash(
+                [keys["elders"], keys["reassignment_map"], keys["family_bounds"], keys["rules"]]
+            ),
+            "directory": keys["directory"],
+            "assets": "inline" if tenant.inline_assets else "linked",
+            "branding": _content_hash([tenant.name, tenant.site_url]),
+        }
+        return cls(os.path.join(output_dir, RENDER_CACHE_DIR_NAME), inputs)
+
+    def key(self, kind: str, continuous_week: int, day: Optional[str] = None) -> dict[str, str]:
+        """Return the full key for one entry; it is stored alongside the entry.
+
+        ``day`` is only part of the key for per-day entries (the email).
+        """
+        key = {**self.inputs, "kind": kind, "week": str(continuous_week)}
+        if day is not None:
+            key["day"] = day
+        return key
+
+    def _path(self, key: Mapping[str, str]) -> str:
+        return os.path.join(self.directory, f"{_content_hash(key)[:32]}.json")
+
+    def get(self, key: Mapping[str, str]) -> Optional[dict[str, str]]:
+        """Return the entry stored under ``key``, or ``None`` on a miss."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+            if payload.get("key") != dict(key):
+                return None
+            os.utime(path)
+            return dict(payload["value"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def put(self, key: Mapping[str, str], value: Mapping[str, str]) -> None:
+        """Store ``value`` under ``key`` and evict beyond ``max_entries``.
+
+        Failures are logged and otherwise ignored: a cache that cannot be
+        written only costs the next run a render.
+        """
+        if not self.enabled:
+            return
+        try:
+            # Never create the output directory itself; a missing one is the
+            # caller's error to report.
+            if not os.path.isdir(self.directory):
+                os.mkdir(self.directory)
+            _atomic_write(
+                self._path(key),
+                json.dumps({"key": dict(key), "value": dict(value)}, ensure_ascii=False),
+            )
+            self._evict()
+        except OSError as exc:
+            logger.warning(f"   [WARNING] Could not update render cache: {exc}")
+
+    def _evict(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                path = os.path.join(self.directory, name)
+                entries.append((os.stat(path).st_mtime_ns, path))
+        entries.sort()
+        for _mtime, path in entries[: max(0, len(entries) - self.max_entries)]:
+            os.remove(path)
+
+    def fetch(
+        self,
+        kind: str,
+        continuous_week: int,
+        day: Optional[str],
+        render: Callable[[], Mapping[str, str]],
+    ) -> dict[str, str]:
+        """Return the cached entry, calling ``render`` (and storing it) on a miss."""
+        key = self.key(kind, continuous_week, day)
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            logger.debug(f"   [CACHE] hit: {kind} week {continuous_week} {day or ''}")
+            return value
+        self.misses += 1
+        value = dict(render())
+        self.put(key, value)
+        return value
+
+
+def cached_schedule_content(
+    cache: RenderCache,
+    continuous_week: int,
+    week_number: int,
+    start_date: datetime,
+    elder_assignments: Mapping[str, Sequence[str]],
+    schedule: Mapping[str, Sequence[str]],
+    inline_assets: bool = True,
+    church: str = config.CHURCH_NAME,
+) -> tuple[str, str]:
+    """Return ``(html, text)`` like ``generate_schedule_content``, via ``cache``.
+
+    The HTML carries the current :func:`~prayer_schedule.output.updated_stamp`
+    whether or not the entry was cached.
+    """
+
+    def render() -> dict[str, str]:
+        html = generate_html_schedule(
+            week_number, start_date, elder_assignments, schedule, inline_assets, _STAMP_SLOT,
+            church,
+        )
+        head, tail = html.split(_STAMP_SLOT)
+        text = generate_text_schedule(
+            week_number, start_date, elder_assignments, schedule, church
+        )
+        return {"html_head": head, "html_tail": tail, "text": text}
+
+    entry = cache.fetch("schedule", continuous_week, None, render)
+    return entry["html_head"] + updated_stamp() + entry["html_tail"], entry["text"]
@@ -0,0 +1,210 @@
+"""Century-scale calendar sweep for year-boundary and DST verification.
+
+``comprehensive_verification.verify_year_boundary`` spot-checks a handful of
+year boundaries. :func:`sweep_calendar` instead walks every Monday from
+:data:`~prayer_schedule.config.REFERENCE_MONDAY` through
+:data:`SWEEP_END_YEAR` and checks, for each week:
+
+* the Monday is local midnight and :func:`calculate_continuous_week` gives
+  exactly one more than the previous Monday, so the cycle position
+  advances by one across every ISO year reset (52 and 53-week years).
+  Each Monday comes from :func:`next_monday` stepping the previous one
+  through UTC and back, not from week arithmetic that merely inverts
+  :func:`calculate_continuous_week`;
+* UTC instants on both sides of every local midnight of the week (and
+  every hour of the 167 and 169-hour weeks holding a DST change),
+  converted to ``CENTRAL_TZ`` the way the daily run reads the clock, map
+  back to that Monday through :func:`~prayer_schedule.utils.week_monday`;
+* no elder's families repeat into the next week. Assignments depend only
+  on the cycle position, so the adjacent-pair overlaps are computed once
+  from a :class:`~prayer_schedule.bitsets.BitsetTable` and each week just
+  looks its pair up.
+
+Weeks are split into chunks and checked on a :class:`ProcessPoolExecutor`;
+each chunk starts from its predecessor week's Monday so chunk edges are
+checked.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Mapping, NamedTuple, Optional
+
+from .algorithm import RotationTable, calculate_continuous_week, get_rotation_table
+from .bitsets import BitsetTable, pair_issues
+from .config import CENTRAL_TZ, REFERENCE_MONDAY
+from .utils import week_monday
+
+SWEEP_END_YEAR = 2126
+
+_HOUR = timedelta(hours=1)
+_SECOND = timedelta(seconds=1)
+
+
+class ChunkResult(NamedTuple):
+    """Weeks checked in one chunk and the issues found."""
+
+    weeks: int
+    issues: list[str]
+
+
+class SweepReport(NamedTuple):
+    """Aggregate outcome of :func:`sweep_calendar`."""
+
+    first_monday: datetime
+    last_monday: datetime
+    weeks: int
+    issues: list[str]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def summary(self) -> str:
+        """Return a one-line ``[OK]``/``[X]`` summary for the console."""
+        status = "[OK]" if self.ok else "[X]"
+        return (
+            f"{status} {self.weeks} Mondays {self.first_monday:%Y-%m-%d} to "
+            f"{self.last_monday:%Y-%m-%d} checked in {self.elapsed:.2f}s "
+            f"({len(self.issues)} issues)"
+        )
+
+
+def monday_for_week(continuous_week: int) -> datetime:
+    """Return the local-midnight Monday of ``continuous_week`` in ``CENTRAL_TZ``."""
+    return REFERENCE_MONDAY + timedelta(weeks=continuous_week - 1)
+
+
+def next_monday(monday: datetime) -> datetime:
+    """Return the local-midnight Monday after ``monday``, read off the clock.
+
+    Steps seven and a half days of real time in UTC and maps the instant
+    back through ``CENTRAL_TZ`` with :func:`week_monday`, the way the daily
+    run would see it; the half day keeps a DST change from landing the
+    instant on the wrong side of midnight.
+    """
+    instant = monday.astimezone(timezone.utc) + timedelta(days=7, hours=12)
+    return week_monday(instant.astimezone(CENTRAL_TZ))
+
+
+def _week_issues(continuous_week: int, monday: datetime) -> list[str]:
+    issues: list[str] = []
+    label = f"Week {continuous_week} ({monday:%Y-%m-%d})"
+    if monday.weekday() != 0 or (monday.hour, monday.minute, monday.second) != (0, 0, 0):
+        issues.append(f"{label}: {monday.isoformat()} is not Monday midnight")
+    if calculate_continuous_week(monday) != continuous_week:
+        issues.append(
+            f"{label}: continuous week {calculate_continuous_week(monday)}, "
+            f"expected {continuous_week}"
+        )
+
+    start = monday.astimezone(timezone.utc)
+    end = (monday + timedelta(weeks=1)).astimezone(timezone.utc)
+    hours = (end - start) // _HOUR
+    if hours not in (167, 168, 169):
+        issues.append(f"{label}: week lasts {hours} hours")
+    # Both sides of every local midnight; hourly through a DST-change week.
+    if hours == 168:
+        midnights = [(monday + timedelta(days=day)).astimezone(timezone.utc) for day in range(7)]
+        probes = midnights + [instant - _SECOND for instant in midnights[1:]]
+    else:
+        probes = [start + step * _HOUR for step in range(hours)]
+    probes.append(end - _SECOND)
+    for instant in probes:
+        local = instant.astimezone(CENTRAL_TZ)
+        derived = week_monday(local)
+        if derived.replace(tzinfo=None) != monday.replace(tzinfo=None):
+            issues.append(
+                f"{label}: {local.isoformat()} maps to Monday {derived:%Y-%m-%d %H:%M}"
+            )
+            break
+    return issues
+
+
+def sweep_weeks(
+    first_week: int,
+    count: int,
+    pool_count: int,
+    pair_overlaps: Mapping[int, list[str]],
+) -> ChunkResult:
+    """Check continuous weeks ``first_week .. first_week + count - 1``.
+
+    Only the chunk's starting Monday comes from :func:`monday_for_week`;
+    later ones follow by :func:`next_monday`. ``pair_overlaps`` maps a cycle position to the overlaps between it and the
+    next position (see :func:`sweep_calendar`); each overlapping pair is
+    reported once per chunk, at the first week it occurs.
+    """
+    issues: list[str] = []
+    reported_pairs: set[int] = set()
+    previous = None
+    monday = None
+    if first_week > 1:
+        monday = monday_for_week(first_week - 1)
+        previous = calculate_continuous_week(monday)
+    for week in range(first_week, first_week + count):
+        monday = monday_for_week(week) if monday is None else next_monday(monday)
+        issues.extend(_week_issues(week, monday))
+        current = calculate_continuous_week(monday)
+        if previous is not None:
+            prev_pos = (previous - 1) % pool_count
+            pos = (current - 1) % pool_count
+            if current - previous != 1 or pos != (prev_pos + 1) % pool_count:
+                issues.append(
+                    f"Week {week} ({monday:%Y-%m-%d}): cycle position {pos} "
+                    f"follows {prev_pos} (discontinuity)"
+                )
+            elif prev_pos not in reported_pairs and pair_overlaps.get(prev_pos):
+                reported_pairs.add(prev_pos)
+                issues.extend(
+                    f"Week {previous}->{current} ({monday:%Y-%m-%d}): {issue}"
+                    for issue in pair_overlaps[prev_pos]
+                )
+        previous = current
+    return ChunkResult(count, issues)
+
+
+def sweep_calendar(
+    end_year: int = SWEEP_END_YEAR,
+    table: Optional[RotationTable] = None,
+    max_workers: Optional[int] = None,
+    chunk_weeks: int = 520,
+) -> SweepReport:
+    """Verify every Monday from ``REFERENCE_MONDAY`` through ``end_year``.
+
+    ``table`` defaults to :func:`get_rotation_table`. Chunks of
+    ``chunk_weeks`` weeks (about a decade) run on a process pool whose size
+    defaults to the CPU count; ``max_workers=0`` checks them in-process.
+    """
+    start = time.perf_counter()
+    if table is None:
+        table = get_rotation_table()
+    bitsets = BitsetTable.from_table(table)
+    pool_count = len(bitsets.masks)
+    pair_overlaps = {
+        pos: pair_issues(bitsets, pos, (pos + 1) % pool_count) for pos in range(pool_count)
+    }
+
+    last_monday = week_monday(datetime(end_year, 12, 31, tzinfo=CENTRAL_TZ))
+    total = calculate_continuous_week(last_monday)
+    starts = list(range(1, total + 1, chunk_weeks))
+    sizes = [min(chunk_weeks, total + 1 - first) for first in starts]
+    counts = [pool_count] * len(starts)
+    pairs = [pair_overlaps] * len(starts)
+
+    if max_workers == 0:
+        chunks = list(map(sweep_weeks, starts, sizes, counts, pairs))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunks = list(executor.map(sweep_weeks, starts, sizes, counts, pairs))
+
+    issues = [issue for chunk in chunks for issue in chunk.issues]
+    return SweepReport(
+        REFERENCE_MONDAY,
+        last_monday,
+        sum(chunk.weeks for chunk in chunks),
+        issues,
+        time.perf_counter() - start,
+    )
@@ -0,0 +1,162 @@
+"""Per-congregation context for running the daily pipeline.
+
+Everything :func:`~prayer_schedule.cli.main` needs to know about one church
+(directory, elder roster, reassignment map, timezone, output directory and
+SMTP settings) lives on a :class:`TenantContext`. ``TenantContext.from_config()``
+snapshots the module-level configuration, so the single-church desktop and
+CI runs behave exactly as before; :mod:`prayer_schedule.batch` runs many
+contexts in one process pool.
+
+Contexts hold only plain tuples, dicts and strings so they pickle cheaply
+into worker processes. Derived data (pools, rotation table) is rebuilt on
+demand rather than cached on the instance.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import tzinfo
+from typing import Optional, Sequence
+
+from .algorithm import RotationTable, get_master_pools
+from .config import (
+    CENTRAL_TZ,
+    ELDER_COUNT,
+    FAMILIES_PER_ELDER_MAX,
+    FAMILIES_PER_ELDER_MIN,
+    CHURCH_NAME,
+    INLINE_ASSETS,
+    POOL_COUNT,
+    SITE_URL,
+    EmailSettings,
+)
+from .directory import DIRECTORY_CSV, parse_directory
+from .elders import ELDER_DATA, ElderRecord
+from .pools import build_pools, pool_size_bounds
+from .reassignment import solve_reassignment_map
+
+
+def _email_disabled() -> EmailSettings:
+    return EmailSettings(
+        enabled=False, sender_email="", sender_password="", recipient_emails=""
+    )
+
+
+@dataclass(frozen=True)
+class TenantContext:
+    """One congregation's roster, directory and delivery settings.
+
+    ``reassignment_map`` may be left as ``None`` to have it solved by
+    :func:`~prayer_schedule.reassignment.solve_reassignment_map`.
+    ``min_families``/``max_families`` default to one either side of the
+    balanced pool sizes. ``output_dir`` of ``None`` means
+    :data:`~prayer_schedule.config.DESKTOP_DIR`. With ``inline_assets``
+    false the weekly page links shared stylesheet/script files written
+    alongside it instead of embedding them. ``name`` heads every page and
+    email; ``site_url``, when set, is linked from the email as the online
+    schedule.
+    """
+
+    name: str
+    elder_data: tuple[ElderRecord, ...]
+    directory_csv: str
+    reassignment_map: Optional[dict[int, dict[str, str]]] = None
+    timezone: tzinfo = CENTRAL_TZ
+    output_dir: Optional[str] = None
+    email: EmailSettings = field(default_factory=_email_disabled)
+    min_families: Optional[int] = None
+    max_families: Optional[int] = None
+    expected_elder_count: Optional[int] = None
+    inline_assets: bool = True
+    site_url: Optional[str] = None
+
+    @classmethod
+    def from_config(cls) -> "TenantContext":
+        """Return the context for the congregation configured in this package.
+
+        Reads :data:`FIXED_REASSIGNMENT_MAP` and the email environment at call
+        time, so monkeypatched values are honoured.
+        """
+        from .algorithm import FIXED_REASSIGNMENT_MAP
+
+        return cls(
+            name=CHURCH_NAME,
+            elder_data=tuple(ELDER_DATA),
+            directory_csv=DIRECTORY_CSV,
+            reassignment_map={pos: dict(m) for pos, m in FIXED_REASSIGNMENT_MAP.items()},
+            timezone=CENTRAL_TZ,
+            output_dir=None,
+            email=EmailSettings.from_config(),
+            min_families=FAMILIES_PER_ELDER_MIN,
+            max_families=FAMILIES_PER_ELDER_MAX,
+            expected_elder_count=ELDER_COUNT,
+            inline_assets=INLINE_ASSETS,
+            site_url=SITE_URL,
+        )
+
+    @property
+    def elders(self) -> list[str]:
+        """Elder names in rotation order."""
+        return [e["name"] for e in self.elder_data]
+
+    @property
+    def elder_families(self) -> dict[str, str]:
+        """Map of elder name to their own family string."""
+        return {e["name"]: e["family"] for e in self.elder_data}
+
+    def families(self) -> list[str]:
+        """Return the parsed, sorted directory for this congregation."""
+        return parse_directory(self.directory_csv)
+
+    def master_pools(self) -> list[list[str]]:
+        """Return one balanced pool per elder (cached for the live directory)."""
+        if self.directory_csv == DIRECTORY_CSV and len(self.elder_data) == POOL_COUNT:
+            return get_master_pools()
+        return build_pools(self.families(), len(self.elder_data))
+
+    def family_bounds(
+        self, master_pools: Optional[Sequence[Sequence[str]]] = None
+    ) -> tuple[int, int]:
+        """Return the accepted ``(min, max)`` families per elder per week."""
+        if self.min_families is not None and self.max_families is not None:
+            return self.min_families, self.max_families
+        if master_pools is None:
+            master_pools = self.master_pools()
+        smallest, largest = pool_size_bounds(
+            sum(len(pool) for pool in master_pools), len(master_pools)
+        )
+        lo = smallest - 1 if self.min_families is None else self.min_families
+        hi = largest + 1 if self.max_families is None else self.max_families
+        return lo, hi
+
+    def resolve_reassignment_map(
+        self, master_pools: Optional[list[list[str]]] = None
+    ) -> dict[int, dict[str, str]]:
+        """Return ``reassignment_map``, solving one if it was left as ``None``.
+
+        Raises :class:`ValueError` when no map satisfies :meth:`family_bounds`.
+        """
+        if self.reassignment_map is not None:
+            return self.reassignment_map
+        if master_pools is None:
+            master_pools = self.master_pools()
+        lo, hi = self.family_bounds(master_pools)
+        return solve_reassignment_map(master_pools, self.elders, self.elder_families, lo, hi)
+
+    def build_rotation_table(
+        self,
+        master_pools: Optional[list[list[str]]] = None,
+        reassignment_map: Optional[dict[int, dict[str, str]]] = None,
+    ) -> RotationTable:
+        """Build this congregation's :class:`RotationTable`.
+
+        Arguments default to :meth:`master_pools` and
+        :meth:`resolve_reassignment_map`.
+        """
+        if master_pools is None:
+            master_pools = self.master_pools()
+        if reassignment_map is None:
+            reassignment_map = self.resolve_reassignment_map(master_pools)
+        return RotationTable.build(
+            master_pools, self.elders, self.elder_families, reassignment_map
+        )
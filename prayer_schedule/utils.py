@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from typing import Iterator
 
 from .config import CENTRAL_TZ, DAYS_OF_WEEK
 
 
-def get_today() -> datetime:
-    """Return the current date/time in US Central Time.
+def get_today(tz: tzinfo = CENTRAL_TZ) -> datetime:
+    """Return the current date/time in ``tz`` (default: US Central Time).
 
     Uses the IANA timezone database so DST transitions are always correct,
     even if US rules change in the future (via tzdata updates).
     """
-    return datetime.now(CENTRAL_TZ)
+    return datetime.now(tz)
+
+
+def week_monday(today: datetime) -> datetime:
+    """Return midnight on the Monday of ``today``'s week, in ``today``'s timezone.
+
+    Wall-clock arithmetic on an aware ``today`` keeps the result at local
+    midnight even when a DST change falls between Monday and ``today``.
+    """
+    monday = today - timedelta(days=today.weekday())
+    return monday.replace(hour=0, minute=0, second=0, microsecond=0)
 
 
 def escape_html(value: str) -> str:
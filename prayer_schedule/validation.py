@@ -7,20 +7,30 @@ sending email.
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime, timedelta
+from typing import Mapping, Optional, Sequence
 
 from . import config
-from .algorithm import assign_families_for_week_v10
+from .algorithm import RotationTable
+from .bitsets import BitsetTable
 from .config import (
     DAYS_OF_WEEK,
     ELDER_COUNT,
     FAMILIES_PER_ELDER_MAX,
     FAMILIES_PER_ELDER_MIN,
-    POOL_COUNT,
-    ROTATION_WEEKS,
 )
 from .directory import parse_directory
-from .elders import ELDER_DATA, ELDER_FAMILIES, ELDERS
+from .elders import (
+    ELDER_DATA,
+    ELDER_FAMILIES,
+    ELDERS,
+    DaySchedule,
+    ElderRecord,
+    is_floating,
+)
+
+logger = logging.getLogger(__name__)
 
 
 # ----------------------------------------------------------------------
@@ -54,24 +64,29 @@ def verify_email_date(today: datetime, monday: datetime) -> tuple[bool, str]:
                   f"is day {expected_offset + 1}/7 of week {monday.strftime('%b %d')}-{sunday.strftime('%b %d, %Y')}")
 
 
-def validate_email_config() -> tuple[bool, list[str]]:
+def validate_email_config(
+    settings: Optional[config.EmailSettings] = None,
+) -> tuple[bool, list[str]]:
     """Validate the email configuration read from environment variables.
 
+    ``settings`` defaults to :meth:`~prayer_schedule.config.EmailSettings.from_config`.
     Returns ``(is_valid, issues)``. Only *non-fatal* advisory checks live
     here; ``cli.main`` still defers to :func:`verify_email_date` for the
     per-send check. The returned issues list is empty when the configuration
     is consistent and email is enabled.
     """
     issues: list[str] = []
+    if settings is None:
+        settings = config.EmailSettings.from_config()
 
-    if not config.EMAIL_ENABLED:
+    if not settings.enabled:
         return True, issues
 
-    if not config.SENDER_EMAIL:
+    if not settings.sender_email:
         issues.append("EMAIL_ENABLED=true but SENDER_EMAIL is empty")
-    if not config.SENDER_PASSWORD:
+    if not settings.sender_password:
         issues.append("EMAIL_ENABLED=true but SENDER_PASSWORD is empty")
-    if not config.RECIPIENT_EMAILS:
+    if not settings.recipient_emails:
         issues.append("EMAIL_ENABLED=true but RECIPIENT_EMAILS is empty")
 
     return (not issues), issues
@@ -81,55 +96,72 @@ def validate_email_config() -> tuple[bool, list[str]]:
 # Elder-data validators
 # ----------------------------------------------------------------------
 
-def validate_elder_data() -> tuple[bool, list[str]]:
+def validate_elder_data(
+    elder_data: Optional[Sequence[ElderRecord]] = None,
+    directory_csv: Optional[str] = None,
+    expected_count: int = ELDER_COUNT,
+) -> tuple[bool, list[str]]:
     """Validate :data:`~prayer_schedule.elders.ELDER_DATA` for internal consistency.
 
+    ``elder_data`` and ``directory_csv`` default to the live roster and the
+    embedded directory; ``expected_count`` to
+    :data:`~prayer_schedule.config.ELDER_COUNT`.
+
     Checks:
       * elder count matches :data:`~prayer_schedule.config.ELDER_COUNT`
       * no duplicate elder names
-      * each elder has at least one assigned day
-      * assigned days are valid members of :data:`DAYS_OF_WEEK`
-      * every day in the week is covered by at least one elder
+      * every elder has assigned days, all valid members of
+        :data:`DAYS_OF_WEEK`, unless marked ``floating`` (see
+        :class:`~prayer_schedule.elders.DaySchedule`), in which case it has none
+      * every day of every week is covered by at least one elder
       * elders' own families appear in the directory
     """
     issues: list[str] = []
+    if elder_data is None:
+        elder_data = ELDER_DATA
 
-    if len(ELDER_DATA) != ELDER_COUNT:
+    if len(elder_data) != expected_count:
         issues.append(
-            f"ELDER_DATA has {len(ELDER_DATA)} elders, expected {ELDER_COUNT}"
+            f"ELDER_DATA has {len(elder_data)} elders, expected {expected_count}"
         )
 
     seen: set[str] = set()
-    for e in ELDER_DATA:
+    for e in elder_data:
         name = e["name"]
         if name in seen:
             issues.append(f"Duplicate elder name: {name}")
         seen.add(name)
 
-        if not e["days"]:
+        if is_floating(e):
+            if e["days"]:
+                issues.append(f"{name}: floating elder also has assigned days")
+        elif not e["days"]:
             issues.append(f"{name}: no assigned days")
         for day in e["days"]:
             if day not in DAYS_OF_WEEK:
                 issues.append(f"{name}: invalid day {day!r}")
 
-    # Every day of the week should be covered by at least one elder.
-    days_covered: set[str] = set()
-    for e in ELDER_DATA:
-        for day in e["days"]:
-            if day in DAYS_OF_WEEK:
-                days_covered.add(day)
-    uncovered = [d for d in DAYS_OF_WEEK if d not in days_covered]
+    # Every day of every week should be covered by at least one elder.
+    # Invalid days were reported above; drop them so the schedule builds.
+    valid_days = [
+        {**e, "days": [d for d in e["days"] if d in DAYS_OF_WEEK]} for e in elder_data
+    ]
+    day_schedule = DaySchedule.build(valid_days)
+    uncovered = [
+        d for d in DAYS_OF_WEEK
+        if any(not week[d] for week in day_schedule.weeks)
+    ]
     if uncovered:
         issues.append(f"Days with no assigned elder: {uncovered}")
 
     # Elder families should all appear in the directory.
     try:
-        directory = set(parse_directory())
+        directory = set(parse_directory(directory_csv))
     except ValueError as exc:
         issues.append(f"DIRECTORY_CSV parse error: {exc}")
         directory = set()
 
-    for e in ELDER_DATA:
+    for e in elder_data:
         if directory and e["family"] not in directory:
             issues.append(
                 f"{e['name']}'s family not found in directory: {e['family']!r}"
@@ -138,29 +170,47 @@ def validate_elder_data() -> tuple[bool, list[str]]:
     return (not issues), issues
 
 
-def validate_reassignment_map() -> tuple[bool, list[str]]:
+def validate_reassignment_map(
+    master_pools: Optional[Sequence[Sequence[str]]] = None,
+    elders: Optional[Sequence[str]] = None,
+    elder_families: Optional[Mapping[str, str]] = None,
+    reassignment_map: Optional[Mapping[int, Mapping[str, str]]] = None,
+) -> tuple[bool, list[str]]:
     """Validate :data:`FIXED_REASSIGNMENT_MAP` covers every conflict.
 
-    For every cycle position in ``0..POOL_COUNT-1``, any elder whose own
+    For every cycle position (one per pool), any elder whose own
     family lands in their assigned pool must either have an entry in the
     reassignment map (preferred) or be covered by the default fallback.
-    This check enforces the *preferred* path.
+    This check enforces the *preferred* path. Every argument defaults to the
+    live value, read at call time.
     """
     # Local import to avoid any cycle in static analyzers.
-    from .algorithm import FIXED_REASSIGNMENT_MAP, get_master_pools
+    from .algorithm import FIXED_REASSIGNMENT_MAP, get_master_pools, get_pool_index
+    from .pools import PoolIndex
 
     issues: list[str] = []
-    pools = get_master_pools()
-
-    for cycle_position in range(POOL_COUNT):
+    if master_pools is None:
+        master_pools = get_master_pools()
+        pool_index = get_pool_index()
+    else:
+        pool_index = PoolIndex.from_pools(master_pools)
+    if elders is None:
+        elders = ELDERS
+    if elder_families is None:
+        elder_families = ELDER_FAMILIES
+    if reassignment_map is None:
+        reassignment_map = FIXED_REASSIGNMENT_MAP
+    pool_count = len(master_pools)
+
+    for cycle_position in range(pool_count):
         conflicts: list[str] = []
-        for elder_idx, elder in enumerate(ELDERS):
-            pool_idx = (elder_idx + cycle_position) % POOL_COUNT
-            elder_family = ELDER_FAMILIES.get(elder)
-            if elder_family in pools[pool_idx]:
+        for elder_idx, elder in enumerate(elders):
+            pool_idx = (elder_idx + cycle_position) % pool_count
+            elder_family = elder_families.get(elder)
+            if pool_index.contains(pool_idx, elder_family):
                 conflicts.append(elder)
 
-        mapping = FIXED_REASSIGNMENT_MAP.get(cycle_position, {})
+        mapping = reassignment_map.get(cycle_position, {})
         for elder in conflicts:
             if elder not in mapping:
                 issues.append(
@@ -169,7 +219,7 @@ def validate_reassignment_map() -> tuple[bool, list[str]]:
                 )
             else:
                 target = mapping[elder]
-                if target not in ELDERS:
+                if target not in elders:
                     issues.append(
                         f"Cycle position {cycle_position}: {elder} -> "
                         f"{target!r} is not a known elder"
@@ -182,22 +232,32 @@ def validate_reassignment_map() -> tuple[bool, list[str]]:
 # Weekly schedule validators
 # ----------------------------------------------------------------------
 
-def verify_schedule(assignments: dict[str, list[str]]) -> tuple[bool, list[str]]:
-    """Verify a week of assignments meets the algorithm invariants."""
+def verify_schedule(
+    assignments: Mapping[str, Sequence[str]],
+    elder_families: Optional[Mapping[str, str]] = None,
+    min_count: int = FAMILIES_PER_ELDER_MIN,
+    max_count: int = FAMILIES_PER_ELDER_MAX,
+) -> tuple[bool, list[str]]:
+    """Verify a week of assignments meets the algorithm invariants.
+
+    ``elder_families`` defaults to the live roster's own-family mapping.
+    """
     issues: list[str] = []
+    if elder_families is None:
+        elder_families = ELDER_FAMILIES
 
-    # Check family counts (FAMILIES_PER_ELDER_MIN..MAX inclusive is acceptable).
+    # Check family counts (min_count..max_count inclusive is acceptable).
     for elder, families in assignments.items():
         actual = len(families)
-        if actual < FAMILIES_PER_ELDER_MIN or actual > FAMILIES_PER_ELDER_MAX:
+        if actual < min_count or actual > max_count:
             issues.append(
                 f"{elder}: {actual} families "
-                f"(should be {FAMILIES_PER_ELDER_MIN}-{FAMILIES_PER_ELDER_MAX})"
+                f"(should be {min_count}-{max_count})"
             )
 
     # Check for elders receiving their own families.
     for elder, families in assignments.items():
-        elder_family = ELDER_FAMILIES.get(elder)
+        elder_family = elder_families.get(elder)
         if elder_family in families:
             issues.append(f"{elder} has their own family in the list!")
 
@@ -216,8 +276,8 @@ def verify_schedule(assignments: dict[str, list[str]]) -> tuple[bool, list[str]]
 
 def verify_today_elder_assignment(
     today: datetime,
-    schedule: dict[str, list[str]],
-    assignments: dict[str, list[str]],
+    schedule: Mapping[str, Sequence[str]],
+    assignments: Mapping[str, Sequence[str]],
 ) -> tuple[bool, str]:
     """Ensure every elder scheduled for today has a non-empty family list."""
     today_name = DAYS_OF_WEEK[today.weekday()]
@@ -239,116 +299,131 @@ def verify_today_elder_assignment(
     )
 
 
-def verify_v10_algorithm() -> bool:
+def verify_v10_algorithm(
+    table: Optional[RotationTable] = None,
+    elder_families: Optional[Mapping[str, str]] = None,
+    families: Optional[Sequence[str]] = None,
+    min_count: int = FAMILIES_PER_ELDER_MIN,
+    max_count: int = FAMILIES_PER_ELDER_MAX,
+) -> bool:
     """Run the 5 algorithm checks across two full cycles and print results.
 
     Returns ``True`` when every check passes. Output matches the original
     script's formatting verbatim (this is the ``-> ok/fail`` message the CI
-    workflow relies on).
+    workflow relies on). ``table`` defaults to a fresh
+    :meth:`RotationTable.build` of the live roster, and coverage is checked
+    against ``families`` (default: :func:`parse_directory`).
     """
-    print("\nVERIFYING V10 ALGORITHM")
-    print("=" * 60)
+    logger.info("\nVERIFYING V10 ALGORITHM")
+    logger.info("=" * 60)
 
     all_perfect = True
 
-    # Track histories.
-    elder_histories: dict[str, list[set[str]]] = {elder: [] for elder in ELDERS}
+    # Build every cycle position once; each week below is a table lookup.
+    # A fresh build (not the cached table) so verification always reflects
+    # the current pools and reassignment map.
+    if table is None:
+        table = RotationTable.build()
+    all_families = set(parse_directory() if families is None else families)
+    if elder_families is None:
+        elder_families = ELDER_FAMILIES
+    bitsets = BitsetTable.from_table(table)
+    elders = table.elders
+    rotation_weeks = len(table.positions)
+
+    # Track histories as family-ID bitsets: overlap, membership and equality
+    # are single integer operations (see prayer_schedule.bitsets).
+    elder_histories: dict[str, list[int]] = {elder: [] for elder in elders}
 
     # Generate two full cycles of assignments.
-    history_weeks = ROTATION_WEEKS * 2
+    history_weeks = rotation_weeks * 2
     for week in range(32, 32 + history_weeks):
-        assignments = assign_families_for_week_v10(week)
-        for elder, families in assignments.items():
-            elder_histories[elder].append(set(families))
+        for elder, mask in zip(elders, bitsets.masks_for_week(week)):
+            elder_histories[elder].append(mask)
 
     # Check 1: Family counts.
-    print("\n1. FAMILY COUNT VERIFICATION:")
-    week_assignments = assign_families_for_week_v10(32)
+    logger.info("\n1. FAMILY COUNT VERIFICATION:")
+    week_assignments = table.for_week(32)
     for elder, families in week_assignments.items():
         actual = len(families)
-        if FAMILIES_PER_ELDER_MIN <= actual <= FAMILIES_PER_ELDER_MAX:
-            print(f"   [OK] {elder}: {actual} families")
+        if min_count <= actual <= max_count:
+            logger.info(f"   [OK] {elder}: {actual} families")
         else:
-            print(
+            logger.error(
                 f"   [X] {elder}: {actual} families "
-                f"(should be {FAMILIES_PER_ELDER_MIN}-{FAMILIES_PER_ELDER_MAX})"
+                f"(should be {min_count}-{max_count})"
             )
             all_perfect = False
 
     # Check 2: Elder own family.
-    print("\n2. ELDER OWN FAMILY CHECK:")
-    for elder in ELDERS:
-        elder_family = ELDER_FAMILIES[elder]
-        has_own_family = False
-        for week_families in elder_histories[elder]:
-            if elder_family in week_families:
-                has_own_family = True
-                break
+    logger.info("\n2. ELDER OWN FAMILY CHECK:")
+    for elder in elders:
+        own_bit = bitsets.mask_for([elder_families[elder]])
+        has_own_family = any(week_mask & own_bit for week_mask in elder_histories[elder])
 
         if has_own_family:
-            print(f"   [X] {elder}: HAS OWN FAMILY")
+            logger.error(f"   [X] {elder}: HAS OWN FAMILY")
             all_perfect = False
         else:
-            print(f"   [OK] {elder}: Never has own family")
+            logger.info(f"   [OK] {elder}: Never has own family")
 
     # Check 3: Week-to-week rotation.
-    print("\n3. WEEK-TO-WEEK ROTATION CHECK:")
+    logger.info("\n3. WEEK-TO-WEEK ROTATION CHECK:")
     week_perfect = True
-    for elder in ELDERS:
+    for elder in elders:
         elder_perfect = True
         for i in range(1, len(elder_histories[elder])):
             prev_week = elder_histories[elder][i - 1]
             curr_week = elder_histories[elder][i]
 
-            overlap = prev_week & curr_week
+            overlap = (prev_week & curr_week).bit_count()
 
             if overlap:
                 if elder_perfect:  # Only print elder name once.
-                    print(f"   [X] {elder}:")
-                print(f"       Week {32 + i}: {len(overlap)} repeats")
+                    logger.error(f"   [X] {elder}:")
+                logger.error(f"       Week {32 + i}: {overlap} repeats")
                 elder_perfect = False
                 week_perfect = False
 
         if elder_perfect:
-            print(f"   [OK] {elder}: Perfect rotation - 100% new families every week")
+            logger.info(f"   [OK] {elder}: Perfect rotation - 100% new families every week")
 
     if not week_perfect:
         all_perfect = False
 
     # Check 4: Cycle repeats.
-    print(f"\n4. {ROTATION_WEEKS}-WEEK CYCLE CHECK:")
-    for elder in ELDERS:
+    logger.info(f"\n4. {rotation_weeks}-WEEK CYCLE CHECK:")
+    for elder in elders:
         match = True
-        for i in range(ROTATION_WEEKS):
-            if elder_histories[elder][i] != elder_histories[elder][i + ROTATION_WEEKS]:
+        for i in range(rotation_weeks):
+            if elder_histories[elder][i] != elder_histories[elder][i + rotation_weeks]:
                 match = False
                 break
 
         if match:
-            print(f"   [OK] {elder}: {ROTATION_WEEKS}-week cycle repeats correctly")
+            logger.info(f"   [OK] {elder}: {rotation_weeks}-week cycle repeats correctly")
         else:
-            print(f"   [X] {elder}: {ROTATION_WEEKS}-week cycle doesn't match")
+            logger.error(f"   [X] {elder}: {rotation_weeks}-week cycle doesn't match")
             all_perfect = False
 
     # Check 5: All families covered.
-    print("\n5. FAMILY COVERAGE CHECK:")
-    all_families_used: set[str] = set()
-    for week in range(ROTATION_WEEKS):  # Check one complete cycle.
-        assignments = assign_families_for_week_v10(week + 32)
-        for families in assignments.values():
-            all_families_used.update(families)
-
-    all_families = set(parse_directory())
+    logger.info("\n5. FAMILY COVERAGE CHECK:")
+    used = 0
+    for week in range(rotation_weeks):  # Check one complete cycle.
+        for mask in bitsets.masks_for_week(week + 32):
+            used |= mask
+    all_families_used = set(bitsets.decode(used))
+
     missing = all_families - all_families_used
     extra = all_families_used - all_families
 
     if not missing and not extra:
-        print(f"   [OK] All {len(all_families)} families are included in rotation")
+        logger.info(f"   [OK] All {len(all_families)} families are included in rotation")
     else:
         if missing:
-            print(f"   [X] Missing families: {missing}")
+            logger.error(f"   [X] Missing families: {missing}")
         if extra:
-            print(f"   [X] Extra families: {extra}")
+            logger.error(f"   [X] Extra families: {extra}")
         all_perfect = False
 
     return all_perfect
@@ -20,6 +20,7 @@ from prayer_schedule.algorithm import (
     assign_families_for_week_v10,
     calculate_continuous_week,
     get_master_pools,
+    get_rotation_table,
 )
 from prayer_schedule.cli import main
 from prayer_schedule.config import REFERENCE_MONDAY
@@ -32,6 +33,7 @@ __all__ = [
     "parse_directory",
     "assign_families_for_week_v10",
     "get_master_pools",
+    "get_rotation_table",
     "calculate_continuous_week",
     "REFERENCE_MONDAY",
     "main",
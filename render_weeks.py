@@ -0,0 +1,74 @@
+"""
+Render the HTML and text schedule for every week in a date range.
+
+Regenerates past weeks the daily run never archived, or publishes weeks
+ahead, from the verified schedule plan. Files go to
+``archive/weeks/Prayer_Schedule_<monday>_Week<N>.html`` / ``.txt`` next to
+the schedule files; weeks are rendered on a process pool and files that
+are already current are left untouched.
+
+Usage:
+    python render_weeks.py                           # this week and the next 51
+    python render_weeks.py --past 52                 # the last 52 weeks
+    python render_weeks.py --from 2026-03-16 --to 2026-03-29
+"""
+import argparse
+import os
+import sys
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(encoding="utf-8")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from prayer_schedule.bulk import render_range
+from prayer_schedule.config import CENTRAL_TZ, REFERENCE_MONDAY
+from prayer_schedule.log import configure_logging
+from prayer_schedule.tenant import TenantContext
+
+
+def _date(value):
+    return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=CENTRAL_TZ)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--from", dest="start", type=_date, help="first date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", type=_date, help="last date (YYYY-MM-DD)")
+    parser.add_argument("--past", type=int, metavar="N", help="the N weeks before this one")
+    parser.add_argument("--next", type=int, default=52, metavar="N",
+                        help="this week and the N-1 after it (default: 52)")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    parser.add_argument("--output-dir", default=None, help="default: the schedule files' directory")
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    today = datetime.now(CENTRAL_TZ)
+    if args.past is not None:
+        start = today - timedelta(weeks=args.past)
+        end = today - timedelta(weeks=1)
+    else:
+        start = today
+        end = today + timedelta(weeks=args.next - 1)
+    start = args.start or start
+    end = args.end or end
+    if start < REFERENCE_MONDAY:
+        print(f"Weeks before {REFERENCE_MONDAY:%Y-%m-%d} predate the continuous rotation; "
+              f"starting there.")
+        start = REFERENCE_MONDAY
+
+    tenant = TenantContext.from_config()
+    if args.output_dir is not None:
+        tenant = replace(tenant, output_dir=args.output_dir)
+    try:
+        report = render_range(start, end, tenant, max_workers=args.workers)
+    except ValueError as exc:
+        print(f"[X] {exc}")
+        return 1
+    print(report.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
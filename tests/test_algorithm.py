@@ -5,9 +5,11 @@ import pytest
 
 from prayer_schedule import algorithm
 from prayer_schedule.algorithm import (
+    RotationTable,
     assign_families_for_week_v10,
     create_v10_master_pools,
     get_master_pools,
+    get_rotation_table,
 )
 from prayer_schedule.config import (
     FAMILIES_PER_ELDER_MAX,
@@ -120,3 +122,34 @@ def test_assign_families_raises_when_reassignment_map_incomplete(
     monkeypatch.setattr(algorithm, "FIXED_REASSIGNMENT_MAP", {})
     with pytest.raises(RuntimeError, match="FIXED_REASSIGNMENT_MAP missing entry"):
         assign_families_for_week_v10(2)
+
+
+@pytest.mark.parametrize("week", list(WEEK_RANGE))
+def test_rotation_table_matches_direct_assignment(week: int) -> None:
+    table = get_rotation_table()
+    direct = assign_families_for_week_v10(week)
+    looked_up = table.for_week(week)
+    assert list(looked_up.keys()) == list(direct.keys())
+    for elder, families in direct.items():
+        assert looked_up[elder] == tuple(families), (elder, week)
+
+
+def test_rotation_table_is_immutable_and_shared() -> None:
+    table = get_rotation_table()
+    assert table is get_rotation_table()
+    assert table.for_week(1) is table.for_week(1 + POOL_COUNT)
+    with pytest.raises(TypeError):
+        table.for_week(1)["Brian McLaughlin"] = ()  # type: ignore[index]
+
+
+def test_rotation_table_build_raises_when_reassignment_map_incomplete() -> None:
+    with pytest.raises(RuntimeError, match="FIXED_REASSIGNMENT_MAP missing entry"):
+        RotationTable.build(reassignment_map={})
+
+
+def test_rotation_table_encoded_ids_resolve_to_names() -> None:
+    table = get_rotation_table()
+    for week in range(1, POOL_COUNT + 1):
+        names = table.for_week(week)
+        for elder, family_ids in zip(table.elders, table.encoded_for_week(week)):
+            assert tuple(table.registry.decode(family_ids)) == names[elder]
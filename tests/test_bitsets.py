@@ -0,0 +1,100 @@
+"""Bitset invariant-engine tests."""
+from __future__ import annotations
+
+import pytest
+
+from prayer_schedule.algorithm import RotationTable, get_rotation_table
+from prayer_schedule.bitsets import BitsetTable, check_invariants, iter_bits, mask_of
+from prayer_schedule.directory import parse_directory
+from prayer_schedule.elders import ELDER_FAMILIES
+from prayer_schedule.validation import verify_schedule
+
+
+def _edited_table(edit) -> RotationTable:
+    table = get_rotation_table()
+    positions = [
+        {elder: list(families) for elder, families in assignments.items()}
+        for assignments in table.positions
+    ]
+    edit(positions)
+    return RotationTable.from_positions(table.elders, positions, table.registry)
+
+
+def test_mask_round_trip() -> None:
+    ids = [0, 5, 63, 64, 1000]
+    mask = mask_of(ids, 1001)
+    assert mask.bit_count() == len(ids)
+    assert list(iter_bits(mask)) == ids
+    assert mask_of([], 10) == 0
+    with pytest.raises(ValueError, match="outside"):
+        mask_of([10], 10)
+
+
+def test_live_rotation_passes_over_long_horizon() -> None:
+    ok, issues = check_invariants(
+        get_rotation_table(), ELDER_FAMILIES, parse_directory(), 22, 24, weeks=1_000
+    )
+    assert ok, issues
+
+
+def test_bitsets_mirror_encoded_table() -> None:
+    table = get_rotation_table()
+    bitsets = BitsetTable.from_table(table)
+    for week in (1, 7, 8, 53):
+        for mask, assignments in zip(bitsets.masks_for_week(week), table.encoded_for_week(week)):
+            assert list(iter_bits(mask)) == sorted(assignments)
+    assert bitsets.decode(bitsets.full) == list(table.registry.names)
+
+
+def test_duplicate_and_own_family_match_verify_schedule() -> None:
+    def edit(positions):
+        week = positions[2]
+        week["Jerry Wood"].append(week["Kyle Fairman"][0])
+        week["Frank Bohannon"].append(ELDER_FAMILIES["Frank Bohannon"])
+
+    table = _edited_table(edit)
+    ok, issues = check_invariants(table, ELDER_FAMILIES, min_count=22, max_count=25)
+    reference_ok, reference = verify_schedule(table.positions[2], ELDER_FAMILIES, 22, 25)
+    assert not ok and not reference_ok
+    assert "Week 3: Frank Bohannon has their own family in the list!" in issues
+    assert sum("assigned more than once" in issue for issue in issues) == sum(
+        "assigned 2 times" in issue for issue in reference
+    ) == 2
+    assert all(issue.startswith("Week 3:") for issue in issues)
+
+
+def test_family_repeated_within_one_list_is_counted_and_reported() -> None:
+    def edit(positions):
+        week = positions[2]
+        week["Jerry Wood"].append(week["Jerry Wood"][0])
+
+    table = _edited_table(edit)
+    ok, issues = check_invariants(table, ELDER_FAMILIES, min_count=22, max_count=23)
+    _, reference = verify_schedule(table.positions[2], ELDER_FAMILIES, 22, 23)
+    repeated = table.positions[2]["Jerry Wood"][0]
+    assert not ok
+    assert f"Week 3: {repeated} assigned more than once this week" in issues
+    count = len(table.positions[2]["Jerry Wood"])
+    assert f"Week 3: Jerry Wood: {count} families (should be 22-23)" in issues
+    assert f"Jerry Wood: {count} families (should be 22-23)" in reference
+
+
+def test_overlap_and_coverage_are_reported_once() -> None:
+    table = get_rotation_table()
+    repeated = table.positions[4]["L.A. Fox"][0]
+    dropped = table.positions[0]["Jerry Wood"][0]
+
+    def edit(positions):
+        holder = next(e for e, fams in positions[5].items() if repeated in fams)
+        positions[5][holder].remove(repeated)
+        positions[5]["L.A. Fox"].append(repeated)
+        positions[0]["Jerry Wood"].remove(dropped)
+
+    ok, issues = check_invariants(
+        _edited_table(edit), ELDER_FAMILIES, min_count=21, max_count=25, weeks=500
+    )
+    assert not ok
+    assert issues == [
+        f"Week 1: 1 families missing: {[dropped]}",
+        "Week 5->6: L.A. Fox: 1 repeats into the next week",
+    ]
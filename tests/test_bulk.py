@@ -0,0 +1,66 @@
+"""Bulk-render tests: files match the daily renderer, reruns, range checks."""
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+from prayer_schedule import bulk, output
+from prayer_schedule.bulk import render_range, week_file_stem
+from prayer_schedule.config import CENTRAL_TZ
+from prayer_schedule.elders import get_week_schedule
+from prayer_schedule.tenant import TenantContext
+
+
+def _tenant(tmp_path) -> TenantContext:
+    return replace(TenantContext.from_config(), output_dir=str(tmp_path))
+
+
+def test_rendered_weeks_match_the_daily_renderer(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(output, "updated_stamp", lambda: "STAMP")
+    monkeypatch.setattr(bulk, "format_stamp", lambda moment: "STAMP")
+    tenant = _tenant(tmp_path)
+    report = render_range(
+        datetime(2026, 3, 18, tzinfo=CENTRAL_TZ),
+        datetime(2026, 5, 3, tzinfo=CENTRAL_TZ),
+        tenant,
+        max_workers=0,
+        chunk_weeks=3,
+    )
+    assert (report.first_monday.date(), report.last_monday.date()) == (
+        datetime(2026, 3, 16).date(), datetime(2026, 4, 27).date()
+    )
+    assert report.weeks == 7 and len(report.written) == 14 and report.unchanged == 0
+
+    monday = datetime(2026, 3, 23, tzinfo=CENTRAL_TZ)
+    table = tenant.build_rotation_table()
+    expected = output.generate_schedule_content(
+        13, monday, table.for_week(13), get_week_schedule(13, tenant.elder_data)
+    )
+    stem = os.path.join(str(tmp_path), "archive", "weeks", week_file_stem(monday))
+    assert stem.endswith("Prayer_Schedule_2026-03-23_Week13")
+    for suffix, content in zip((".html", ".txt"), expected):
+        with open(stem + suffix, encoding="utf-8") as handle:
+            assert handle.read() == content
+
+
+def test_rerun_on_a_pool_leaves_current_files_alone(tmp_path) -> None:
+    tenant = _tenant(tmp_path)
+    start, end = datetime(2026, 1, 1, tzinfo=CENTRAL_TZ), datetime(2026, 6, 30, tzinfo=CENTRAL_TZ)
+    first = render_range(start, end, tenant, max_workers=0)
+    # Pages are stamped with the plan's compile time, not the clock, so
+    # neither a later run nor worker processes change them.
+    again = render_range(start, end, tenant, max_workers=2, chunk_weeks=4)
+    assert again.weeks == first.weeks == 27
+    assert (again.written, again.unchanged) == ([], 54)
+    assert again.summary().startswith("[OK] 27 weeks 2025-12-29 to 2026-06-29")
+
+
+def test_invalid_ranges_are_rejected(tmp_path) -> None:
+    tenant = _tenant(tmp_path)
+    with pytest.raises(ValueError, match="predates"):
+        render_range(datetime(2025, 12, 1), datetime(2026, 1, 31), tenant, max_workers=0)
+    with pytest.raises(ValueError, match="precedes"):
+        render_range(datetime(2026, 3, 1), datetime(2026, 2, 1), tenant, max_workers=0)
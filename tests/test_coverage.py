@@ -0,0 +1,74 @@
+"""Coverage-matrix tests: cells agree with the rotation table over long horizons."""
+from __future__ import annotations
+
+import pytest
+
+from prayer_schedule.algorithm import get_rotation_table
+from prayer_schedule.config import ROTATION_WEEKS
+from prayer_schedule.coverage import CoverageMatrix
+from prayer_schedule.elders import ELDER_FAMILIES, ELDERS
+
+
+@pytest.fixture(scope="module")
+def matrix() -> CoverageMatrix:
+    # Start mid-cycle and end on a partial cycle to exercise the tiling.
+    return CoverageMatrix.build(527, start_week=40)
+
+
+def test_cells_match_rotation_table(matrix: CoverageMatrix) -> None:
+    table = get_rotation_table()
+    assert len(matrix.data) == 527 * len(matrix.families)
+    for week in (40, 41, 46, 47, 300, 566):
+        for elder, families in table.for_week(week).items():
+            for family in families:
+                assert matrix.elder_for(week, family) == elder
+
+
+def test_every_family_covered_every_week(matrix: CoverageMatrix) -> None:
+    assert matrix.uncovered_weeks() == []
+    for family in matrix.families[:20]:
+        assert matrix.times_prayed(family) == 527
+
+
+def test_gaps_never_repeat_week_to_week(matrix: CoverageMatrix) -> None:
+    last_week = matrix.start_week + matrix.weeks - 1
+    for family in matrix.families:
+        # Consecutive prayers by anyone are one week apart.
+        assert set(matrix.gaps(family)) == {1}
+        for elder in ELDERS:
+            assert min(matrix.gaps(family, elder), default=2) >= 2
+            weeks = set(matrix.prayer_weeks(family, elder))
+            assert all(w + ROTATION_WEEKS in weeks for w in weeks if w + ROTATION_WEEKS <= last_week)
+
+
+def test_no_elder_ever_prays_for_own_family(matrix: CoverageMatrix) -> None:
+    for elder in ELDERS:
+        assert matrix.times_prayed(ELDER_FAMILIES[elder], elder) == 0
+
+
+def test_elder_load_matches_table(matrix: CoverageMatrix) -> None:
+    table = get_rotation_table()
+    for elder in ELDERS:
+        load = matrix.elder_load(elder, 45, 96)
+        assert load == [len(table.for_week(w)[elder]) for w in range(45, 97)]
+        assert all(22 <= n <= 24 for n in matrix.elder_load(elder))
+    total = sum(sum(matrix.elder_load(elder)) for elder in ELDERS)
+    assert total == 527 * len(matrix.families)
+
+
+def test_pair_counts_sum_to_horizon(matrix: CoverageMatrix) -> None:
+    counts = matrix.pair_counts()
+    assert all(sum(per_elder.values()) == 527 for per_elder in counts.values())
+    assert matrix.as_array().tolist()[: len(matrix.families)] == list(
+        matrix.data[: len(matrix.families)]
+    )
+
+
+def test_rejects_out_of_range_and_unknown() -> None:
+    matrix = CoverageMatrix.build(14)
+    with pytest.raises(ValueError, match="fall outside"):
+        matrix.elder_load(ELDERS[0], 1, 15)
+    with pytest.raises(ValueError, match="family not in matrix"):
+        matrix.times_prayed("Nobody, Here")
+    with pytest.raises(ValueError, match="non-negative"):
+        CoverageMatrix.build(-1)
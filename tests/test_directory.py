@@ -58,3 +58,26 @@ def test_parse_rejects_whitespace_only_field() -> None:
     blank_csv = 'Last Name,First Names\n"   ",John\n'
     with pytest.raises(ValueError, match="empty 'Last Name'"):
         parse_directory(blank_csv)
+
+
+def test_family_registry_round_trips(directory_families: list[str]) -> None:
+    from prayer_schedule.directory import get_family_registry
+
+    registry = get_family_registry()
+    assert registry is get_family_registry()
+    assert list(registry.names) == directory_families
+    encoded = registry.encode(reversed(directory_families))
+    assert encoded.typecode == "I"
+    assert list(encoded) == list(range(len(directory_families) - 1, -1, -1))
+    assert registry.decode(encoded) == list(reversed(directory_families))
+
+
+def test_family_registry_rejects_unknown_family() -> None:
+    from prayer_schedule.directory import FamilyRegistry
+
+    registry = FamilyRegistry.from_families(["Smith, John", "Doe, Jane", "Smith, John"])
+    assert registry.names == ("Doe, Jane", "Smith, John")
+    with pytest.raises(ValueError, match="not in registry"):
+        registry.encode(["Nobody, Here"])
+    with pytest.raises(ValueError, match="not in registry"):
+        registry.id_of("Nobody, Here")
@@ -0,0 +1,103 @@
+"""Day-schedule tests: fixed, shared, multi-day and floating elders."""
+from __future__ import annotations
+
+from typing import Optional
+
+from prayer_schedule.config import DAYS_OF_WEEK
+from prayer_schedule.elders import (
+    ELDER_DATA,
+    DaySchedule,
+    get_day_schedule,
+    get_week_schedule,
+    roster_version,
+)
+from prayer_schedule.validation import validate_elder_data
+
+
+def _roster(days_per_elder: list[Optional[list[str]]]) -> list[dict]:
+    """Build a roster; ``None`` marks a floating elder."""
+    return [
+        {"name": f"Elder {i:02d}", "family": f"Family {i:02d}", "days": days or []}
+        | ({"floating": True} if days is None else {})
+        for i, days in enumerate(days_per_elder)
+    ]
+
+
+def test_live_roster_is_one_elder_per_day_every_week() -> None:
+    first = get_week_schedule(1)
+    assert list(first) == list(DAYS_OF_WEEK)
+    assert all(len(elders) == 1 for elders in first.values())
+    for week in (2, 7, 52, 53, 400):
+        assert get_week_schedule(week) == first
+
+
+def test_schedule_is_cached_per_roster_version() -> None:
+    assert get_day_schedule() is get_day_schedule(list(ELDER_DATA))
+    edited = [dict(e) for e in ELDER_DATA]
+    edited[0]["days"] = ["Monday", "Tuesday"]
+    assert roster_version(edited) != roster_version(ELDER_DATA)
+    assert get_day_schedule(edited) is not get_day_schedule()
+    assert get_week_schedule(1, edited)["Tuesday"] == ["Brian McLaughlin", "Frank Bohannon"]
+
+
+def test_returned_schedule_is_a_fresh_copy() -> None:
+    schedule = get_week_schedule(1)
+    schedule["Monday"].append("Intruder")
+    assert "Intruder" not in get_week_schedule(1)["Monday"]
+
+
+def test_floating_elders_share_days_and_rotate() -> None:
+    roster = _roster([None] * 14)
+    day_schedule = DaySchedule.build(roster)
+    assert len(day_schedule.weeks) == 7
+    for week in range(1, 8):
+        mapping = day_schedule.for_week(week)
+        assert all(len(elders) == 2 for elders in mapping.values())
+    for elder in (e["name"] for e in roster):
+        visited = [day for w in range(1, 8) for day in day_schedule.days_for(w, elder)]
+        assert sorted(visited) == sorted(DAYS_OF_WEEK)
+    assert day_schedule.for_week(8) is day_schedule.for_week(1)
+
+
+def test_fixed_multi_day_and_floating_mix() -> None:
+    roster = _roster([["Monday", "Thursday"], ["Sunday"], None, None, None, None])
+    day_schedule = DaySchedule.build(roster)
+    for week in range(1, 15):
+        assert day_schedule.days_for(week, "Elder 00") == ["Monday", "Thursday"]
+        assert day_schedule.days_for(week, "Elder 01") == ["Sunday"]
+        assert all(len(day_schedule.days_for(week, f"Elder {i:02d}")) == 1 for i in range(2, 6))
+
+
+def test_validation_accepts_floating_roster_and_flags_gaps() -> None:
+    from prayer_schedule.directory import parse_directory
+
+    families = parse_directory()
+    covering = [
+        {"name": f"Elder {i:02d}", "family": families[i], "days": [], "floating": True}
+        for i in range(14)
+    ]
+    ok, issues = validate_elder_data(covering, expected_count=14)
+    assert ok, issues
+
+    # Three floaters cannot cover seven days in any week.
+    gappy = covering[:3]
+    ok, issues = validate_elder_data(gappy, expected_count=3)
+    assert not ok
+    assert any("Days with no assigned elder" in issue for issue in issues)
+
+
+def test_validation_rejects_empty_days_unless_floating() -> None:
+    roster = [dict(e) for e in ELDER_DATA]
+    roster[0]["days"] = []
+    ok, issues = validate_elder_data(roster)
+    assert not ok
+    assert f"{roster[0]['name']}: no assigned days" in issues
+
+    roster[0]["floating"] = True
+    ok, issues = validate_elder_data(roster)
+    assert not any("assigned days" in issue for issue in issues)
+
+    roster[0]["days"] = ["Monday"]
+    ok, issues = validate_elder_data(roster)
+    assert not ok
+    assert f"{roster[0]['name']}: floating elder also has assigned days" in issues
@@ -169,3 +169,20 @@ def test_send_rejects_elder_name_with_crlf(
     result = email_service.send_daily_combined_email(today, week_num, monday, assignments)
     assert result is False
     assert factory.call_count == 0, "SMTP must not be opened when the subject is poisoned"
+
+
+def test_email_html_uses_the_given_church_and_site() -> None:
+    today, monday, week_num, assignments = _fixture_today_and_assignments()
+    schedule = email_service.get_week_schedule(week_num)
+    html = email_service._build_combined_email_html(
+        today, "Friday", week_num, monday, schedule, assignments,
+        "Oak Street Church", "https://example.org/oak/",
+    )
+    assert "Crossville" not in html and "vlcosent" not in html
+    assert "Oak Street Church &bull; Elder Prayer List" in html
+    assert 'href="https://example.org/oak/"' in html
+
+    unlinked = email_service._build_combined_email_html(
+        today, "Friday", week_num, monday, schedule, assignments, "Oak Street Church", None
+    )
+    assert "View Full Schedule Online" not in unlinked
@@ -1,6 +1,7 @@
 """File-I/O tests: atomic-write cleanup, archive timezone, archive idempotency."""
 from __future__ import annotations
 
+import gzip
 import os
 from datetime import datetime, timezone
 
@@ -150,3 +151,81 @@ def test_log_activity_does_not_rotate_under_threshold(
     log_file = os.path.join(str(tmp_path), file_io._LOG_FILE_NAME)
     assert os.path.exists(log_file)
     assert not os.path.exists(f"{log_file}.1")
+
+
+def test_update_writes_hashed_assets_and_prunes_old_versions(tmp_path: object) -> None:
+    """Assets land before the page; superseded hashes of the same file go."""
+    out = str(tmp_path)
+    asset_dir = os.path.join(out, "assets")
+    os.makedirs(asset_dir)
+    for name in ("site.0123456789ab.css", "site.0123456789ab.js", "notes.txt"):
+        with open(os.path.join(asset_dir, name), "w", encoding="utf-8") as handle:
+            handle.write("old")
+
+    assets = {"assets/site.fedcba987654.css": "body {}", "assets/site.0123456789ab.js": "new"}
+    assert file_io.update_desktop_files("<html>", "text", out, assets)
+
+    assert sorted(os.listdir(asset_dir)) == [
+        "notes.txt", "site.0123456789ab.js", "site.fedcba987654.css",
+    ]
+    with open(os.path.join(asset_dir, "site.fedcba987654.css"), encoding="utf-8") as handle:
+        assert handle.read() == "body {}"
+    # An existing hashed name already holds its content and is not rewritten.
+    with open(os.path.join(asset_dir, "site.0123456789ab.js"), encoding="utf-8") as handle:
+        assert handle.read() == "old"
+    assert os.path.exists(os.path.join(out, file_io._CURRENT_HTML_NAME))
+
+
+def test_streamed_write_skips_unchanged_and_cleans_up_on_error(tmp_path: object) -> None:
+    target = os.path.join(str(tmp_path), "out.txt")
+    assert file_io._write_if_changed(target, iter(["a", "b\n"])) is True
+    assert file_io._write_if_changed(target, iter(["ab", "\n"])) is False
+    assert os.listdir(str(tmp_path)) == ["out.txt"]
+
+    def failing():
+        yield "partial"
+        raise RuntimeError("renderer failed")
+
+    with pytest.raises(RuntimeError):
+        file_io._write_if_changed(target, failing())
+    assert os.listdir(str(tmp_path)) == ["out.txt"]
+    with open(target, encoding="utf-8") as handle:
+        assert handle.read() == "ab\n"
+
+
+def test_precompress_only_recompresses_changed_files(tmp_path: object) -> None:
+    root = str(tmp_path)
+    os.makedirs(os.path.join(root, "archive", "weeks"))
+    files = {
+        file_io._CURRENT_HTML_NAME: "<html>page</html>\n",
+        "archive/weeks/Prayer_Schedule_2026-05-11_Week20.txt": "WEEK 20\n",
+        "archive/notes.md": "not published\n",
+    }
+    for rel_path, content in files.items():
+        with open(os.path.join(root, *rel_path.split("/")), "w", encoding="utf-8") as handle:
+            handle.write(content)
+
+    rel_paths = file_io.published_files(root)
+    assert rel_paths == [
+        file_io._CURRENT_HTML_NAME,
+        "archive/weeks/Prayer_Schedule_2026-05-11_Week20.txt",
+    ]
+    assert file_io.precompress(root, rel_paths, 9) == rel_paths
+    page_gz = os.path.join(root, f"{file_io._CURRENT_HTML_NAME}.gz")
+    with open(page_gz, "rb") as handle:
+        first = handle.read()
+    assert gzip.decompress(first) == b"<html>page</html>\n"
+
+    # Nothing changed: nothing is recompressed.
+    assert file_io.precompress(root, rel_paths, 9) == []
+    # Same size, different bytes: the hash catches it.
+    with open(os.path.join(root, file_io._CURRENT_HTML_NAME), "w", encoding="utf-8") as handle:
+        handle.write("<html>PAGE</html>\n")
+    assert file_io.precompress(root, rel_paths, 9) == [file_io._CURRENT_HTML_NAME]
+    # A level change recompresses everything.
+    assert file_io.precompress(root, rel_paths, 1) == rel_paths
+
+    # A source that disappears takes its .gz with it.
+    os.remove(os.path.join(root, file_io._CURRENT_HTML_NAME))
+    assert file_io.precompress(root, file_io.published_files(root), 1) == []
+    assert not os.path.exists(page_gz)
@@ -0,0 +1,72 @@
+"""Fuzzing-harness tests: determinism, classification and shrinking."""
+from __future__ import annotations
+
+from dataclasses import replace
+
+from prayer_schedule.directory import parse_directory
+from prayer_schedule.fuzz import (
+    OUTCOMES,
+    generate_case,
+    run_block,
+    run_case,
+    run_fuzz,
+    shrink_case,
+)
+
+
+def _valid_case(start: int = 0):
+    seed = start
+    while not generate_case(seed).expect_valid:
+        seed += 1
+    return generate_case(seed)
+
+
+def test_cases_are_determined_by_seed() -> None:
+    assert generate_case(42) == generate_case(42)
+    assert generate_case(42) != generate_case(43)
+
+
+def test_block_of_seeds_has_no_failures() -> None:
+    block = run_block(0, 150)
+    assert sum(block.counts.values()) == 150
+    assert set(block.counts) == set(OUTCOMES)
+    assert block.counts["fail"] == 0, block.failures
+    assert block.counts["ok"] > 0
+
+
+def test_planted_invalid_input_is_rejected() -> None:
+    case = _valid_case()
+    records = [dict(record) for record in case.elder_data]
+    records[0]["family"] = "Missing, Family"
+    planted = replace(case, elder_data=tuple(records), expect_valid=False)
+    assert run_case(planted).outcome == "rejected"
+    # Claiming the broken roster is valid is itself a finding.
+    result = run_case(replace(planted, expect_valid=True))
+    assert (result.outcome, result.stage) == ("fail", "validation")
+
+
+def test_shrink_case_reaches_a_minimal_failure() -> None:
+    case = _valid_case()
+    assert len(case.elder_data) >= 2
+
+    def still_fails(candidate) -> bool:
+        protected = {record["family"] for record in candidate.elder_data}
+        others = set(parse_directory(candidate.directory_csv)) - protected
+        return len(candidate.elder_data) >= 2 and len(others) >= 3
+
+    minimal = shrink_case(case, still_fails)
+    assert still_fails(minimal)
+    assert len(minimal.elder_data) == 2
+    protected = {record["family"] for record in minimal.elder_data}
+    assert len(set(parse_directory(minimal.directory_csv)) - protected) == 3
+    # Dropped elders' days move to a neighbour, so every day stays covered.
+    days = {day for record in minimal.elder_data for day in record["days"]}
+    assert days == {day for record in case.elder_data for day in record["days"]}
+
+
+def test_run_fuzz_reports_throughput() -> None:
+    report = run_fuzz(40, seed=1_000, max_workers=2, block_size=10)
+    assert report.cases == 40
+    assert report.counts["fail"] == 0
+    assert report.throughput > 0
+    assert report.summary().startswith("[OK] 40 cases")
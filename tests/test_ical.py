@@ -0,0 +1,83 @@
+"""Calendar-feed tests: RFC 5545 framing, stable UIDs, incremental rewrites."""
+from __future__ import annotations
+
+import os
+import re
+from datetime import datetime, timezone
+
+from prayer_schedule import ical
+from prayer_schedule.config import CENTRAL_TZ
+from prayer_schedule.tenant import TenantContext
+
+TODAY = datetime(2026, 5, 12, 8, 0, tzinfo=CENTRAL_TZ)
+FIRST_RUN = datetime(2026, 5, 12, 13, 0, tzinfo=timezone.utc)
+LATER_RUN = datetime(2026, 5, 13, 13, 0, tzinfo=timezone.utc)
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as handle:
+        return handle.read()
+
+
+def _events(feed: bytes) -> dict[str, str]:
+    """Map UID -> unfolded event text."""
+    text = feed.decode("utf-8").replace("\r\n ", "")
+    return {
+        re.search(r"^UID:(.*)$", block, re.M).group(1): block
+        for block in text.split("BEGIN:VEVENT")[1:]
+    }
+
+
+def test_feeds_are_well_formed(tmp_path) -> None:
+    tenant = TenantContext.from_config()
+    report = ical.write_feeds(
+        tenant, tenant.build_rotation_table(), TODAY, str(tmp_path), now=FIRST_RUN
+    )
+    assert len(report.files) == len(tenant.elders) + 1
+    assert report.changed == report.events
+    elder = tenant.elders[0]
+    feed = _read(os.path.join(tmp_path, "calendar", ical.elder_feed_name(elder)))
+    lines = feed.split(b"\r\n")
+    assert lines[0] == b"BEGIN:VCALENDAR" and lines[-2:] == [b"END:VCALENDAR", b""]
+    assert b"\n" not in feed.replace(b"\r\n", b"")
+    assert max(len(line) for line in lines) <= 75
+    events = _events(feed)
+    # Nine weeks (one back, eight ahead), one prayer day a week.
+    assert len(events) == 9
+    uid, event = next(iter(events.items()))
+    assert uid.startswith("20260504-")
+    assert "DTSTAMP:20260512T130000Z" in event and "SEQUENCE:0" in event
+    assert "TRIGGER;RELATED=START:PT7H" in event
+    assert "\\, " in event  # "Last, First" commas are escaped
+
+
+def test_unchanged_events_keep_their_stamp_and_files_are_not_rewritten(tmp_path) -> None:
+    tenant = TenantContext.from_config()
+    table = tenant.build_rotation_table()
+    ical.write_feeds(tenant, table, TODAY, str(tmp_path), now=FIRST_RUN)
+    path = os.path.join(tmp_path, "calendar", ical.CONGREGATION_FEED_NAME)
+    before = _read(path)
+
+    report = ical.write_feeds(tenant, table, TODAY, str(tmp_path), now=LATER_RUN)
+    assert (report.changed, report.written) == (0, [])
+    assert _read(path) == before
+
+    # A renamed family changes only the events that list it.
+    moved = table.for_week(20)[tenant.elders[0]][0]
+    families = {
+        elder: [("Renamed, Family" if f == moved else f) for f in assigned]
+        for elder, assigned in table.for_week(20).items()
+    }
+
+    class Table:
+        def for_week(self, week: int):
+            return families if week == 20 else table.for_week(week)
+
+    report = ical.write_feeds(tenant, Table(), TODAY, str(tmp_path), now=LATER_RUN)
+    assert report.changed == 2  # the elder's event and the congregation's day
+    after = _events(_read(path))
+    changed = [uid for uid, event in after.items() if "SEQUENCE:1" in event]
+    assert len(changed) == 1 and "DTSTAMP:20260513T130000Z" in after[changed[0]]
+    assert all(
+        "DTSTAMP:20260512T130000Z" in event for uid, event in after.items() if uid not in changed
+    )
@@ -0,0 +1,121 @@
+"""Incremental re-verification tests: results always equal a full re-check."""
+from __future__ import annotations
+
+import random
+
+from prayer_schedule.algorithm import FIXED_REASSIGNMENT_MAP, RotationTable, get_master_pools
+from prayer_schedule.elders import ELDER_FAMILIES, ELDERS
+from prayer_schedule.incremental import ChangeDelta, reverify, verify_full
+from prayer_schedule.pools import build_pools, rebalance_pools
+from prayer_schedule.reassignment import solve_reassignment_map
+
+
+def _flat(pools: list[list[str]]) -> list[str]:
+    return [family for pool in pools for family in pool]
+
+
+def _baseline():
+    pools = get_master_pools()
+    table = RotationTable.build()
+    result = verify_full(table, ELDER_FAMILIES, FIXED_REASSIGNMENT_MAP, _flat(pools), 22, 24)
+    return pools, result
+
+
+def test_full_verification_passes_for_live_rotation() -> None:
+    _, result = _baseline()
+    assert result.ok, result.issues
+    assert result.checked == 7 * 7 * 2 + 7
+
+
+def test_added_family_rechecks_only_holders_of_changed_pool() -> None:
+    pools, previous = _baseline()
+    new_pools, pool_delta = rebalance_pools(pools, _flat(pools) + ["Aaron, New"])
+    table = RotationTable.build(new_pools, ELDERS, ELDER_FAMILIES, FIXED_REASSIGNMENT_MAP)
+
+    result = reverify(
+        previous, table, ChangeDelta(pools=pool_delta),
+        ELDER_FAMILIES, FIXED_REASSIGNMENT_MAP, _flat(new_pools),
+    )
+    full = verify_full(table, ELDER_FAMILIES, FIXED_REASSIGNMENT_MAP, _flat(new_pools), 22, 24)
+    assert result.issues == full.issues
+    assert result.ok == full.ok
+    # One cell per position, its two pairs, and every position's coverage.
+    assert result.checked < full.checked
+    assert result.checked == 7 + 14 + 7
+
+
+def test_map_edit_surfaces_repeat_like_full_check() -> None:
+    pools, previous = _baseline()
+    table_before = RotationTable.build()
+    # Route Larry's family to whoever holds Larry's pool next week: unsafe.
+    pool_idx = get_master_pools().index(
+        next(p for p in get_master_pools() if ELDER_FAMILIES["Larry McDuffee"] in p)
+    )
+    unsafe = ELDERS[(pool_idx - 2) % 7]
+    edited = {pos: dict(m) for pos, m in FIXED_REASSIGNMENT_MAP.items()}
+    edited[1]["Larry McDuffee"] = unsafe
+    table = RotationTable.build(reassignment_map=edited)
+    assert table.positions != table_before.positions
+
+    result = reverify(previous, table, ChangeDelta(), ELDER_FAMILIES, edited, _flat(pools))
+    full = verify_full(table, ELDER_FAMILIES, edited, _flat(pools), 22, 24)
+    assert not full.ok
+    assert result.issues == full.issues
+    assert result.checked < full.checked
+
+
+def test_elder_family_change_is_detected_without_hint() -> None:
+    pools, previous = _baseline()
+    families = dict(ELDER_FAMILIES)
+    families["Brian McLaughlin"] = pools[4][0]
+    solved = solve_reassignment_map(pools, ELDERS, families)
+    table = RotationTable.build(pools, ELDERS, families, solved)
+
+    result = reverify(previous, table, ChangeDelta(), families, solved, _flat(pools))
+    full = verify_full(table, families, solved, _flat(pools), 22, 24)
+    assert result.issues == full.issues
+    assert result.ok
+
+
+def test_random_edit_sequences_match_full_verification() -> None:
+    rng = random.Random(7)
+    families = [f"Family{i:05d}, Member" for i in range(1_000)]
+    elders = [f"Elder {i:02d}" for i in range(12)]
+    own = dict(zip(elders, rng.sample(families, 12)))
+    pools = build_pools(families, 12)
+    lo, hi = 1_000 // 12 - 2, -(-1_000 // 12) + 2
+    mapping = solve_reassignment_map(pools, elders, own, lo, hi)
+    table = RotationTable.build(pools, elders, own, mapping)
+    result = verify_full(table, own, mapping, families, lo, hi)
+
+    protected = set(own.values())
+    for step in range(25):
+        current = _flat(pools)
+        removable = [f for f in current if f not in protected]
+        directory = [f for f in current if f not in set(rng.sample(removable, rng.randint(0, 3)))]
+        directory += [f"New{step:02d}{k}, Member" for k in range(rng.randint(0, 3))]
+        pools, pool_delta = rebalance_pools(pools, directory)
+        mapping = solve_reassignment_map(pools, elders, own, lo, hi)
+        table = RotationTable.build(pools, elders, own, mapping)
+
+        result = reverify(result, table, ChangeDelta(pools=pool_delta), own, mapping, directory)
+        full = verify_full(table, own, mapping, directory, lo, hi)
+        assert result.issues == full.issues, step
+        assert result.ok == full.ok
+
+
+def test_stale_table_fails_coverage_like_full_check() -> None:
+    pools, previous = _baseline()
+    dropped = next(f for f in pools[3] if f not in ELDER_FAMILIES.values())
+    directory = [f for f in _flat(pools) if f != dropped]
+    _, pool_delta = rebalance_pools(pools, directory)
+    # Table still built from the old pools: the dropped family lingers.
+    stale = RotationTable.build()
+
+    result = reverify(
+        previous, stale, ChangeDelta(pools=pool_delta),
+        ELDER_FAMILIES, FIXED_REASSIGNMENT_MAP, directory,
+    )
+    full = verify_full(stale, ELDER_FAMILIES, FIXED_REASSIGNMENT_MAP, directory, 22, 24)
+    assert not result.ok
+    assert result.issues == full.issues
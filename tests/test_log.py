@@ -0,0 +1,68 @@
+"""Console-logging tests: levels, quiet mode and the [OK]/[X] format."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Iterator
+
+import pytest
+
+from prayer_schedule import log
+from prayer_schedule.algorithm import calculate_week_number
+from prayer_schedule.batch import run_batch
+from prayer_schedule.config import CENTRAL_TZ
+from prayer_schedule.file_io import update_desktop_files
+from tests.test_tenant import _synthetic_tenant
+
+
+@pytest.fixture(autouse=True)
+def _restore_logging() -> Iterator[None]:
+    level, handler = log.logger.level, log._HANDLER
+    yield
+    if handler is None and log._HANDLER is not None:
+        log.logger.removeHandler(log._HANDLER)
+        log._HANDLER = None
+    log.logger.setLevel(level)
+
+
+def test_week_calculation_is_silent_unless_debug(capsys: pytest.CaptureFixture[str]) -> None:
+    log.configure_logging(logging.INFO)
+    monday = datetime(2026, 3, 2, tzinfo=CENTRAL_TZ)
+    assert calculate_week_number(monday) == 10
+    assert capsys.readouterr().out == ""
+
+    log.configure_logging(logging.DEBUG)
+    calculate_week_number(monday)
+    assert capsys.readouterr().out == "  Date 2026-03-02 = ISO Week 10 of 2026\n"
+
+
+def test_messages_keep_console_format(tmp_path, capsys: pytest.CaptureFixture[str]) -> None:
+    log.configure_logging(logging.INFO)
+    assert update_desktop_files("<html></html>", "text", str(tmp_path))
+    out = capsys.readouterr().out
+    assert out.startswith("   [OK] Updated: ")
+    assert "[INFO]" not in out and "prayer_schedule" not in out
+
+
+def test_quiet_mode_shows_only_problems(tmp_path, capsys: pytest.CaptureFixture[str]) -> None:
+    log.configure_logging(quiet=True)
+    assert update_desktop_files("<html></html>", "text", str(tmp_path))
+    assert not update_desktop_files("<html></html>", "text", str(tmp_path / "missing"))
+    out = capsys.readouterr().out
+    assert "[OK]" not in out
+    assert "   [ERROR] Output directory does not exist" in out
+    # A later call without arguments (as cli.main makes) keeps quiet mode.
+    log.configure_logging()
+    assert log.logger.level == logging.WARNING
+
+
+def test_quiet_batch_captures_only_failures(tmp_path) -> None:
+    out = tmp_path / "ok"
+    out.mkdir()
+    tenants = [
+        _synthetic_tenant("Quiet", 90, str(out)),
+        _synthetic_tenant("Broken", 90, str(tmp_path / "missing")),
+    ]
+    quiet, broken = run_batch(tenants, max_workers=1, quiet=True).results
+    assert quiet.ok and quiet.output == ""
+    assert not broken.ok and "[ERROR]" in broken.output
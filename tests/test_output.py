@@ -7,6 +7,7 @@ clock — not the runner's UTC.
 """
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 
 import pytest
@@ -109,3 +110,97 @@ def test_last_updated_uses_central_time(monkeypatch: pytest.MonkeyPatch) -> None
     assert "Last updated: May 14, 2026 at 10:00 PM" in html
     # The naive-UTC rendering would have been May 15 — make sure it's gone.
     assert "Last updated: May 15, 2026" not in html
+
+
+def test_text_schedule_layout_is_unchanged() -> None:
+    """Pin the plain-text layout byte for byte, including multi-elder days."""
+    monday = datetime(2026, 5, 11, 0, 0, tzinfo=CENTRAL_TZ)
+    schedule = {day: ["Sam"] for day in output.DAYS}
+    schedule["Wednesday"] = ["Sam", "Ann"]
+    assignments = {"Sam": ["Smith, John"], "Ann": ["Adams, Al", "Brown, Bo"]}
+
+    text = output.generate_text_schedule(19, monday, assignments, schedule)
+
+    rule = "=" * 60
+    expected = (
+        f"{rule}\nCROSSVILLE CHURCH OF CHRIST\nWeek 19: May 11 - May 17, 2026\n{rule}\n\n"
+        "Note: Each day of the week has one elder assigned.\n\n"
+        "Monday, May 11: Sam\nTuesday, May 12: Sam\nWednesday, May 13: Sam & Ann\n"
+        "Thursday, May 14: Sam\nFriday, May 15: Sam\nSaturday, May 16: Sam\n"
+        "Sunday, May 17: Sam\n"
+        f"\n{rule}\nPRAYER LISTS\n{rule}\n"
+    )
+    dates = dict(zip(output.DAYS, range(11, 18)))
+    for day in output.DAYS:
+        for elder in schedule[day]:
+            families = assignments[elder]
+            expected += f"\n{elder} - {day}, May {dates[day]}\n{'-' * 50}\n{len(families)} families:\n\n"
+            expected += "".join(f"{i:3}. {family}\n" for i, family in enumerate(families, 1))
+            expected += "\n"
+    expected += f"{rule}\n-- Crossville Church of Christ Elder Ministry --\n"
+    assert text == expected
+
+
+def test_linked_assets_replace_inline_styles_and_script() -> None:
+    week_num, monday, schedule, elder_assignments = _crafted_assignments()
+    inline = output.generate_html_schedule(week_num, monday, elder_assignments, schedule)
+    linked = output.generate_html_schedule(
+        week_num, monday, elder_assignments, schedule, inline_assets=False
+    )
+    assets = output.html_assets()
+
+    assert set(assets) == {output.STYLESHEET_PATH, output.SCRIPT_PATH}
+    assert f'<link rel="stylesheet" href="{output.STYLESHEET_PATH}">' in linked
+    assert f'<script src="{output.SCRIPT_PATH}"></script>' in linked
+    assert "<style>" not in linked and "<script>" not in linked
+    # Re-inlining the asset contents gives back the desktop page exactly.
+    rebuilt = linked.replace(
+        f'<link rel="stylesheet" href="{output.STYLESHEET_PATH}">',
+        f"<style>\n{assets[output.STYLESHEET_PATH]}    </style>",
+    ).replace(
+        f'<script src="{output.SCRIPT_PATH}"></script>',
+        f"<script>\n{assets[output.SCRIPT_PATH]}    </script>",
+    )
+    assert rebuilt == inline
+    assert len(linked) < len(inline) // 2
+
+
+def test_streamed_pages_match_joined_renders_in_bounded_chunks() -> None:
+    monday = datetime(2026, 5, 11, tzinfo=CENTRAL_TZ)
+    families = [f"Family {n:06d}" for n in range(5000)]
+    assignments = {"Sam": families}
+    schedule = {day: ["Sam"] for day in output.DAYS}
+    for stream, render in (
+        (output.iter_html_schedule, output.generate_html_schedule),
+        (output.iter_text_schedule, output.generate_text_schedule),
+    ):
+        chunks = list(stream(19, monday, assignments, schedule))
+        assert "".join(chunks) == render(19, monday, assignments, schedule)
+        # No chunk holds more than one batch of family lines.
+        assert max(chunk.count("Family ") for chunk in chunks) <= output.STREAM_BATCH
+
+
+def test_json_export_resolves_to_the_week_and_today() -> None:
+    week_num, monday, schedule, elder_assignments = _crafted_assignments()
+    document = json.loads(
+        output.generate_json_schedule(week_num, monday, elder_assignments, schedule)
+    )
+    assert document["version"] == output.SCHEDULE_JSON_VERSION
+    assert (document["week"], document["start"], document["end"]) == (19, "2026-05-11", "2026-05-17")
+    assert document["days"] == schedule
+    assert len(document["families"]) == len(set(document["families"]))
+    assert {
+        elder: [document["families"][i] for i in indexes]
+        for elder, indexes in document["elders"].items()
+    } == elder_assignments
+
+    day = json.loads(
+        output.generate_json_day(week_num, monday, "Tuesday", elder_assignments, schedule)
+    )
+    assert day == {
+        "version": output.SCHEDULE_JSON_VERSION,
+        "week": 19,
+        "date": "2026-05-12",
+        "day": "Tuesday",
+        "elders": [{"name": "Sam", "families": ["Smith, John"]}],
+    }
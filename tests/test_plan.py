@@ -0,0 +1,90 @@
+"""Schedule-plan tests: compile, hash-checked reload, and invalidation."""
+from __future__ import annotations
+
+import dataclasses
+import json
+
+import pytest
+
+from prayer_schedule import cli
+from prayer_schedule import plan as plan_module
+from prayer_schedule.algorithm import get_rotation_table
+from prayer_schedule.plan import (
+    SchedulePlan,
+    compile_plan,
+    load_plan,
+    plan_keys,
+    plan_path,
+)
+from prayer_schedule.tenant import TenantContext
+
+
+@pytest.fixture()
+def tenant(tmp_path) -> TenantContext:
+    return dataclasses.replace(TenantContext.from_config(), output_dir=str(tmp_path))
+
+
+def test_compiled_plan_round_trips(tenant: TenantContext) -> None:
+    plan = compile_plan(tenant)
+    assert plan is not None
+    loaded = load_plan(plan_path(tenant), plan_keys(tenant))
+    assert loaded is not None
+    assert loaded.table.positions == get_rotation_table().positions
+    assert loaded.table.encoded == get_rotation_table().encoded
+    assert loaded.reassignment_map == tenant.reassignment_map
+    assert loaded.pools == plan.pools
+
+
+def test_changed_inputs_invalidate_plan(tenant: TenantContext) -> None:
+    compile_plan(tenant)
+    edited_map = {pos: dict(m) for pos, m in tenant.reassignment_map.items()}
+    edited_map[1]["Larry McDuffee"] = "Jerry Wood"
+    for changed in (
+        dataclasses.replace(tenant, reassignment_map=edited_map),
+        dataclasses.replace(tenant, directory_csv=tenant.directory_csv + "Zed,Zoe\n"),
+        dataclasses.replace(tenant, elder_data=tenant.elder_data[::-1]),
+        dataclasses.replace(tenant, max_families=25),
+    ):
+        assert plan_keys(changed) != plan_keys(tenant)
+        assert load_plan(plan_path(tenant), plan_keys(changed)) is None
+
+
+def test_rotation_code_change_invalidates_plan(
+    tenant: TenantContext, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    compile_plan(tenant)
+    keys = plan_keys(tenant)
+    assert keys["rules"] == plan_module.source_hash(plan_module._RULE_MODULES) != "unknown"
+    monkeypatch.setattr(plan_module, "source_hash", lambda names: "edited")
+    assert load_plan(plan_path(tenant), plan_keys(tenant)) is None
+    # Unreadable source degrades to the format guard instead of failing.
+    monkeypatch.setattr(plan_module, "source_hash", lambda names: None)
+    assert plan_keys(tenant)["rules"] == "unknown"
+
+
+def test_tampered_or_missing_plan_is_rejected(tenant: TenantContext) -> None:
+    path = plan_path(tenant)
+    assert load_plan(path, plan_keys(tenant)) is None
+    compile_plan(tenant)
+    with open(path, encoding="utf-8") as handle:
+        payload = json.load(handle)
+    payload["positions"][0]["Brian McLaughlin"].pop()
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle)
+    assert load_plan(path, plan_keys(tenant)) is None
+    with pytest.raises(ValueError, match="checksum"):
+        SchedulePlan.from_dict(payload)
+
+
+def test_main_skips_full_verification_when_plan_matches(
+    tenant: TenantContext, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert cli.main(tenant)
+    first = capsys.readouterr().out
+    assert "VERIFYING V10 ALGORITHM" in first
+    assert "[OK] Compiled schedule plan" in first
+
+    assert cli.main(tenant)
+    second = capsys.readouterr().out
+    assert "VERIFYING V10 ALGORITHM" not in second
+    assert "Verified schedule plan matches current inputs" in second
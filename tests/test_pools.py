@@ -0,0 +1,105 @@
+"""Pool-builder tests: balance and ordering for arbitrary sizes."""
+from __future__ import annotations
+
+import pytest
+
+from prayer_schedule.algorithm import create_v10_master_pools
+from prayer_schedule.pools import build_pools, pool_size_bounds
+
+
+def _families(count: int) -> list[str]:
+    return [f"Family{i:06d}, Member" for i in range(count)]
+
+
+@pytest.mark.parametrize(
+    "family_count, pool_count",
+    [(161, 7), (160, 7), (5, 7), (0, 3), (1_000, 13), (100_003, 50)],
+)
+def test_build_pools_is_balanced_and_complete(family_count: int, pool_count: int) -> None:
+    families = _families(family_count)
+    pools = build_pools(reversed(families), pool_count)
+    assert len(pools) == pool_count
+    lo, hi = pool_size_bounds(family_count, pool_count)
+    sizes = [len(p) for p in pools]
+    assert min(sizes) == lo and max(sizes) == hi
+    # The first N % P pools carry the extra family.
+    assert sizes == sorted(sizes, reverse=True)
+    flat = [f for p in pools for f in p]
+    assert sorted(flat) == families
+    assert all(p == sorted(p) for p in pools)
+
+
+def test_build_pools_matches_round_robin_deal() -> None:
+    families = _families(50)
+    pools = build_pools(families, 7)
+    for i, family in enumerate(families):
+        assert family in pools[i % 7]
+
+
+def test_build_pools_rejects_non_positive_pool_count() -> None:
+    with pytest.raises(ValueError, match="pool_count"):
+        build_pools(_families(3), 0)
+
+
+def test_create_v10_master_pools_accepts_custom_directory() -> None:
+    pools = create_v10_master_pools(_families(20), pool_count=3)
+    assert [len(p) for p in pools] == [7, 7, 6]
+
+
+def test_pool_index_answers_membership(directory_families: list[str]) -> None:
+    from prayer_schedule.algorithm import get_master_pools, get_pool_index
+
+    pools = get_master_pools()
+    index = get_pool_index()
+    assert index is get_pool_index()
+    assert len(index.pool_of) == len(directory_families)
+    for pool_idx, pool in enumerate(pools):
+        assert index.members[pool_idx] == frozenset(pool)
+        for family in pool:
+            assert index.pool_for(family) == pool_idx
+            assert index.contains(pool_idx, family)
+            assert not index.contains((pool_idx + 1) % len(pools), family)
+    assert index.pool_for("Nobody, Here") is None
+    assert index.pool_for(None) is None
+
+
+def test_rebalance_pools_add_moves_nothing_else(directory_families: list[str]) -> None:
+    from prayer_schedule.pools import rebalance_pools
+
+    previous = build_pools(directory_families, 7)
+    pools, delta = rebalance_pools(previous, directory_families + ["Aaron, X"])
+    assert delta.added == {"Aaron, X": 0}
+    assert not delta.removed and not delta.moved
+    assert delta.affected_pools == {0}
+    for old, new in zip(previous, pools):
+        assert set(old) <= set(new)
+    # Rebuilding from scratch would have shifted most of the directory.
+    rebuilt = build_pools(directory_families + ["Aaron, X"], 7)
+    shifted = sum(1 for old, new in zip(previous, rebuilt) for f in old if f not in new)
+    assert shifted > 100
+
+
+def test_rebalance_pools_removal_moves_at_most_one(directory_families: list[str]) -> None:
+    from prayer_schedule.pools import rebalance_pools
+
+    previous = build_pools(directory_families, 7)
+    # Two removals from the same pool force exactly one compensating move.
+    gone = previous[2][:2]
+    remaining = [f for f in directory_families if f not in gone]
+    pools, delta = rebalance_pools(previous, remaining)
+    assert set(delta.removed) == set(gone)
+    assert len(delta.moved) == 1
+    (family, (source, target)), = delta.moved.items()
+    assert target == 2 and family in previous[source] and family in pools[2]
+    sizes = [len(p) for p in pools]
+    assert max(sizes) - min(sizes) <= 1
+    assert sorted(f for p in pools for f in p) == sorted(remaining)
+
+
+def test_rebalance_pools_unchanged_directory_is_empty_delta(directory_families: list[str]) -> None:
+    from prayer_schedule.pools import rebalance_pools
+
+    previous = build_pools(directory_families, 7)
+    pools, delta = rebalance_pools(previous, directory_families)
+    assert pools == previous
+    assert not delta
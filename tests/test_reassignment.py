@@ -0,0 +1,89 @@
+"""Reassignment-solver tests: live roster plus synthetic large rosters."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from prayer_schedule.algorithm import RotationTable, get_master_pools
+from prayer_schedule.elders import ELDER_FAMILIES, ELDERS
+from prayer_schedule.pools import build_pools
+from prayer_schedule.reassignment import find_conflicts, solve_reassignment_map
+
+
+def _assert_rotation_invariants(
+    table: RotationTable,
+    elder_families: dict[str, str],
+    all_families: set[str],
+    min_count: int,
+    max_count: int,
+) -> None:
+    positions = table.positions
+    for pos, assignments in enumerate(positions):
+        flat = [fam for fams in assignments.values() for fam in fams]
+        assert len(flat) == len(set(flat)), f"duplicate at position {pos}"
+        assert set(flat) == all_families, f"coverage gap at position {pos}"
+        for elder, fams in assignments.items():
+            assert min_count <= len(fams) <= max_count, (pos, elder, len(fams))
+            assert elder_families[elder] not in fams, (pos, elder)
+            nxt = positions[(pos + 1) % len(positions)][elder]
+            assert not set(fams) & set(nxt), (pos, elder)
+
+
+def _synthetic_roster(
+    elder_count: int, family_count: int, seed: int
+) -> tuple[list[list[str]], list[str], dict[str, str]]:
+    rng = random.Random(seed)
+    families = sorted(f"Family{i:06d}, Member" for i in range(family_count))
+    pools = build_pools(families, elder_count)
+    elders = [f"Elder {i:02d}" for i in range(elder_count)]
+    own = rng.sample(families, elder_count)
+    return pools, elders, dict(zip(elders, own))
+
+
+def test_find_conflicts_matches_live_map_keys() -> None:
+    from prayer_schedule.algorithm import FIXED_REASSIGNMENT_MAP
+
+    conflicts = find_conflicts(get_master_pools(), ELDERS, ELDER_FAMILIES)
+    assert {pos: set(elders) for pos, elders in conflicts.items()} == {
+        pos: set(mapping) for pos, mapping in FIXED_REASSIGNMENT_MAP.items()
+    }
+
+
+def test_solved_map_satisfies_invariants_for_live_roster(
+    directory_families: list[str],
+) -> None:
+    solved = solve_reassignment_map()
+    table = RotationTable.build(reassignment_map=solved)
+    _assert_rotation_invariants(table, ELDER_FAMILIES, set(directory_families), 22, 24)
+
+
+@pytest.mark.parametrize("elder_count, family_count", [(12, 300), (20, 2_000), (50, 5_001)])
+def test_solved_map_scales_to_large_rosters(elder_count: int, family_count: int) -> None:
+    pools, elders, elder_families = _synthetic_roster(elder_count, family_count, seed=elder_count)
+    lo = family_count // elder_count - 1
+    hi = -(-family_count // elder_count) + 1
+    solved = solve_reassignment_map(pools, elders, elder_families, lo, hi)
+    table = RotationTable.build(pools, elders, elder_families, solved)
+    _assert_rotation_invariants(table, elder_families, {f for p in pools for f in p}, lo, hi)
+
+
+def test_solver_reports_infeasible_window() -> None:
+    pools, elders, elder_families = _synthetic_roster(7, 161, seed=1)
+    # No elder may receive an extra family: every conflict is unplaceable.
+    with pytest.raises(ValueError, match="Cycle position"):
+        solve_reassignment_map(pools, elders, elder_families, 22, 23)
+
+
+def test_solver_handles_elders_sharing_a_household() -> None:
+    # Found by fuzz_rotation.py: two elders of one household must never be
+    # handed that family, nor receive it in consecutive weeks.
+    pools, elders, elder_families = _synthetic_roster(7, 161, seed=3)
+    all_families = {f for p in pools for f in p}
+    for first, second in [(0, 2), (1, 6), (4, 5)]:
+        for pool in pools:
+            shared = dict(elder_families)
+            shared[elders[first]] = shared[elders[second]] = pool[0]
+            solved = solve_reassignment_map(pools, elders, shared, 21, 25)
+            table = RotationTable.build(pools, elders, shared, solved)
+            _assert_rotation_invariants(table, shared, all_families, 21, 25)
@@ -0,0 +1,108 @@
+"""Render-cache tests: hits match fresh renders, keys, LRU eviction."""
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+from prayer_schedule import file_io, output, render_cache
+from prayer_schedule.config import CENTRAL_TZ
+from prayer_schedule.elders import get_week_schedule
+from prayer_schedule.render_cache import RenderCache, cached_schedule_content
+from prayer_schedule.tenant import TenantContext
+
+MONDAY = datetime(2026, 5, 11, tzinfo=CENTRAL_TZ)
+
+
+def _week(tenant: TenantContext):
+    return tenant.build_rotation_table().for_week(20), get_week_schedule(20, tenant.elder_data)
+
+
+def _render(cache: RenderCache, assignments, schedule) -> tuple[str, str]:
+    return cached_schedule_content(cache, 20, 20, MONDAY, assignments, schedule)
+
+
+def test_cache_hit_matches_fresh_render(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    tenant = replace(TenantContext.from_config(), inline_assets=True)
+    assignments, schedule = _week(tenant)
+    cache = RenderCache.for_tenant(tenant, str(tmp_path))
+
+    first = _render(cache, assignments, schedule)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert first == output.generate_schedule_content(20, MONDAY, assignments, schedule)
+
+    # A later run that week renders nothing but still gets a fresh stamp.
+    monkeypatch.setattr(render_cache, "updated_stamp", lambda: "later")
+    monkeypatch.setattr(render_cache, "generate_html_schedule", None)
+    fresh = RenderCache.for_tenant(tenant, str(tmp_path))
+    html, text = _render(fresh, assignments, schedule)
+    assert (fresh.hits, fresh.misses) == (1, 0)
+    assert text == first[1]
+    assert "Last updated: later\n" in html
+
+
+def test_key_covers_roster_directory_and_asset_mode(tmp_path) -> None:
+    tenant = TenantContext.from_config()
+    base = RenderCache.for_tenant(tenant, str(tmp_path)).key("schedule", 20)
+    records = [dict(record) for record in tenant.elder_data]
+    records[0]["days"] = ["Tuesday"]
+    variants = [
+        replace(tenant, elder_data=tuple(records)),
+        replace(tenant, directory_csv=tenant.directory_csv + "\n"),
+        replace(tenant, inline_assets=not tenant.inline_assets),
+    ]
+    keys = [RenderCache.for_tenant(v, str(tmp_path)).key("schedule", 20) for v in variants]
+    assert all(key != base for key in keys)
+    assert len({tuple(sorted(key.items())) for key in keys}) == 3
+
+
+def test_corrupt_or_foreign_entry_is_a_miss(tmp_path) -> None:
+    cache = RenderCache(str(tmp_path / "cache"), {"roster": "r", "directory": "d"})
+    key = cache.key("email", 20, "Monday")
+    cache.put(key, {"html": "<p>"})
+    assert cache.get(key) == {"html": "<p>"}
+    with open(cache._path(key), "w", encoding="utf-8") as handle:
+        handle.write("{not json")
+    assert cache.get(key) is None
+    assert cache.fetch("email", 20, "Monday", lambda: {"html": "again"}) == {"html": "again"}
+    other = RenderCache(str(tmp_path / "cache"), {"roster": "x", "directory": "d"})
+    assert other.get(other.key("email", 20, "Monday")) is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path) -> None:
+    cache = RenderCache(str(tmp_path / "cache"), {}, max_entries=3)
+    keys = [cache.key("email", week, "Monday") for week in range(4)]
+    for age, key in enumerate(keys[:3]):
+        cache.put(key, {"html": str(age)})
+        os.utime(cache._path(key), ns=(age * 10**9, age * 10**9))
+    cache.get(keys[0])  # touch the oldest
+    cache.put(keys[3], {"html": "3"})
+    assert cache.get(keys[1]) is None
+    assert [cache.get(key) is not None for key in (keys[0], keys[2], keys[3])] == [True] * 3
+    assert len(os.listdir(tmp_path / "cache")) == 3
+
+
+def test_unreadable_renderer_source_disables_the_cache(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(render_cache, "template_version", lambda: None)
+    cache = RenderCache(str(tmp_path / "cache"), {})
+    assert cache.fetch("email", 20, "Monday", lambda: {"html": "a"}) == {"html": "a"}
+    assert cache.fetch("email", 20, "Monday", lambda: {"html": "b"}) == {"html": "b"}
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert not os.path.exists(tmp_path / "cache")
+
+
+def test_unchanged_schedule_files_are_not_rewritten(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert file_io.update_desktop_files("<html>", "text", str(tmp_path))
+    writes: list[str] = []
+    real_write = file_io._atomic_write
+    monkeypatch.setattr(
+        file_io,
+        "_atomic_write",
+        lambda path, content, **kwargs: (writes.append(path), real_write(path, content, **kwargs)),
+    )
+    assert file_io.update_desktop_files("<html> later", "text", str(tmp_path))
+    assert [os.path.basename(path) for path in writes] == [file_io._CURRENT_HTML_NAME]
@@ -0,0 +1,99 @@
+"""Tenant-context and batch-runner tests: synthetic congregations end to end."""
+from __future__ import annotations
+
+import dataclasses
+import os
+import pickle
+
+import pytest
+
+from prayer_schedule.algorithm import FIXED_REASSIGNMENT_MAP, get_rotation_table
+from prayer_schedule.batch import run_batch, run_tenant
+from prayer_schedule.config import DAYS_OF_WEEK, DIRECTORY_FAMILY_COUNT
+from prayer_schedule.tenant import TenantContext
+
+
+def _synthetic_tenant(name: str, family_count: int, output_dir: str) -> TenantContext:
+    rows = [f"Member{i:04d},Family" for i in range(family_count)]
+    elder_data = tuple(
+        {"name": f"Elder {day}", "family": f"Member{idx * 3:04d}, Family", "days": [day]}
+        for idx, day in enumerate(DAYS_OF_WEEK)
+    )
+    return TenantContext(
+        name=name,
+        elder_data=elder_data,
+        directory_csv="Last Name,First Names\n" + "\n".join(rows) + "\n",
+        output_dir=output_dir,
+    )
+
+
+def test_from_config_matches_live_rotation() -> None:
+    tenant = TenantContext.from_config()
+    assert tenant.reassignment_map == FIXED_REASSIGNMENT_MAP
+    assert len(tenant.families()) == DIRECTORY_FAMILY_COUNT
+    assert tenant.family_bounds() == (22, 24)
+    assert tenant.build_rotation_table().positions == get_rotation_table().positions
+
+
+def test_synthetic_tenant_solves_map_and_pickles(tmp_path) -> None:
+    tenant = _synthetic_tenant("Synthetic", 90, str(tmp_path))
+    assert pickle.loads(pickle.dumps(tenant)) == tenant
+    table = tenant.build_rotation_table()
+    lo, hi = tenant.family_bounds()
+    for assignments in table.positions:
+        assert sorted(f for fams in assignments.values() for f in fams) == tenant.families()
+        assert all(lo <= len(fams) <= hi for fams in assignments.values())
+
+
+def test_run_tenant_writes_to_tenant_output_dir(tmp_path) -> None:
+    result = run_tenant(_synthetic_tenant("Synthetic", 90, str(tmp_path)))
+    assert result.ok, result.output
+    assert "Synthetic - Prayer Schedule Generator" in result.output
+    assert os.path.exists(tmp_path / "Prayer_Schedule_Current_Week.html")
+    text = (tmp_path / "Prayer_Schedule_Current_Week.txt").read_text(encoding="utf-8")
+    assert "Elder Monday" in text
+    assert os.path.exists(tmp_path / "prayer_schedule_log.txt")
+
+
+def test_run_batch_reports_every_tenant(tmp_path) -> None:
+    tenants = []
+    for i, family_count in enumerate((50, 90, 161)):
+        out = tmp_path / f"t{i}"
+        out.mkdir()
+        tenants.append(_synthetic_tenant(f"Church {i}", family_count, str(out)))
+    # A missing output directory must fail that tenant only.
+    tenants.append(_synthetic_tenant("Broken", 90, str(tmp_path / "missing")))
+
+    report = run_batch(tenants, max_workers=2)
+
+    assert [r.name for r in report.results] == ["Church 0", "Church 1", "Church 2", "Broken"]
+    assert report.succeeded == 3
+    assert report.failed == ["Broken"]
+    assert report.throughput > 0
+    assert "3/4 tenants succeeded" in report.summary()
+
+
+def test_run_batch_rejects_shared_or_missing_output_dirs(tmp_path) -> None:
+    first = _synthetic_tenant("First", 90, str(tmp_path))
+    with pytest.raises(ValueError, match="share output_dir"):
+        run_batch([first, _synthetic_tenant("Second", 90, str(tmp_path))])
+    with pytest.raises(ValueError, match="need an output_dir: Desktop"):
+        run_batch([first, dataclasses.replace(first, name="Desktop", output_dir=None)])
+
+
+def test_pages_carry_each_tenants_own_name(tmp_path) -> None:
+    names = {"Oak Street Church": tmp_path / "oak", "River & Vine": tmp_path / "river"}
+    tenants = []
+    for name, out in names.items():
+        out.mkdir()
+        tenants.append(_synthetic_tenant(name, 90, str(out)))
+    assert all(result.ok for result in run_batch(tenants, max_workers=1).results)
+    for name, out in names.items():
+        html = (out / "Prayer_Schedule_Current_Week.html").read_text(encoding="utf-8")
+        text = (out / "Prayer_Schedule_Current_Week.txt").read_text(encoding="utf-8")
+        other = next(n for n in names if n != name)
+        assert f"<h1>{name.replace('&', '&amp;')}</h1>" in html
+        assert name.upper() in text and f"-- {name} Elder Ministry --" in text
+        for content in (html, text):
+            assert "Crossville" not in content
+            assert other.split()[0] not in content
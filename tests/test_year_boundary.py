@@ -6,15 +6,22 @@ This test locks in the fix so a future refactor can't re-introduce the bug.
 """
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 
 from prayer_schedule.algorithm import (
+    RotationTable,
     assign_families_for_week_v10,
     calculate_continuous_week,
+    calculate_week_arrays,
+    get_rotation_table,
+    iter_schedule,
 )
 from prayer_schedule.config import CENTRAL_TZ, POOL_COUNT, REFERENCE_MONDAY
+from prayer_schedule import sweep
+from prayer_schedule.sweep import next_monday, sweep_calendar
+from prayer_schedule.utils import week_monday
 
 
 YEAR_BOUNDARIES = [
@@ -99,3 +106,114 @@ def test_calculate_continuous_week_rejects_pre_reference_date() -> None:
 def test_calculate_continuous_week_at_reference_monday_is_week_one() -> None:
     """REFERENCE_MONDAY itself is legal and equals week 1."""
     assert calculate_continuous_week(REFERENCE_MONDAY) == 1
+
+
+def test_iter_schedule_spans_year_boundaries_lazily() -> None:
+    """A 3-year horizon yields consecutive Mondays and continuous weeks, and
+    weeks at the same cycle position share one assignments mapping."""
+    start = datetime(2026, 11, 30, tzinfo=CENTRAL_TZ)
+    weeks = list(iter_schedule(start, 3 * 53))
+    assert len(weeks) == 3 * 53
+    first_cw = calculate_continuous_week(start)
+    table = get_rotation_table()
+    for offset, (monday, cw, assignments) in enumerate(weeks):
+        assert monday.weekday() == 0
+        assert (monday.hour, monday.minute) == (0, 0), "DST shifted the Monday"
+        assert cw == first_cw + offset == calculate_continuous_week(monday)
+        assert assignments is table.for_week(cw)
+
+
+def test_iter_schedule_rejects_non_monday_and_pre_reference() -> None:
+    with pytest.raises(ValueError, match="not a Monday"):
+        next(iter_schedule(datetime(2026, 1, 6, tzinfo=CENTRAL_TZ), 1))
+    with pytest.raises(ValueError, match="predates REFERENCE_MONDAY"):
+        next(iter_schedule(datetime(2025, 12, 22, tzinfo=CENTRAL_TZ), 1))
+
+
+def test_week_monday_is_stable_across_dst_changes() -> None:
+    # 2026-03-08 and 2026-11-01 are the Sunday DST changes in Central Time.
+    dst_weeks = (datetime(2026, 3, 2, tzinfo=CENTRAL_TZ), datetime(2026, 10, 26, tzinfo=CENTRAL_TZ))
+    for monday in dst_weeks:
+        start = monday.astimezone(timezone.utc)
+        end = (monday + timedelta(weeks=1)).astimezone(timezone.utc)
+        assert (end - start) != timedelta(weeks=1)
+        instant = start
+        while instant < end:
+            assert week_monday(instant.astimezone(CENTRAL_TZ)) == monday
+            instant += timedelta(minutes=30)
+
+
+def test_calendar_sweep_passes_through_2126() -> None:
+    report = sweep_calendar(max_workers=0)
+    assert report.ok, report.issues[:5]
+    assert report.first_monday == REFERENCE_MONDAY
+    assert report.last_monday == datetime(2126, 12, 30, tzinfo=CENTRAL_TZ)
+    assert report.weeks == calculate_continuous_week(report.last_monday)
+
+
+def test_calendar_sweep_reports_repeats_once_per_chunk() -> None:
+    table = get_rotation_table()
+    positions = [
+        {elder: list(families) for elder, families in assignments.items()}
+        for assignments in table.positions
+    ]
+    elder = table.elders[0]
+    positions[3][elder].append(positions[2][elder][0])
+    broken = RotationTable.from_positions(table.elders, positions, table.registry)
+
+    report = sweep_calendar(2028, table=broken, max_workers=0, chunk_weeks=60)
+    repeats = [issue for issue in report.issues if "repeats into the next week" in issue]
+    assert repeats and len(repeats) == -(-report.weeks // 60)
+    assert repeats[0].startswith("Week 3->4 (2026-01-19): ")
+
+
+def test_next_monday_steps_across_dst_changes() -> None:
+    monday = REFERENCE_MONDAY
+    while monday.year < 2030:
+        following = next_monday(monday)
+        assert following.weekday() == 0 and following.hour == 0
+        assert following.date() - monday.date() == timedelta(days=7)
+        monday = following
+
+
+def test_calendar_sweep_catches_a_skipped_week(monkeypatch: pytest.MonkeyPatch) -> None:
+    # A regression that skips a week at the 2027 ISO year reset.
+    def skipping(monday: datetime) -> int:
+        week = calculate_continuous_week(monday)
+        return week + 1 if monday >= datetime(2027, 1, 4, tzinfo=CENTRAL_TZ) else week
+
+    monkeypatch.setattr(sweep, "calculate_continuous_week", skipping)
+    report = sweep_calendar(2027, max_workers=0)
+    assert any(
+        "(2027-01-04)" in issue and "(discontinuity)" in issue for issue in report.issues
+    ), report.issues[:5]
+
+
+def test_calculate_week_arrays_matches_per_date_functions() -> None:
+    dates = [
+        REFERENCE_MONDAY + timedelta(days=offset, hours=offset % 24) for offset in range(3 * 371)
+    ]
+    weeks = calculate_week_arrays(dates)
+    for moment, cw, pos, iso_year, iso_week in zip(dates, *weeks):
+        assert cw == calculate_continuous_week(moment)
+        assert pos == get_rotation_table().cycle_position(cw)
+        assert (iso_year, iso_week) == tuple(moment.isocalendar())[:2]
+
+
+def test_calculate_week_arrays_rejects_pre_reference_date() -> None:
+    dates = [date(2026, 1, 5), date(2025, 12, 28)]
+    with pytest.raises(ValueError, match="2025-12-28 predates REFERENCE_MONDAY"):
+        calculate_week_arrays(dates)
+
+
+def test_calculate_week_arrays_accepts_datetime64() -> None:
+    np = pytest.importorskip("numpy")
+    days = np.arange("2025-12-29", "2036-01-01", dtype="datetime64[D]")
+    vectorized = calculate_week_arrays(days)
+    expected = calculate_week_arrays(days.tolist())
+    for got, want in zip(vectorized, expected):
+        assert got.tolist() == want.tolist()
+    with pytest.raises(ValueError, match="predates REFERENCE_MONDAY"):
+        calculate_week_arrays(
+            np.array(["2026-01-05T12:00", "2025-12-28T23:59"], dtype="datetime64[m]")
+        )